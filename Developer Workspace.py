@@ -4,17 +4,60 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, 
     QLabel, QTabWidget, QHBoxLayout, QPushButton,
     QTreeWidget, QTreeWidgetItem, QSplitter, QTextEdit,
-    QFileDialog, QMessageBox, QTreeView, QListView, QAbstractItemView, QStyle
+    QFileDialog, QMessageBox, QTreeView, QListView, QAbstractItemView, QStyle,
+    QStackedWidget, QDockWidget, QPlainTextEdit, QMenu, QInputDialog, QDialog, QDialogButtonBox,
+    QFormLayout, QLineEdit, QSpinBox, QListWidget, QListWidgetItem, QComboBox
+)
+from PyQt6.QtCore import (
+    Qt, QPointF, QObject, QRunnable, QThreadPool, QTimer, QProcess, QProcessEnvironment, QSettings,
+    QFileSystemWatcher, pyqtSignal
+)
+from PyQt6.QtGui import (
+    QColor, QBrush, QDragEnterEvent, QDropEvent, QIcon, QPainter, QPen, QTextCharFormat, QTextCursor
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QBrush, QDragEnterEvent, QDropEvent, QIcon
 import shutil
-import subprocess
 import time
 import threading
+import ast
+import codecs
+import concurrent.futures
 import ctypes
-import win32gui
-import win32con
+import hashlib
+import html
+import json
+import pathlib
+import shlex
+import tempfile
+import webbrowser
+from collections import deque
+try:
+    import win32gui
+    import win32con
+except ImportError:  # Not on Windows
+    win32gui = win32con = None
+
+from devspace_core import (
+    TRACER, WARM_PRELOAD_MODULES, CoreSpawnContext, EntryPointResolver, EnvironmentManager, ExtensionPackager,
+    LiveReloadServer, OutputRingBuffer, ProcessHandle, RunHistory, RunLimits, RunLogStore, TestHistory,
+    WindowsJob, build_launch_command, bytecode_stale, check_python_source, compile_python_files,
+    configure_logging, default_workspace_dir, discover_tests, format_size, get_logger, iter_project_files,
+    kill_process_group, limited_command, move_into_workspace, parse_test_result, process_group, process_usage,
+    project_snapshot, project_types, python_interpreter, read_usage, script_imports, signal_process_group,
+    snapshot_changes, summarize_folder, test_file_of, test_worker_command, trace_path, traced,
+    validate_extension_manifest, warm_worker_command, workspace_dirs
+)
+
+# Diagnostics by subsystem, quiet below warnings unless DEVSPACE_LOG asks for more
+workspace_log = get_logger('workspace')
+tabs_log = get_logger('tabs')
+preview_log = get_logger('preview')
+files_log = get_logger('files')
+journal_log = get_logger('journal')
+run_log = get_logger('run')
+watch_log = get_logger('watch')
+checks_log = get_logger('checks')
+tests_log = get_logger('tests')
+packaging_log = get_logger('packaging')
 
 def hide_console():
     """Hide the console window"""
@@ -26,10 +69,1359 @@ def hide_console():
     except:
         pass
 
+# Keywords that continue the previous top-level statement
+OUTLINE_CONTINUATIONS = ('else', 'elif', 'except', 'finally', 'case')
+
+class OutlineBuilder:
+    """Build a Python outline by parsing top-level blocks independently.
+    
+    Each block's outline is cached by its text, so re-parsing after an edit
+    only parses the blocks that changed. If any block does not parse on its
+    own the whole source is parsed instead.
+    """
+    MAX_CACHED_BLOCKS = 5000
+
+    def __init__(self):
+        self.block_cache = {}
+
+    def build(self, source):
+        """Return a list of (kind, name, lineno, depth) entries"""
+        outline = []
+        for start_line, block in self.split_blocks(source):
+            key = hashlib.sha1(block.encode('utf-8')).digest()
+            entries = self.block_cache.get(key)
+            if entries is None:
+                try:
+                    entries = self.outline_tree(ast.parse(block))
+                except SyntaxError:
+                    # Block boundaries guessed wrong (or real error), parse everything
+                    return self.outline_tree(ast.parse(source))
+                if len(self.block_cache) >= self.MAX_CACHED_BLOCKS:
+                    self.block_cache.clear()
+                self.block_cache[key] = entries
+            outline.extend((kind, name, lineno + start_line, depth) for kind, name, lineno, depth in entries)
+        return outline
+
+    @staticmethod
+    def split_blocks(source):
+        """Split source into (line offset, text) chunks at top-level statements"""
+        lines = source.splitlines(keepends=True)
+        blocks = []
+        start = 0
+        decorated = False
+        for i, line in enumerate(lines):
+            starts_statement = (
+                line[:1] and not line[0].isspace() and line[0] not in '#)]}' and
+                not line.startswith(OUTLINE_CONTINUATIONS)
+            )
+            if not starts_statement:
+                continue
+            if i > start and not decorated and not lines[i - 1].rstrip().endswith('\\'):
+                blocks.append((start, ''.join(lines[start:i])))
+                start = i
+            decorated = line.startswith('@')
+        if start < len(lines):
+            blocks.append((start, ''.join(lines[start:])))
+        return blocks
+
+    @staticmethod
+    def outline_tree(tree):
+        """Collect classes and functions from a parsed module"""
+        entries = []
+        
+        def visit(body, depth, in_class):
+            for node in body:
+                if isinstance(node, ast.ClassDef):
+                    entries.append(('class', node.name, node.lineno, depth))
+                    visit(node.body, depth + 1, True)
+                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    entries.append(('method' if in_class else 'function', node.name, node.lineno, depth))
+                    visit(node.body, depth + 1, False)
+        
+        visit(tree.body, 0, False)
+        return entries
+
+class OutlineSignals(QObject):
+    """Signals used to hand outlines back to the GUI thread"""
+    # tab_type, generation, outline entries (None on failure), error message
+    ready = pyqtSignal(str, int, object, str)
+
+class OutlineTask(QRunnable):
+    """Build a file outline on a worker thread.
+    
+    With file_path set the outline is cached by the file's mtime and size;
+    edited buffers pass the text only and rely on the builder's block cache.
+    """
+
+    def __init__(self, signals, builder, file_cache, tab_type, generation, source, file_path=None):
+        super().__init__()
+        self.signals = signals
+        self.builder = builder
+        self.file_cache = file_cache
+        self.tab_type = tab_type
+        self.generation = generation
+        self.source = source
+        self.file_path = file_path
+
+    def run(self):
+        try:
+            stamp = None
+            if self.file_path:
+                stat = os.stat(self.file_path)
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                cached = self.file_cache.get(self.file_path)
+                if cached and cached[0] == stamp:
+                    self.signals.ready.emit(self.tab_type, self.generation, cached[1], '')
+                    return
+            
+            outline = self.builder.build(self.source)
+            if stamp is not None:
+                self.file_cache[self.file_path] = (stamp, outline)
+            self.signals.ready.emit(self.tab_type, self.generation, outline, '')
+        except SyntaxError as e:
+            self.signals.ready.emit(self.tab_type, self.generation, None, f"syntax error line {e.lineno}")
+        except Exception as e:
+            self.signals.ready.emit(self.tab_type, self.generation, None, str(e))
+
+class StaticCheckSignals(QObject):
+    """Signals used to hand static check results back to the GUI thread"""
+    # tab_type, {project path: [(relative path, lineno, code, message), ...]}
+    finished = pyqtSignal(str, object)
+
+class StaticCheckPass(QRunnable):
+    """Check the Python files of a set of projects, re-checking only changed files.
+    
+    Files whose (mtime, size) match the previous pass reuse their content
+    hash without being read; results are cached by content hash, so only
+    new content is sent to the process pool.
+    """
+
+    def __init__(self, signals, executor, file_hashes, result_cache, tab_type, projects):
+        super().__init__()
+        self.signals = signals
+        self.executor = executor
+        self.file_hashes = file_hashes
+        self.result_cache = result_cache
+        self.tab_type = tab_type
+        self.projects = projects
+
+    def run(self):
+        try:
+            project_files = {}
+            pending = {}
+            for project_path in self.projects:
+                files = []
+                for file_path in iter_project_files(project_path, ('.py', '.pyw')):
+                    digest = self.file_digest(file_path)
+                    if digest is None:
+                        continue
+                    files.append((file_path, digest))
+                    if digest not in self.result_cache and digest not in pending:
+                        with open(file_path, 'rb') as f:
+                            pending[digest] = self.executor.submit(check_python_source, f.read(), file_path)
+                project_files[project_path] = files
+            
+            for digest, future in pending.items():
+                try:
+                    self.result_cache[digest] = future.result()
+                except Exception as e:
+                    self.result_cache[digest] = [(1, 'E902', f"Check failed: {e}")]
+            
+            results = {}
+            for project_path, files in project_files.items():
+                base = project_path if os.path.isdir(project_path) else os.path.dirname(project_path)
+                results[project_path] = [
+                    (os.path.relpath(file_path, base), lineno, code, message)
+                    for file_path, digest in files
+                    for lineno, code, message in self.result_cache.get(digest, [])
+                ]
+            self.signals.finished.emit(self.tab_type, results)
+        except Exception as e:
+            checks_log.error("Error running static checks: %s", e)
+
+    def file_digest(self, file_path):
+        """Return the content hash of a file, reusing it while mtime and size are unchanged"""
+        try:
+            stat = os.stat(file_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = self.file_hashes.get(file_path)
+            if cached and cached[0] == stamp:
+                return cached[1]
+            with open(file_path, 'rb') as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+            self.file_hashes[file_path] = (stamp, digest)
+            return digest
+        except OSError:
+            return None
+
+class PrecompilePass(QRunnable):
+    """Byte-compile the Python files of some projects in a process pool.
+    
+    Only files whose cached bytecode is missing or older than the source
+    are compiled, so running it again after edits is cheap.
+    """
+    BATCH_SIZE = 16
+
+    def __init__(self, executor, projects):
+        super().__init__()
+        self.executor = executor
+        self.projects = projects
+
+    def run(self):
+        try:
+            started = time.perf_counter()
+            files = [
+                file_path for project_path in self.projects
+                for file_path in iter_project_files(project_path, ('.py',))
+            ]
+            stale = [file_path for file_path in files if bytecode_stale(file_path)]
+            if not stale:
+                return
+            
+            futures = [
+                self.executor.submit(compile_python_files, stale[i:i + self.BATCH_SIZE])
+                for i in range(0, len(stale), self.BATCH_SIZE)
+            ]
+            failed = 0
+            for future in futures:
+                for file_path, error in future.result():
+                    if error:
+                        failed += 1
+                        checks_log.warning("Could not precompile %s: %s", file_path, error)
+            checks_log.info("Precompiled %d file(s) in %.2fs (%d up to date, %d failed)",
+                           len(stale) - failed, time.perf_counter() - started, len(files) - len(stale), failed)
+        except Exception as e:
+            checks_log.error("Error precompiling bytecode: %s", e)
+
+class RunRecord:
+    """State of one project run launched through the supervisor"""
+
+    def __init__(self, run_id, tab_type, name, argv, cwd, env=None, prepare=None, script=None, warm=False,
+                 limits=None):
+        self.run_id = run_id
+        self.tab_type = tab_type
+        self.name = name
+        self.argv = argv
+        self.cwd = cwd
+        self.env = env
+        self.prepare = prepare or []
+        self.prepared = not self.prepare
+        self.script = script  # Set for plain Python script runs
+        self.warm = warm  # Fast run requested
+        self.started_warm = False
+        self.limits = limits or {}  # timeout, memory_mb and cpu_seconds; 0 or missing for none
+        self.timed_out = False
+        self.job = None  # Windows job object of the running command
+        self.handle = None  # Windows ProcessHandle of the running command
+        self.usage_path = None  # File the running command's usage is reported to, on POSIX
+        self.usage_pid = None  # Pid sampled for the running command, once known
+        self.state = 'starting'
+        self.pid = None
+        self.pgid = None  # Process group of the running command, kept after its leader is reaped
+        self.start_time = None
+        self.end_time = None
+        self.exit_code = None
+        self.output = OutputRingBuffer()
+        self.cpu_time = None
+        self.cpu_done = 0.0  # CPU seconds of the run's commands that already exited
+        self.peak_rss = None
+        self.history = None  # Entry written to the run history once it ended
+        self.log = None  # Id of the run's persistent log
+
+    @property
+    def active(self):
+        return self.state in ('starting', 'preparing', 'running', 'stopping')
+
+    @property
+    def duration(self):
+        if self.start_time is None:
+            return 0.0
+        return (self.end_time or time.time()) - self.start_time
+
+class WarmWorkerPool(QObject):
+    """Keep a few Python processes started with common modules imported.
+    
+    Each worker runs exactly one script and exits; taking a worker starts
+    a replacement. Top-level imports of scripts run through the pool are
+    learned and preloaded by workers started afterwards.
+    """
+    MAX_LEARNED_MODULES = 20
+
+    def __init__(self, interpreter, size=2, parent=None):
+        super().__init__(parent)
+        self.interpreter = interpreter
+        self.size = size
+        self.idle = []
+        self.learned = []
+
+    def fill(self):
+        """Start workers until the pool is full"""
+        while len(self.idle) < self.size:
+            process = QProcess(self)
+            process.setProgram(self.interpreter)
+            process.setArguments(warm_worker_command(self.interpreter, WARM_PRELOAD_MODULES + self.learned)[1:])
+            process.setProcessEnvironment(process_environment())
+            configure_process(process)
+            process.finished.connect(lambda *args, process=process: self.discard(process))
+            process.start()
+            self.idle.append(process)
+
+    def discard(self, process):
+        """Forget an idle worker that exited before it was used"""
+        if process in self.idle:
+            self.idle.remove(process)
+            process.deleteLater()
+
+    def take(self, script_path):
+        """Return a running idle worker for a script, or None"""
+        for module in script_imports(script_path):
+            if module in sys.builtin_module_names or module in WARM_PRELOAD_MODULES:
+                continue
+            if module not in self.learned:
+                if len(self.learned) < self.MAX_LEARNED_MODULES:
+                    self.learned.append(module)
+        
+        worker = None
+        while self.idle and worker is None:
+            process = self.idle.pop(0)
+            process.finished.disconnect()
+            if process.state() == QProcess.ProcessState.Running:
+                worker = process
+            else:
+                process.deleteLater()
+        QTimer.singleShot(0, self.fill)
+        return worker
+
+    def shutdown(self):
+        for process in self.idle:
+            process.finished.disconnect()
+            process.kill()
+            process.waitForFinished(1000)
+        self.idle = []
+
+def process_environment(env=None):
+    """Return the QProcess environment for a run"""
+    if env is not None:
+        environment = QProcessEnvironment()
+        for key, value in env.items():
+            environment.insert(key, value)
+    else:
+        environment = QProcessEnvironment.systemEnvironment()
+    # Python output is decoded as UTF-8
+    if not environment.contains('PYTHONIOENCODING'):
+        environment.insert('PYTHONIOENCODING', 'utf-8')
+    return environment
+
+def configure_process(process):
+    """Start a process in its own session on POSIX so its whole tree can be signalled"""
+    if os.name != 'nt' and hasattr(process, 'setUnixProcessParameters'):
+        process.setUnixProcessParameters(QProcess.UnixProcessFlag.CreateNewSession)
+
+class ProcessSupervisor(QObject):
+    """Launch project runs with QProcess and track their state until they exit.
+    
+    A run may have prepare commands (e.g. building its environment) that are
+    executed in order first; each must succeed before the next one, and the
+    main command starts after the last. Output of all of them is read as it
+    arrives into the run's ring buffer, and into its persistent log when a
+    log store is set.
+    
+    Script runs flagged warm are handed to a worker from the warm pool when
+    one is enabled and matches the interpreter; wall times of script runs
+    are kept per mode ('warm' or 'cold') for comparison.
+    
+    CPU time and peak RSS of running commands are sampled periodically for
+    display, and read exactly when a command exits: on POSIX the launch
+    wrapper waits for the command and reports its rusage (warm workers
+    report their script's own), on Windows a handle held since the start
+    still has the counters. A run's CPU time adds up its commands' usage
+    and its peak RSS is the largest.
+    
+    Each command runs in its own process group (a job object on Windows),
+    so stopping a run stops everything it started. A run's memory and CPU
+    limits apply to its main command and its timeout starts with it.
+    """
+    # run_id
+    run_changed = pyqtSignal(int)
+    # run_id, emitted when a run's buffer gets output after the UI took it all
+    output_ready = pyqtSignal(int)
+    
+    # Grace period between asking a run to stop and killing it
+    STOP_TIMEOUT_MS = 3000
+    SAMPLE_INTERVAL_MS = 250
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.runs = {}
+        self.processes = {}
+        self.next_run_id = 1
+        self.warm_pool = None
+        self.log_store = None  # RunLogStore keeping every run's output, if set
+        self.timings = {'warm': [], 'cold': []}
+        self.sample_timer = QTimer(self)
+        self.sample_timer.setInterval(self.SAMPLE_INTERVAL_MS)
+        self.sample_timer.timeout.connect(self.sample_usage)
+
+    def launch(self, tab_type, name, argv, cwd, env=None, prepare=None, script=None, warm=False, limits=None):
+        """Start a new run and return its record"""
+        record = RunRecord(self.next_run_id, tab_type, name, argv, cwd, env, prepare, script, warm, limits)
+        self.next_run_id += 1
+        self.runs[record.run_id] = record
+        record.start_time = time.time()
+        if self.log_store is not None:
+            try:
+                record.log = self.log_store.open(f"{tab_type}/{name}", record.start_time, shlex.join(argv))
+            except Exception as e:
+                run_log.error("Error opening run log for %s: %s", name, e)
+        if record.prepare:
+            record.state = 'preparing'
+            self.start_process(record, record.prepare[0], prepare_step=0)
+        elif not self.start_warm(record):
+            self.start_process(record, argv)
+        return record
+
+    def set_warm_pool(self, enabled, size=2):
+        """Enable or disable the warm worker pool"""
+        if enabled and self.warm_pool is None:
+            self.warm_pool = WarmWorkerPool(python_interpreter(), size, self)
+            self.warm_pool.fill()
+        elif not enabled and self.warm_pool is not None:
+            self.warm_pool.shutdown()
+            self.warm_pool.deleteLater()
+            self.warm_pool = None
+
+    def start_warm(self, record):
+        """Hand a script run to a warm worker, returning False if none can take it"""
+        if not (record.warm and record.script and record.env is None and self.warm_pool):
+            return False
+        if record.limits.get('memory_mb') or record.limits.get('cpu_seconds'):
+            return False  # Limits are set when a process starts
+        if record.argv[0] != self.warm_pool.interpreter:
+            return False  # Runs in its own environment
+        process = self.warm_pool.take(record.script)
+        if process is None:
+            return False
+        
+        process.readAllStandardOutput()  # Drop anything printed while preloading
+        process.readAllStandardError()
+        self.attach_process(record, process)
+        record.started_warm = True
+        record.pid = process.processId()
+        record.pgid = process_group(record.pid)
+        record.state = 'running'
+        self.contain(record, record.pid, limited=False)
+        self.start_timeout(record, process)
+        job = {'script': record.script, 'cwd': record.cwd, 'args': record.argv[3:]}
+        if os.name == 'nt':
+            record.handle = ProcessHandle(record.pid)
+        else:
+            record.usage_path = job['usage'] = self.usage_file()
+            record.usage_pid = record.pid
+        process.write((json.dumps(job) + '\n').encode('utf-8'))
+        process.closeWriteChannel()
+        self.run_changed.emit(record.run_id)
+        return True
+
+    def start_process(self, record, argv, prepare_step=None):
+        """Start one command of a run"""
+        limits = record.limits if prepare_step is None else {}
+        if os.name != 'nt':
+            record.usage_path = self.usage_file()
+        argv = limited_command(
+            argv, limits.get('memory_mb', 0), limits.get('cpu_seconds', 0),
+            new_session=not hasattr(QProcess, 'setUnixProcessParameters'), usage_path=record.usage_path)
+        process = QProcess(self)
+        process.setProgram(argv[0])
+        process.setArguments(argv[1:])
+        process.setWorkingDirectory(record.cwd)
+        configure_process(process)
+        process.setProcessEnvironment(process_environment(record.env))
+        process.started.connect(lambda: self.on_started(record, process, prepare_step))
+        self.attach_process(record, process, prepare_step)
+        process.start()
+
+    def attach_process(self, record, process, prepare_step=None):
+        """Follow a process's output and exit as part of a run"""
+        # Drain both pipes as data arrives so nothing piles up in QProcess
+        decoders = {
+            'stdout': codecs.getincrementaldecoder('utf-8')(errors='replace'),
+            'stderr': codecs.getincrementaldecoder('utf-8')(errors='replace')
+        }
+        process.readyReadStandardOutput.connect(
+            lambda: self.read_output(record, 'stdout', decoders['stdout'], process.readAllStandardOutput()))
+        process.readyReadStandardError.connect(
+            lambda: self.read_output(record, 'stderr', decoders['stderr'], process.readAllStandardError()))
+        
+        process.finished.connect(
+            lambda exit_code, exit_status: self.on_finished(record, process, prepare_step, exit_code, exit_status))
+        process.errorOccurred.connect(lambda error: self.on_error(record, process, error))
+        self.processes[record.run_id] = process
+        if not self.sample_timer.isActive():
+            self.sample_timer.start()
+
+    def sample_usage(self):
+        """Update CPU time and peak RSS of every running command"""
+        if not self.processes:
+            self.sample_timer.stop()
+            return
+        for run_id, process in self.processes.items():
+            self.sample_process(self.runs[run_id], process)
+
+    def sample_process(self, record, process):
+        if record.handle is not None:
+            usage = record.handle.usage()
+        elif record.usage_path:
+            # The wrapper's pid is Qt's; the command is its child
+            if record.usage_pid is None:
+                record.usage_pid = read_usage(record.usage_path).get('pid')
+            usage = process_usage(record.usage_pid)
+        else:
+            usage = process_usage(process.processId())
+        self.add_usage(record, usage)
+
+    def add_usage(self, record, usage):
+        """Set the usage of a run's current command, (cpu_seconds, peak_rss_bytes) or None"""
+        if usage is None:
+            return
+        record.cpu_time = record.cpu_done + usage[0]
+        if usage[1]:
+            record.peak_rss = max(record.peak_rss or 0, usage[1])
+
+    def usage_file(self):
+        """Return a new file for a command's usage report"""
+        fd, path = tempfile.mkstemp(prefix='devspace-usage-', suffix='.json')
+        os.close(fd)
+        return path
+
+    def account_exit(self, record):
+        """Settle the usage of a run's command that just exited.
+        
+        Qt reaps the command, so its exact usage comes from the launch
+        wrapper's report or the Windows handle. A command killed with its
+        wrapper (or a warm script that skipped exit handlers) keeps its last
+        sample. RUSAGE_CHILDREN is no use here: it would mix in every other
+        child the app reaped and the largest RSS any of them ever had.
+        """
+        if record.handle is not None:
+            self.add_usage(record, record.handle.usage())
+            record.handle.close()
+            record.handle = None
+        elif record.usage_path:
+            reported = read_usage(record.usage_path)
+            if 'cpu' in reported:
+                self.add_usage(record, (reported['cpu'], reported.get('peak_rss')))
+            try:
+                os.remove(record.usage_path)
+            except OSError:
+                pass
+            record.usage_path = record.usage_pid = None
+        if record.cpu_time is not None:
+            record.cpu_done = record.cpu_time
+
+    def read_output(self, record, channel, decoder, data):
+        self.append_output(record, channel, decoder.decode(bytes(data)))
+
+    def append_output(self, record, channel, text):
+        """Add output to a run's buffer and its persistent log"""
+        notify = not record.output.has_pending
+        record.output.append(channel, text)
+        if record.log is not None:
+            self.log_store.write(record.log, text)
+        if notify and record.output.has_pending:
+            self.output_ready.emit(record.run_id)
+
+    def on_started(self, record, process, prepare_step):
+        # Scripts that wait for input (e.g. "pause") see end of file instead of hanging
+        process.closeWriteChannel()
+        record.pid = process.processId()
+        record.pgid = process_group(record.pid)
+        if os.name == 'nt':
+            record.handle = ProcessHandle(record.pid)
+        self.contain(record, record.pid, limited=prepare_step is None)
+        if prepare_step is None:
+            self.start_timeout(record, process)
+            if record.state != 'stopping':
+                record.state = 'running'
+        self.run_changed.emit(record.run_id)
+
+    def contain(self, record, pid, limited):
+        """Put a started command in a Windows job object, with the run's limits if limited"""
+        if os.name != 'nt':
+            return
+        try:
+            limits = record.limits if limited else {}
+            record.job = WindowsJob(limits.get('memory_mb', 0), limits.get('cpu_seconds', 0))
+            if not record.job.assign(pid):
+                run_log.warning("Could not add %s to a job object, only its main process can be stopped", record.name)
+        except Exception as e:
+            run_log.error("Error creating job object for %s: %s", record.name, e)
+            record.job = None
+
+    def start_timeout(self, record, process):
+        timeout = record.limits.get('timeout')
+        if timeout:
+            QTimer.singleShot(int(timeout * 1000), lambda: self.expire(record, process))
+
+    def expire(self, record, process):
+        """Stop a run that is still on the command its timeout started with"""
+        if self.processes.get(record.run_id) is process and record.state == 'running':
+            run_log.warning("%s timed out after %ss", record.name, record.limits['timeout'])
+            record.timed_out = True
+            self.stop(record.run_id)
+
+    def on_finished(self, record, process, prepare_step, exit_code, exit_status):
+        process.deleteLater()
+        self.account_exit(record)
+        prepare_failed = False
+        if prepare_step is not None and record.state == 'preparing':
+            if exit_status == QProcess.ExitStatus.NormalExit and exit_code == 0:
+                if prepare_step + 1 < len(record.prepare):
+                    self.start_process(record, record.prepare[prepare_step + 1], prepare_step + 1)
+                else:
+                    record.prepared = True
+                    if not self.start_warm(record):
+                        self.start_process(record, record.argv)
+                return
+            prepare_failed = True
+            self.append_output(record, 'stderr', f"\nSetup command failed: {' '.join(record.prepare[prepare_step])}\n")
+        
+        self.processes.pop(record.run_id, None)
+        if record.job is not None:
+            record.job.close()
+            record.job = None
+        record.end_time = time.time()
+        record.exit_code = exit_code
+        if record.state == 'stopping':
+            kill_process_group(record.pgid)  # Children that outlived the command
+            record.state = 'timed out' if record.timed_out else 'stopped'
+        elif prepare_failed:
+            record.state = 'failed'
+        elif exit_status == QProcess.ExitStatus.CrashExit:
+            record.state = 'crashed'
+        else:
+            record.state = 'finished'
+            if record.script and not record.prepare:
+                self.timings['warm' if record.started_warm else 'cold'].append(record.duration)
+        self.close_log(record)
+        self.run_changed.emit(record.run_id)
+
+    def on_error(self, record, process, error):
+        if error != QProcess.ProcessError.FailedToStart:
+            return  # Exits are reported through finished
+        process.deleteLater()
+        self.processes.pop(record.run_id, None)
+        self.account_exit(record)
+        record.end_time = time.time()
+        record.state = 'failed'
+        run_log.error("Failed to start %s: %s", record.name, process.errorString())
+        self.close_log(record)
+        self.run_changed.emit(record.run_id)
+
+    def close_log(self, record):
+        if record.log is not None:
+            self.log_store.close(record.log, record.state, record.exit_code)
+
+    def stop(self, run_id):
+        """Ask a run to exit, killing it if it is still running after the grace period"""
+        record = self.runs.get(run_id)
+        process = self.processes.get(run_id)
+        if record is None or process is None:
+            return
+        record.state = 'stopping'
+        self.run_changed.emit(run_id)
+        self.terminate_tree(record, process)
+        QTimer.singleShot(self.STOP_TIMEOUT_MS, lambda: self.kill_if_running(run_id, process))
+
+    def kill_if_running(self, run_id, process):
+        if self.processes.get(run_id) is process:
+            self.kill_tree(self.runs[run_id], process)
+
+    def terminate_tree(self, record, process):
+        """Ask a command and everything it started to exit"""
+        if not signal_process_group(process.processId()):
+            process.terminate()
+
+    def kill_tree(self, record, process):
+        """Kill a command and everything it started"""
+        if record.job is not None:
+            record.job.terminate()
+        if not signal_process_group(process.processId(), kill=True):
+            process.kill()
+
+    def restart(self, run_id):
+        """Start a fresh run with the same command, stopping the old one first"""
+        record = self.runs.get(run_id)
+        if record is None:
+            return None
+        if record.active:
+            process = self.processes.get(run_id)
+            if process is not None:
+                process.finished.connect(lambda *args: self.relaunch(record))
+                self.stop(run_id)
+                return None
+        return self.relaunch(record)
+
+    def relaunch(self, record):
+        # Setup that already succeeded once is not repeated
+        prepare = None if record.prepared else record.prepare
+        return self.launch(record.tab_type, record.name, record.argv, record.cwd, record.env, prepare,
+                           record.script, record.warm, record.limits)
+
+    def active_runs(self):
+        return [record for record in self.runs.values() if record.active]
+
+    def stop_all(self):
+        """Stop every active run and wait briefly for them to exit"""
+        for run_id, process in list(self.processes.items()):
+            self.runs[run_id].state = 'stopping'
+            self.terminate_tree(self.runs[run_id], process)
+        for run_id, process in list(self.processes.items()):
+            if not process.waitForFinished(self.STOP_TIMEOUT_MS):
+                self.kill_tree(self.runs[run_id], process)
+                process.waitForFinished(1000)
+
+class QueueJob:
+    """A project waiting in, or run by, the run queue"""
+
+    def __init__(self, job_id, tab_type, path, args=(), depends_on=(), timeout=0):
+        self.job_id = job_id
+        self.tab_type = tab_type
+        self.path = path
+        self.name = os.path.basename(os.path.normpath(path))
+        self.args = list(args)
+        self.depends_on = list(depends_on)
+        self.timeout = timeout  # Seconds, 0 for the project's own limit
+        self.state = 'queued'
+        self.run_id = None
+        self.error = None
+
+    @property
+    def pending(self):
+        return self.state in ('queued', 'running')
+
+class RunQueue(QObject):
+    """Start queued project runs through the supervisor, a bounded number at a time.
+    
+    Jobs start in the order they were added once every job they depend on is
+    done (finished with exit code 0); if one of those ends any other way the
+    job is skipped. A job's timeout is passed on to its run, which the
+    supervisor stops when it expires. Nothing here waits: jobs advance when
+    the supervisor reports a run ended.
+    """
+    # job_id
+    job_changed = pyqtSignal(int)
+
+    def __init__(self, supervisor, launcher, max_parallel=2, parent=None):
+        super().__init__(parent)
+        self.supervisor = supervisor
+        self.supervisor.run_changed.connect(self.on_run_changed)
+        self.launcher = launcher  # (tab_type, path, args, timeout) -> RunRecord or None
+        self.max_parallel = max_parallel
+        self.paused = False
+        self.jobs = {}  # In queue order
+        self.run_jobs = {}  # run_id -> job_id
+        self.next_job_id = 1
+        self.scheduling = False
+
+    def add(self, tab_type, path, args=(), depends_on=(), timeout=0):
+        """Queue a project run and start it if it can run now"""
+        unknown = [job_id for job_id in depends_on if job_id not in self.jobs]
+        if unknown:
+            raise ValueError(f"Unknown queue job(s): {', '.join(map(str, unknown))}")
+        job = QueueJob(self.next_job_id, tab_type, path, args, depends_on, timeout)
+        self.next_job_id += 1
+        self.jobs[job.job_id] = job
+        self.job_changed.emit(job.job_id)
+        self.schedule()
+        return job
+
+    def remove(self, job_id):
+        """Drop a job that is not running; jobs after it no longer wait for it"""
+        job = self.jobs.get(job_id)
+        if job is None or job.state == 'running':
+            return False
+        del self.jobs[job_id]
+        for other in self.jobs.values():
+            if job_id in other.depends_on:
+                other.depends_on.remove(job_id)
+        self.schedule()
+        return True
+
+    def set_max_parallel(self, max_parallel):
+        self.max_parallel = max(1, max_parallel)
+        self.schedule()
+
+    def set_paused(self, paused):
+        """Hold back queued jobs; runs already started carry on"""
+        self.paused = paused
+        self.schedule()
+
+    def running_count(self):
+        return sum(1 for job in self.jobs.values() if job.state == 'running')
+
+    def schedule(self):
+        """Start every queued job whose dependencies are done while there are free slots"""
+        if self.scheduling:
+            return  # A run ending synchronously inside launch is picked up by the outer pass
+        self.scheduling = True
+        try:
+            # Dependencies always come earlier in the queue, so one pass settles skips
+            for job in list(self.jobs.values()):
+                if job.state != 'queued':
+                    continue
+                states = [self.jobs[job_id].state for job_id in job.depends_on]
+                if any(state not in ('queued', 'running', 'done') for state in states):
+                    job.state = 'skipped'
+                    self.job_changed.emit(job.job_id)
+                elif all(state == 'done' for state in states) and not self.paused \
+                        and self.running_count() < self.max_parallel:
+                    self.start(job)
+        finally:
+            self.scheduling = False
+
+    def start(self, job):
+        try:
+            record = self.launcher(job.tab_type, job.path, job.args, job.timeout)
+        except Exception as e:
+            record = None
+            job.error = str(e)
+        if record is None:
+            job.state = 'failed'
+            job.error = job.error or "Nothing to run in the project folder"
+            run_log.warning("Queue job %s (%s) failed: %s", job.job_id, job.name, job.error)
+            self.job_changed.emit(job.job_id)
+            return
+        
+        job.state = 'running'
+        job.run_id = record.run_id
+        self.run_jobs[record.run_id] = job.job_id
+        self.job_changed.emit(job.job_id)
+        if not record.active:
+            self.finish(job, record)  # Failed to start
+
+    def on_run_changed(self, run_id):
+        job = self.jobs.get(self.run_jobs.get(run_id))
+        record = self.supervisor.runs.get(run_id)
+        if job is None or record is None or record.active:
+            return
+        self.finish(job, record)
+        self.schedule()
+
+    def finish(self, job, record):
+        self.run_jobs.pop(record.run_id, None)
+        if record.state == 'timed out':
+            job.state = 'timed out'
+        elif record.state == 'finished' and record.exit_code == 0:
+            job.state = 'done'
+        else:
+            job.state = 'failed'
+        self.job_changed.emit(job.job_id)
+
+class TestJob:
+    """A test file, or some of its tests, run by a test session"""
+
+    def __init__(self, project_dir, framework, test_file, test_ids=(), estimate=0.0):
+        self.project_dir = project_dir
+        self.framework = framework
+        self.test_file = test_file
+        self.test_ids = list(test_ids)  # Empty for the whole file
+        self.estimate = estimate  # Expected seconds, from earlier runs
+        self.state = 'queued'
+        self.results = []
+        self.output = deque(maxlen=200)  # Last lines that were not results, for errors
+        self.partial = ''
+
+class TestSession(QObject):
+    """Run test files on a bounded set of worker processes, slowest first.
+    
+    Each file runs in its own worker with its project's interpreter, after
+    the project's dependency environment is built if it needs one. Workers
+    report every test as it ends, so results stream in while other files
+    still run. Files start in order of their expected duration, from the
+    per-test timings of earlier runs, so long files don't end up running
+    alone at the end.
+    """
+    # project_dir, result ({id, outcome, duration, message})
+    result_ready = pyqtSignal(str, object)
+    finished = pyqtSignal()
+
+    def __init__(self, history, max_parallel, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.max_parallel = max(1, max_parallel)
+        self.jobs = []
+        self.projects = {}  # project_dir -> {'interpreter', 'setup', 'state'}
+        self.processes = {}  # TestJob or project_dir (environment build) -> QProcess
+        self.stopped = False
+        self.done = False
+        self.start_time = None
+        self.duration = None
+
+    def add_project(self, project_dir, interpreter, setup, test_files, test_ids=None):
+        """Queue a project's test files ({file: framework}); test_ids ({file: [ids]}) limits which tests run"""
+        self.projects[project_dir] = {'interpreter': interpreter, 'setup': list(setup),
+                                      'state': 'building' if setup else 'ready'}
+        estimates = self.history.file_estimates(project_dir, test_files)
+        for test_file, framework in test_files.items():
+            ids = (test_ids or {}).get(test_file, ())
+            self.jobs.append(TestJob(project_dir, framework, test_file, ids, estimates[test_file]))
+
+    def start(self):
+        self.start_time = time.perf_counter()
+        self.jobs.sort(key=lambda job: -job.estimate)
+        self.schedule()
+
+    @property
+    def active(self):
+        return not self.done
+
+    def schedule(self):
+        """Start queued files, and the environment builds they wait for, while there are free slots"""
+        for job in self.jobs:
+            if job.state != 'queued':
+                continue
+            project = self.projects[job.project_dir]
+            if project['state'] == 'failed' or self.stopped:
+                job.state = 'stopped' if self.stopped else 'error'
+                if not self.stopped:
+                    self.add_result(job, {'id': job.test_file, 'outcome': 'error', 'duration': 0.0,
+                                          'message': "Building the project's environment failed"})
+                continue
+            if len(self.processes) >= self.max_parallel:
+                continue
+            if project['state'] == 'ready':
+                self.start_job(job)
+            elif job.project_dir not in self.processes:
+                self.start_setup(job.project_dir, 0)
+        
+        if not self.processes and not self.done and all(job.state != 'queued' for job in self.jobs):
+            self.done = True
+            self.duration = time.perf_counter() - self.start_time
+            self.history.save()
+            self.finished.emit()
+
+    def start_process(self, key, argv, cwd):
+        process = QProcess(self)
+        argv = limited_command(argv, new_session=not hasattr(QProcess, 'setUnixProcessParameters'))
+        process.setProgram(argv[0])
+        process.setArguments(argv[1:])
+        process.setWorkingDirectory(cwd)
+        process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        configure_process(process)
+        process.setProcessEnvironment(process_environment())
+        self.processes[key] = process
+        process.start()
+        return process
+
+    def start_setup(self, project_dir, step):
+        """Run one command of a project's environment build"""
+        process = self.start_process(project_dir, self.projects[project_dir]['setup'][step], project_dir)
+        process.readyReadStandardOutput.connect(process.readAllStandardOutput)  # Only drained
+        process.finished.connect(
+            lambda exit_code, exit_status: self.on_setup_finished(project_dir, step, process, exit_code, exit_status))
+        process.errorOccurred.connect(lambda error: self.on_error(project_dir, process, error))
+
+    def on_setup_finished(self, project_dir, step, process, exit_code, exit_status):
+        process.deleteLater()
+        if self.processes.get(project_dir) is not process:
+            return
+        del self.processes[project_dir]
+        project = self.projects[project_dir]
+        if exit_status != QProcess.ExitStatus.NormalExit or exit_code != 0:
+            tests_log.error("Building the test environment of %s failed with exit code %s", project_dir, exit_code)
+            project['state'] = 'failed'
+        elif step + 1 < len(project['setup']):
+            self.start_setup(project_dir, step + 1)
+            return
+        else:
+            project['state'] = 'ready'
+        self.schedule()
+
+    def start_job(self, job):
+        job.state = 'running'
+        project = self.projects[job.project_dir]
+        argv = test_worker_command(project['interpreter'], job.framework, job.project_dir, job.test_file, job.test_ids)
+        process = self.start_process(job, argv, job.project_dir)
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        process.readyReadStandardOutput.connect(
+            lambda: self.read_output(job, decoder.decode(bytes(process.readAllStandardOutput()))))
+        process.finished.connect(
+            lambda exit_code, exit_status: self.on_job_finished(job, process, exit_code, exit_status))
+        process.errorOccurred.connect(lambda error: self.on_error(job, process, error))
+
+    def read_output(self, job, text):
+        lines = (job.partial + text).split('\n')
+        job.partial = lines.pop()
+        for line in lines:
+            result = parse_test_result(line)
+            if result is None:
+                job.output.append(line)
+            else:
+                self.add_result(job, result)
+
+    def add_result(self, job, result):
+        job.results.append(result)
+        self.result_ready.emit(job.project_dir, result)
+
+    def on_job_finished(self, job, process, exit_code, exit_status):
+        self.read_output(job, '\n')
+        process.deleteLater()
+        if self.processes.get(job) is not process:
+            return
+        del self.processes[job]
+        if self.stopped:
+            job.state = 'stopped'
+        else:
+            # A file that reports no tests is an error too, so its tests can't go missing unnoticed
+            crashed = exit_status != QProcess.ExitStatus.NormalExit
+            if crashed or not job.results:
+                message = f"Test worker exited with code {exit_code}" if crashed or exit_code else \
+                    f"No tests were collected from {job.test_file}"
+                self.add_result(job, {
+                    'id': job.test_file, 'outcome': 'error', 'duration': 0.0,
+                    'message': '\n'.join(job.output).strip() or message
+                })
+            job.state = 'done'
+            self.history.record(job.project_dir, job.results, None if job.test_ids else job.test_file)
+        self.schedule()
+
+    def on_error(self, key, process, error):
+        if error != QProcess.ProcessError.FailedToStart or self.processes.get(key) is not process:
+            return
+        process.deleteLater()
+        del self.processes[key]
+        if isinstance(key, TestJob):
+            key.state = 'done'
+            self.add_result(key, {'id': key.test_file, 'outcome': 'error', 'duration': 0.0,
+                                  'message': f"Could not start the test worker: {process.errorString()}"})
+        else:
+            self.projects[key]['state'] = 'failed'
+        self.schedule()
+
+    def stop(self):
+        """Stop every running worker and skip the files still queued"""
+        self.stopped = True
+        for process in self.processes.values():
+            if not signal_process_group(process.processId(), kill=True):
+                process.kill()
+        self.schedule()
+
+    def counts(self):
+        """Return the number of results per outcome"""
+        counts = {}
+        for job in self.jobs:
+            for result in job.results:
+                counts[result['outcome']] = counts.get(result['outcome'], 0) + 1
+        return counts
+
+class WatchScanSignals(QObject):
+    """Signals used to hand watch scans back to the GUI thread"""
+    # files ({path: (mtime_ns, size)}), folders
+    scanned = pyqtSignal(object, object)
+
+class WatchScanTask(QRunnable):
+    """Snapshot a watched project's files off the GUI thread"""
+
+    def __init__(self, signals, path, suffixes):
+        super().__init__()
+        self.signals = signals
+        self.path = path
+        self.suffixes = suffixes
+
+    def run(self):
+        try:
+            files, folders = project_snapshot(self.path, self.suffixes)
+            self.signals.scanned.emit(files, folders)
+        except Exception as e:
+            watch_log.error("Error scanning %s: %s", self.path, e)
+            self.signals.scanned.emit(None, None)
+
+class ProjectWatcher(QObject):
+    """Watch a project's files and report changes once they settle.
+    
+    Folders and matching files are watched with QFileSystemWatcher (inotify
+    on Linux); projects with more than MAX_WATCHED_PATHS of them, or paths
+    the OS refuses to watch, are polled instead. Events only restart a
+    debounce timer, and the project is rescanned off the GUI thread when it
+    fires. Changes found while more events are still arriving (or, when
+    polling, until a scan finds nothing new) are held back, so a burst of
+    saves or a checkout touching many files is reported once.
+    """
+    # project path, changed files
+    changed = pyqtSignal(str, list)
+    
+    DEBOUNCE_MS = 300
+    POLL_INTERVAL_MS = 1000
+    MAX_WATCHED_PATHS = 4000
+
+    def __init__(self, tab_type, path, suffixes, pool, parent=None):
+        super().__init__(parent)
+        self.tab_type = tab_type
+        self.path = path
+        self.suffixes = suffixes
+        self.pool = pool
+        self.snapshot = None
+        self.pending_changes = set()
+        self.scanning = False
+        self.rescan = False
+        self.polling = False
+        self.stopped = False
+        
+        self.signals = WatchScanSignals()
+        self.signals.scanned.connect(self.on_scanned)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.schedule_scan)
+        self.watcher.directoryChanged.connect(self.schedule_scan)
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self.scan)
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(self.POLL_INTERVAL_MS)
+        self.poll_timer.timeout.connect(self.scan)
+        self.scan()  # Baseline
+
+    def schedule_scan(self, *args):
+        if self.scanning:
+            self.rescan = True
+        self.debounce_timer.start()
+
+    def scan(self):
+        if self.stopped:
+            return
+        if self.scanning:
+            self.rescan = True
+            return
+        self.scanning = True
+        self.pool.start(WatchScanTask(self.signals, self.path, self.suffixes))
+
+    def on_scanned(self, files, folders):
+        self.scanning = False
+        if self.stopped or files is None:
+            return
+        
+        changes = snapshot_changes(self.snapshot, files) if self.snapshot is not None else []
+        self.snapshot = files
+        self.update_watches([self.path] + folders + list(files))
+        self.pending_changes.update(changes)
+        
+        if self.rescan:
+            self.rescan = False
+            self.debounce_timer.start()
+        elif self.pending_changes and not (self.polling and changes):
+            changes = sorted(self.pending_changes)
+            self.pending_changes.clear()
+            self.changed.emit(self.path, changes)
+
+    def update_watches(self, paths):
+        """Watch the current folders and files, or fall back to polling"""
+        watched = set(self.watcher.files() + self.watcher.directories())
+        if len(paths) <= self.MAX_WATCHED_PATHS:
+            wanted = set(paths)
+            if watched - wanted:
+                self.watcher.removePaths(list(watched - wanted))
+            new_paths = [path for path in paths if path not in watched]
+            failed = self.watcher.addPaths(new_paths) if new_paths else []
+            if not failed:
+                self.polling = False
+                self.poll_timer.stop()
+                return
+        elif watched:
+            self.watcher.removePaths(list(watched))
+        
+        if not self.polling:
+            watch_log.info("Polling %s for changes", self.path)
+            self.polling = True
+            self.poll_timer.start()
+
+    def stop(self):
+        self.stopped = True
+        self.debounce_timer.stop()
+        self.poll_timer.stop()
+        watched = self.watcher.files() + self.watcher.directories()
+        if watched:
+            self.watcher.removePaths(watched)
+
+class PreviewSignals(QObject):
+    """Signals used to hand preview results back to the GUI thread"""
+    # tab_type, generation, kind ('file', 'dir', 'missing' or 'error'), path, payload
+    # (file text for 'file', summary dict for 'dir', message for 'error')
+    loaded = pyqtSignal(str, int, str, str, object)
+
+class PreviewLoadTask(QRunnable):
+    """Read a file for the editor preview on a worker thread"""
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, signals, tab_type, generation, file_path, cancel_event, summary_cache):
+        super().__init__()
+        self.signals = signals
+        self.tab_type = tab_type
+        self.generation = generation
+        self.file_path = file_path
+        self.cancel_event = cancel_event
+        self.summary_cache = summary_cache
+
+    @traced('PreviewLoadTask.run', lambda self: {'path': self.file_path})
+    def run(self):
+        try:
+            if not os.path.exists(self.file_path):
+                kind, payload = 'missing', None
+            elif os.path.isdir(self.file_path):
+                kind, payload = 'dir', self.load_summary()
+            else:
+                # Read in chunks so a superseded load stops early
+                chunks = []
+                with open(self.file_path, 'r', encoding='utf-8') as file:
+                    while not self.cancel_event.is_set():
+                        chunk = file.read(self.CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                kind, payload = 'file', ''.join(chunks)
+        except Exception as e:
+            kind, payload = 'error', str(e)
+        
+        if not self.cancel_event.is_set():
+            self.signals.loaded.emit(self.tab_type, self.generation, kind, self.file_path, payload)
+
+    def load_summary(self):
+        """Return the folder summary, reusing the cached one while the folder mtime is unchanged"""
+        mtime = os.stat(self.file_path).st_mtime_ns
+        cached = self.summary_cache.get(self.file_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        summary = summarize_folder(self.file_path, self.cancel_event)
+        if summary is not None:
+            self.summary_cache[self.file_path] = (mtime, summary)
+        return summary
+
+class PackageSignals(QObject):
+    """Signals used to hand packaging results back to the GUI thread"""
+    # extension path, result (problems plus build statistics, or an error message)
+    finished = pyqtSignal(str, object)
+
+class PackageTask(QRunnable):
+    """Validate a Chrome extension's manifest and build its package off the GUI thread"""
+
+    def __init__(self, signals, packager, extension_dir, output_dir):
+        super().__init__()
+        self.signals = signals
+        self.packager = packager
+        self.extension_dir = extension_dir
+        self.output_dir = output_dir
+
+    def run(self):
+        result = {}
+        try:
+            manifest, problems = validate_extension_manifest(self.extension_dir)
+            result['problems'] = problems
+            if manifest is not None and not any(level == 'error' for level, message in problems):
+                name = os.path.basename(os.path.normpath(self.extension_dir))
+                zip_path = os.path.join(self.output_dir, f"{name}-{manifest['version']}.zip")
+                result.update(self.packager.build(self.extension_dir, zip_path), zip_path=zip_path)
+        except Exception as e:
+            result['error'] = str(e)
+        self.signals.finished.emit(self.extension_dir, result)
+
+class JournalWriteTask(QRunnable):
+    """Write or remove one autosave journal entry off the GUI thread"""
+
+    def __init__(self, entry_path, record=None):
+        super().__init__()
+        self.entry_path = entry_path
+        self.record = record
+
+    def run(self):
+        try:
+            if self.record is None:
+                if os.path.exists(self.entry_path):
+                    os.remove(self.entry_path)
+                return
+            
+            # Write to a temp file first so a crash never leaves a torn entry
+            temp_path = self.entry_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.record, f)
+            os.replace(temp_path, self.entry_path)
+        except Exception as e:
+            journal_log.error("Error writing autosave journal: %s", e)
+
+class TrendChart(QWidget):
+    """Line chart of one metric over a project's past runs, with flagged runs marked"""
+
+    def __init__(self, colors, parent=None):
+        super().__init__(parent)
+        self.colors = colors
+        self.values = []
+        self.flagged = set()
+        self.baseline = None
+        self.setMinimumHeight(160)
+
+    def set_series(self, values, flagged=(), baseline=None):
+        self.values = values
+        self.flagged = set(flagged)
+        self.baseline = baseline
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), QColor(self.colors['secondary_bg']))
+        points = [(i, v) for i, v in enumerate(self.values) if v is not None]
+        if not points:
+            painter.setPen(QColor(self.colors['secondary_text']))
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "No runs recorded")
+            return
+        
+        margin = 10
+        width = self.width() - 2 * margin
+        height = self.height() - 2 * margin
+        top = max(max(v for i, v in points), self.baseline or 0) or 1
+        step = width / max(len(self.values) - 1, 1)
+        def position(index, value):
+            return QPointF(margin + index * step, margin + height * (1 - value / top))
+        
+        if self.baseline:
+            painter.setPen(QPen(QColor(self.colors['secondary_text']), 1, Qt.PenStyle.DashLine))
+            painter.drawLine(position(0, self.baseline), position(len(self.values) - 1, self.baseline))
+        painter.setPen(QPen(QColor(self.colors['accent']), 2))
+        for (i1, v1), (i2, v2) in zip(points, points[1:]):
+            painter.drawLine(position(i1, v1), position(i2, v2))
+        for index, value in points:
+            color = '#FF6347' if index in self.flagged else self.colors['accent']
+            painter.setPen(QPen(QColor(color), 1))
+            painter.setBrush(QBrush(QColor(color)))
+            painter.drawEllipse(position(index, value), 3, 3)
+
 class DeveloperWorkspace(QMainWindow):
+    # Delay before a selection change triggers a preview load
+    PREVIEW_DEBOUNCE_MS = 120
+    
+    # Delay before re-parsing edits for the outline panel
+    OUTLINE_REPARSE_MS = 500
+    
+    # Characters of a saved run log shown at once (the end of longer logs)
+    LOG_VIEW_CHARS = 2 * 1024 * 1024
+    
+    # Run output is pushed to the output pane at most once per frame, and the
+    # pane keeps at most this many lines
+    OUTPUT_FLUSH_MS = 16
+    OUTPUT_MAX_LINES = 10000
+    
+    # Autosave journal: how often dirty editors are checked, the minimum time
+    # between snapshots of one document (longer for large documents), and the
+    # GUI time a single autosave pass may spend before deferring the rest
+    AUTOSAVE_INTERVAL_MS = 2000
+    AUTOSAVE_MIN_GAP = 5.0
+    AUTOSAVE_LARGE_DOC_GAP = 30.0
+    AUTOSAVE_LARGE_DOC_CHARS = 500000
+    AUTOSAVE_BUDGET_MS = 4.0
+
+    @traced()
     def __init__(self):
         super().__init__()
-        print("Starting initialization...")
+        workspace_log.info("Starting initialization...")
         
         # Get screen size
         screen = QApplication.primaryScreen().availableGeometry()
@@ -54,6 +1446,72 @@ class DeveloperWorkspace(QMainWindow):
         
         # Initialize workspace directories
         self.init_workspace()
+        self.settings = QSettings("DevSpace Manager", "Developer Workspace")
+        
+        # Preview loading state (per tab)
+        self.preview_signals = PreviewSignals()
+        self.preview_signals.loaded.connect(self.apply_preview)
+        self.preview_pool = QThreadPool()
+        self.preview_pool.setMaxThreadCount(2)
+        self.preview_timers = {}
+        self.preview_generation = {}
+        self.preview_cancel = {}
+        self.folder_summary_cache = {}  # path -> (mtime_ns, summary)
+        
+        # Autosave journal state (per tab)
+        self.editor_paths = {}
+        self.journal_revisions = {}
+        self.journal_times = {}
+        self.journal_pool = QThreadPool()
+        self.journal_pool.setMaxThreadCount(1)  # Keeps journal writes in order
+        
+        # Python outline state (per tab)
+        self.outline_signals = OutlineSignals()
+        self.outline_signals.ready.connect(self.apply_outline)
+        self.outline_pool = QThreadPool()
+        self.outline_pool.setMaxThreadCount(1)  # The builder's block cache is not shared across threads
+        self.outline_builder = OutlineBuilder()
+        self.outline_cache = {}  # path -> ((mtime_ns, size), outline)
+        self.outline_generation = {}
+        self.outline_timers = {}
+        
+        # Static check state, shared by all tabs
+        self.check_signals = StaticCheckSignals()
+        self.check_signals.finished.connect(self.apply_check_results)
+        self.check_pool = QThreadPool()
+        self.check_pool.setMaxThreadCount(1)  # One pass at a time
+        self.check_executor = None  # Process pool, created on first use; also compiles bytecode
+        self.check_file_hashes = {}  # path -> ((mtime_ns, size), sha1)
+        self.check_results = {}  # sha1 -> diagnostics
+        
+        # Every project run goes through the supervisor
+        self.supervisor = ProcessSupervisor(self)
+        self.supervisor.log_store = self.run_logs
+        self.supervisor.run_changed.connect(self.record_run_history)
+        self.supervisor.run_changed.connect(self.update_running_item)
+        self.supervisor.output_ready.connect(self.schedule_output_flush)
+        self.fast_run = False
+        if self.settings.value('fast_run', False, type=bool):
+            self.set_fast_run(True)
+        self.run_queue = RunQueue(
+            self.supervisor, self.launch_project, self.settings.value('queue_max_parallel', 2, type=int), self)
+        self.run_queue.job_changed.connect(self.update_queue_item)
+        
+        # Watch mode: project path -> watcher, and the run each watched project restarts
+        self.watchers = {}
+        self.watch_runs = {}
+        self.watch_restarts = set()  # Projects waiting for their run to stop before rerunning
+        self.watch_pool = QThreadPool()
+        self.watch_pool.setMaxThreadCount(1)
+        self.supervisor.run_changed.connect(self.rerun_after_stop)
+        self.html_servers = {}  # project path -> live reload server
+        
+        # Chrome extension packaging, one build at a time
+        self.package_signals = PackageSignals()
+        self.package_signals.finished.connect(self.apply_package_result)
+        self.package_pool = QThreadPool()
+        self.package_pool.setMaxThreadCount(1)
+        self.test_session = None  # Latest test session
         
         # Basic window setup
         self.setWindowTitle("Developer Workspace")
@@ -73,15 +1531,22 @@ class DeveloperWorkspace(QMainWindow):
         self.tabs = QTabWidget()
         self.main_layout.addWidget(self.tabs)
         
-        # Create basic tabs
-        self.create_ubif_tab()
-        self.create_html_tab()
-        self.create_chrome_tab()
-        self.create_python_scripts_tab()
-        self.create_python_apps_tab()
-        self.create_batch_scripts_tab()
-        self.create_powershell_apps_tab()
-        self.create_readme_tab()
+        # Create a tab per project type, each built the first time it is shown
+        self.tab_pages = {}  # tab_type -> page
+        self.tab_builders = {}  # page -> create method, until the tab is built
+        for tab_type, project_type in self.project_types.items():
+            self.add_lazy_tab(tab_type, project_type.title, lambda tab_type=tab_type: self.create_project_tab(tab_type),
+                              self.project_type_icon(project_type))
+        self.add_lazy_tab('readme', "README", self.create_readme_tab)
+        self.create_running_panel()
+        self.create_queue_panel()
+        self.create_tests_panel()
+        
+        # Build the tab that was active last time now, and each other tab when it is first shown
+        last_page = self.tab_pages.get(self.settings.value('last_tab', 'ubif'), self.tab_pages['ubif'])
+        self.tabs.setCurrentWidget(last_page)
+        self.build_tab(self.tabs.currentIndex())
+        self.tabs.currentChanged.connect(self.on_tab_changed)
         
         # Apply theme
         self.setStyleSheet(f"""
@@ -122,400 +1587,127 @@ class DeveloperWorkspace(QMainWindow):
             }}
         """)
         
-        print("Initialization complete")
+        # Start the autosave journal and offer recovery from a previous session
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.timeout.connect(self.autosave_tick)
+        self.autosave_timer.start(self.AUTOSAVE_INTERVAL_MS)
+        QTimer.singleShot(0, self.offer_recovery)
+        
+        workspace_log.info("Initialization complete")
 
+    @traced()
     def init_workspace(self):
         """Initialize workspace directories in Documents folder"""
-        documents_dir = os.path.expanduser("~/Documents")
-        self.workspace_dir = os.path.join(documents_dir, "DeveloperWorkspace")
-        
-        # Define project directories
-        self.dirs = {
-            'ubif': os.path.join(self.workspace_dir, "UBIF_Projects"),
-            'html': os.path.join(self.workspace_dir, "HTML_Projects"),
-            'chrome': os.path.join(self.workspace_dir, "Chrome_Extensions"),
-            'scripts': os.path.join(self.workspace_dir, "Python_Scripts"),
-            'apps': os.path.join(self.workspace_dir, "Python_Apps"),
-            'batch': os.path.join(self.workspace_dir, "Batch_Scripts"),
-            'powershell': os.path.join(self.workspace_dir, "PowerShell_Apps")
-        }
+        self.workspace_dir = default_workspace_dir()
+        
+        # Project types, built in and from plugins, and their directories (shared with the devspace CLI)
+        self.project_types = project_types()
+        self.python_tabs = tuple(tab_type for tab_type, project_type in self.project_types.items() if project_type.python)
+        self.dirs = workspace_dirs(self.workspace_dir)
         
         # Create directories if they don't exist
         for dir_path in self.dirs.values():
             os.makedirs(dir_path, exist_ok=True)
-            print(f"Initialized directory: {dir_path}")
+            workspace_log.debug("Initialized directory: %s", dir_path)
+        
+        # Autosave journal for unsaved editor buffers
+        self.recovery_dir = os.path.join(self.workspace_dir, ".recovery")
+        os.makedirs(self.recovery_dir, exist_ok=True)
+        
+        # Shared cache (dependency environments, ...)
+        self.cache_dir = os.path.join(self.workspace_dir, ".cache")
+        self.environments = EnvironmentManager(os.path.join(self.cache_dir, "envs"))
+        self.packages_dir = os.path.join(self.workspace_dir, "Packages")
+        self.packager = ExtensionPackager(os.path.join(self.cache_dir, "packages"))
+        self.env_builds = {}  # spec digest -> run building it
+        self.entry_points = EntryPointResolver(os.path.join(self.cache_dir, "entry_points.json"))
+        self.run_history = RunHistory(os.path.join(self.cache_dir, "run_history.jsonl"))
+        self.run_limits = RunLimits(os.path.join(self.cache_dir, "run_limits.json"))
+        self.test_history = TestHistory(os.path.join(self.cache_dir, "test_history.json"))
+        self.run_logs = RunLogStore(os.path.join(self.cache_dir, "logs"))
 
-    def create_ubif_tab(self):
-        """Create UBIF tab"""
-        print("Creating UBIF tab...")
-        tab = QWidget()
+    @traced(describe=lambda self, tab_type: {'tab_type': tab_type})
+    def create_project_tab(self, tab_type):
+        """Create the tab of a project type"""
+        project_type = self.project_types[tab_type]
+        tabs_log.debug("Creating %s tab...", project_type.title)
+        tab = self.tab_pages[tab_type]
         layout = QVBoxLayout(tab)
         
         # Toolbar
         toolbar = QHBoxLayout()
-        new_project_btn = QPushButton("New Project")
+        new_project_btn = QPushButton(project_type.new_label)
         browse_btn = QPushButton("Browse...")
         save_btn = QPushButton("Save")
         move_to_projects_btn = QPushButton("Move to Projects")
-        run_btn = QPushButton("Run")
+        run_btn = QPushButton(project_type.run_label)
         
         toolbar.addWidget(new_project_btn)
         toolbar.addWidget(browse_btn)
         toolbar.addWidget(save_btn)
         toolbar.addWidget(move_to_projects_btn)
         toolbar.addWidget(run_btn)
+        if project_type.fast_run:
+            fast_run_btn = QPushButton("Fast Run")
+            fast_run_btn.setCheckable(True)
+            fast_run_btn.setToolTip("Run scripts in pre-started Python workers with common modules already imported")
+            fast_run_btn.setChecked(self.fast_run)
+            fast_run_btn.toggled.connect(self.set_fast_run)
+            timing_btn = QPushButton("Timing")
+            timing_btn.clicked.connect(self.show_run_timings)
+            toolbar.addWidget(fast_run_btn)
+            toolbar.addWidget(timing_btn)
         toolbar.addStretch()
         
         # Create splitter
         splitter = QSplitter(Qt.Orientation.Horizontal)
         
         # Project tree
-        self.ubif_tree = QTreeWidget()
-        self.ubif_tree.setHeaderLabels(["UBIF Projects"])
-        self.ubif_tree.setAcceptDrops(True)
-        self.load_projects(self.ubif_tree, self.dirs['ubif'])
+        tree = QTreeWidget()
+        tree.setHeaderLabels([project_type.tree_title])
+        tree.setAcceptDrops(True)
+        tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        tree.customContextMenuRequested.connect(lambda position: self.show_project_menu(tab_type, position))
+        setattr(self, f'{tab_type}_tree', tree)
+        self.load_projects(tree, self.dirs[tab_type])
         
         # Add double-click handler
-        self.ubif_tree.itemDoubleClicked.connect(lambda item: self.run_ubif_project())
+        tree.itemDoubleClicked.connect(lambda item: self.run_project(tab_type))
         
         # Editor
-        self.ubif_editor = QTextEdit()
+        setattr(self, f'{tab_type}_editor', QTextEdit())
         
         # Add widgets to splitter
-        splitter.addWidget(self.ubif_tree)
-        splitter.addWidget(self.ubif_editor)
+        splitter.addWidget(tree)
+        splitter.addWidget(self.create_editor_pane(tab_type))
+        if project_type.python:
+            splitter.addWidget(self.create_outline_panel(tab_type))
         
         layout.addLayout(toolbar)
         layout.addWidget(splitter)
-        self.tabs.addTab(tab, "UBIF")
         
         # Connect signals
-        self.ubif_tree.itemClicked.connect(lambda item: self.load_file(item.text(0), 'ubif'))
-        save_btn.clicked.connect(lambda: self.save_file('ubif'))
-        browse_btn.clicked.connect(lambda: self.browse_directory('ubif'))
-        move_to_projects_btn.clicked.connect(lambda: self.move_selected_to_projects('ubif'))
-        new_project_btn.clicked.connect(lambda: self.new_file('ubif'))
-        run_btn.clicked.connect(self.run_ubif_project)
-
-    def create_html_tab(self):
-        print("Creating HTML tab...")
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        new_project_btn = QPushButton("New Project")
-        browse_btn = QPushButton("Browse...")
-        save_btn = QPushButton("Save")
-        move_to_projects_btn = QPushButton("Move to Projects")
-        run_btn = QPushButton("Run")
-        
-        toolbar.addWidget(new_project_btn)
-        toolbar.addWidget(browse_btn)
-        toolbar.addWidget(save_btn)
-        toolbar.addWidget(move_to_projects_btn)
-        toolbar.addWidget(run_btn)
-        toolbar.addStretch()
-        
-        # Create splitter
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        
-        # Project tree
-        self.html_tree = QTreeWidget()
-        self.html_tree.setHeaderLabels(["HTML Projects"])
-        self.html_tree.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
-        self.load_projects(self.html_tree, self.dirs['html'])
-        
-        # Add double-click handler
-        self.html_tree.itemDoubleClicked.connect(lambda item: self.run_html_file())
-        
-        # Connect item clicked signal with error handling
-        def safe_item_clicked(item):
-            try:
-                print(f"Item clicked: {item.text(0)}")
-                self.load_file(item.text(0), 'html')
-            except Exception as e:
-                print(f"Error handling item click: {e}")
-                QMessageBox.warning(self, "Error", f"Error selecting item: {str(e)}")
-        
-        self.html_tree.itemClicked.connect(safe_item_clicked)
-        
-        # Editor
-        self.html_editor = QTextEdit()
-        
-        # Add widgets to splitter
-        splitter.addWidget(self.html_tree)
-        splitter.addWidget(self.html_editor)
-        
-        layout.addLayout(toolbar)
-        layout.addWidget(splitter)
-        self.tabs.addTab(tab, "HTML")
-        
-        # Connect other signals
-        save_btn.clicked.connect(lambda: self.save_file('html'))
-        browse_btn.clicked.connect(lambda: self.browse_directory('html'))
-        move_to_projects_btn.clicked.connect(lambda: self.move_selected_to_projects('html'))
-        run_btn.clicked.connect(self.run_html_file)
+        tree.itemClicked.connect(lambda item: self.load_file(item.text(0), tab_type))
+        tree.currentItemChanged.connect(
+            lambda item, previous: item and self.load_file(item.text(0), tab_type))
+        save_btn.clicked.connect(lambda: self.save_file(tab_type))
+        browse_btn.clicked.connect(lambda: self.browse_directory(tab_type))
+        move_to_projects_btn.clicked.connect(lambda: self.move_selected_to_projects(tab_type))
+        new_project_btn.clicked.connect(lambda: self.new_file(tab_type))
+        run_btn.clicked.connect(lambda: self.run_project(tab_type))
 
-    def create_chrome_tab(self):
-        print("Creating Chrome Extensions tab...")
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        new_project_btn = QPushButton("New Project")
-        browse_btn = QPushButton("Browse...")
-        save_btn = QPushButton("Save")
-        move_to_projects_btn = QPushButton("Move to Projects")
-        run_btn = QPushButton("Run")
-        
-        toolbar.addWidget(new_project_btn)
-        toolbar.addWidget(browse_btn)
-        toolbar.addWidget(save_btn)
-        toolbar.addWidget(move_to_projects_btn)
-        toolbar.addWidget(run_btn)
-        toolbar.addStretch()
-        
-        # Create splitter
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        
-        # Project tree
-        self.chrome_tree = QTreeWidget()
-        self.chrome_tree.setHeaderLabels(["Chrome Extensions"])
-        self.chrome_tree.setAcceptDrops(True)
-        self.load_projects(self.chrome_tree, self.dirs['chrome'])
-        
-        # Add double-click handler
-        self.chrome_tree.itemDoubleClicked.connect(lambda item: self.run_chrome_extension())
-        
-        # Editor
-        self.chrome_editor = QTextEdit()
-        
-        # Add widgets to splitter
-        splitter.addWidget(self.chrome_tree)
-        splitter.addWidget(self.chrome_editor)
-        
-        layout.addLayout(toolbar)
-        layout.addWidget(splitter)
-        self.tabs.addTab(tab, "Chrome Extensions")
-        
-        # Connect signals
-        self.chrome_tree.itemClicked.connect(lambda item: self.load_file(item.text(0), 'chrome'))
-        save_btn.clicked.connect(lambda: self.save_file('chrome'))
-        browse_btn.clicked.connect(lambda: self.browse_directory('chrome'))
-        move_to_projects_btn.clicked.connect(lambda: self.move_selected_to_projects('chrome'))
-        new_project_btn.clicked.connect(lambda: self.new_file('chrome'))
-        run_btn.clicked.connect(self.run_chrome_extension)
-
-    def create_python_scripts_tab(self):
-        print("Creating Python Scripts tab...")
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        new_script_btn = QPushButton("New Script")
-        browse_btn = QPushButton("Browse...")
-        save_btn = QPushButton("Save")
-        move_to_projects_btn = QPushButton("Move to Projects")
-        run_btn = QPushButton("Run")
-        
-        toolbar.addWidget(new_script_btn)
-        toolbar.addWidget(browse_btn)
-        toolbar.addWidget(save_btn)
-        toolbar.addWidget(move_to_projects_btn)
-        toolbar.addWidget(run_btn)
-        toolbar.addStretch()
-        
-        # Create splitter
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        
-        # Project tree
-        self.scripts_tree = QTreeWidget()
-        self.scripts_tree.setHeaderLabels(["Python Scripts"])
-        self.scripts_tree.setAcceptDrops(True)
-        self.load_projects(self.scripts_tree, self.dirs['scripts'])
-        
-        # Add double-click handler
-        self.scripts_tree.itemDoubleClicked.connect(lambda item: self.run_python_script())
-        
-        # Editor
-        self.scripts_editor = QTextEdit()
-        
-        # Add widgets to splitter
-        splitter.addWidget(self.scripts_tree)
-        splitter.addWidget(self.scripts_editor)
-        
-        layout.addLayout(toolbar)
-        layout.addWidget(splitter)
-        self.tabs.addTab(tab, "Python Scripts")
-        
-        # Connect signals
-        self.scripts_tree.itemClicked.connect(lambda item: self.load_file(item.text(0), 'scripts'))
-        save_btn.clicked.connect(lambda: self.save_file('scripts'))
-        browse_btn.clicked.connect(lambda: self.browse_directory('scripts'))
-        move_to_projects_btn.clicked.connect(lambda: self.move_selected_to_projects('scripts'))
-        new_script_btn.clicked.connect(lambda: self.new_file('scripts'))
-        run_btn.clicked.connect(self.run_python_script)
-
-    def create_python_apps_tab(self):
-        print("Creating Python Apps tab...")
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        new_app_btn = QPushButton("New App")
-        browse_btn = QPushButton("Browse...")
-        save_btn = QPushButton("Save")
-        move_to_projects_btn = QPushButton("Move to Projects")
-        run_btn = QPushButton("Run")
-        
-        toolbar.addWidget(new_app_btn)
-        toolbar.addWidget(browse_btn)
-        toolbar.addWidget(save_btn)
-        toolbar.addWidget(move_to_projects_btn)
-        toolbar.addWidget(run_btn)
-        toolbar.addStretch()
-        
-        # Create splitter
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        
-        # Apps tree
-        self.apps_tree = QTreeWidget()
-        self.apps_tree.setHeaderLabels(["Python Apps"])
-        self.apps_tree.setAcceptDrops(True)
-        self.load_projects(self.apps_tree, self.dirs['apps'])
-        
-        # Add double-click handler
-        self.apps_tree.itemDoubleClicked.connect(lambda item: self.run_python_app())
-        
-        # Editor
-        self.apps_editor = QTextEdit()
-        
-        # Add widgets to splitter
-        splitter.addWidget(self.apps_tree)
-        splitter.addWidget(self.apps_editor)
-        
-        layout.addLayout(toolbar)
-        layout.addWidget(splitter)
-        self.tabs.addTab(tab, "Python Apps")
-        
-        # Connect signals
-        self.apps_tree.itemClicked.connect(lambda item: self.load_file(item.text(0), 'apps'))
-        save_btn.clicked.connect(lambda: self.save_file('apps'))
-        browse_btn.clicked.connect(lambda: self.browse_directory('apps'))
-        move_to_projects_btn.clicked.connect(lambda: self.move_selected_to_projects('apps'))
-        new_app_btn.clicked.connect(lambda: self.new_file('apps'))
-        run_btn.clicked.connect(self.run_python_app)
-
-    def create_batch_scripts_tab(self):
-        print("Creating Batch Scripts tab...")
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        new_script_btn = QPushButton("New Script")
-        browse_btn = QPushButton("Browse...")
-        save_btn = QPushButton("Save")
-        move_to_projects_btn = QPushButton("Move to Projects")
-        run_btn = QPushButton("Run")
-        
-        toolbar.addWidget(new_script_btn)
-        toolbar.addWidget(browse_btn)
-        toolbar.addWidget(save_btn)
-        toolbar.addWidget(move_to_projects_btn)
-        toolbar.addWidget(run_btn)
-        toolbar.addStretch()
-        
-        # Create splitter
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        
-        # Scripts tree
-        self.batch_tree = QTreeWidget()
-        self.batch_tree.setHeaderLabels(["Batch Scripts"])
-        self.batch_tree.setAcceptDrops(True)
-        self.load_projects(self.batch_tree, self.dirs['batch'])
-        
-        # Add double-click handler
-        self.batch_tree.itemDoubleClicked.connect(lambda item: self.run_batch_script())
-        
-        # Editor
-        self.batch_editor = QTextEdit()
-        
-        # Add widgets to splitter
-        splitter.addWidget(self.batch_tree)
-        splitter.addWidget(self.batch_editor)
-        
-        layout.addLayout(toolbar)
-        layout.addWidget(splitter)
-        self.tabs.addTab(tab, "Batch Scripts")
-        
-        # Connect signals
-        self.batch_tree.itemClicked.connect(lambda item: self.load_file(item.text(0), 'batch'))
-        save_btn.clicked.connect(lambda: self.save_file('batch'))
-        browse_btn.clicked.connect(lambda: self.browse_directory('batch'))
-        move_to_projects_btn.clicked.connect(lambda: self.move_selected_to_projects('batch'))
-        new_script_btn.clicked.connect(lambda: self.new_file('batch'))
-        run_btn.clicked.connect(self.run_batch_script)
-
-    def create_powershell_apps_tab(self):
-        print("Creating PowerShell Apps tab...")
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        new_app_btn = QPushButton("New App")
-        browse_btn = QPushButton("Browse...")
-        save_btn = QPushButton("Save")
-        move_to_projects_btn = QPushButton("Move to Projects")
-        run_btn = QPushButton("Run")
-        
-        toolbar.addWidget(new_app_btn)
-        toolbar.addWidget(browse_btn)
-        toolbar.addWidget(save_btn)
-        toolbar.addWidget(move_to_projects_btn)
-        toolbar.addWidget(run_btn)
-        toolbar.addStretch()
-        
-        # Create splitter
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        
-        # Apps tree
-        self.powershell_tree = QTreeWidget()
-        self.powershell_tree.setHeaderLabels(["PowerShell Apps"])
-        self.powershell_tree.setAcceptDrops(True)
-        self.load_projects(self.powershell_tree, self.dirs['powershell'])
-        
-        # Add double-click handler
-        self.powershell_tree.itemDoubleClicked.connect(lambda item: self.run_powershell_app())
-        
-        # Editor
-        self.powershell_editor = QTextEdit()
-        
-        # Add widgets to splitter
-        splitter.addWidget(self.powershell_tree)
-        splitter.addWidget(self.powershell_editor)
-        
-        layout.addLayout(toolbar)
-        layout.addWidget(splitter)
-        self.tabs.addTab(tab, "PowerShell Apps")
-        
-        # Connect signals
-        self.powershell_tree.itemClicked.connect(lambda item: self.load_file(item.text(0), 'powershell'))
-        save_btn.clicked.connect(lambda: self.save_file('powershell'))
-        browse_btn.clicked.connect(lambda: self.browse_directory('powershell'))
-        move_to_projects_btn.clicked.connect(lambda: self.move_selected_to_projects('powershell'))
-        new_app_btn.clicked.connect(lambda: self.new_file('powershell'))
-        run_btn.clicked.connect(self.run_powershell_app)
+    def project_type_icon(self, project_type):
+        """Return a project type's icon: an image file or a standard style icon"""
+        if os.path.isfile(project_type.icon):
+            return QIcon(project_type.icon)
+        pixmap = getattr(QStyle.StandardPixmap, project_type.icon, QStyle.StandardPixmap.SP_DirIcon)
+        return self.style().standardIcon(pixmap)
 
+    @traced()
     def create_readme_tab(self):
         """Create README tab with information about the tool"""
-        print("Creating README tab...")
-        tab = QWidget()
+        tabs_log.debug("Creating README tab...")
+        tab = self.tab_pages['readme']
         layout = QVBoxLayout(tab)
         
         # Create text editor for README content
@@ -576,34 +1768,445 @@ Instead of navigating multiple folders and windows, they can:
 4. **Productivity**: Everything you need in one workspace
 5. **Simplicity**: Intuitive interface for project management
 
-## Tips for Best Use
-1. Use the appropriate tab for each project type
-2. Regularly organize your projects using the "Move to Projects" feature
-3. Take advantage of the drag-and-drop functionality
-4. Use the multi-select feature for batch operations
-5. Keep your workspace organized by project type
+## Tips for Best Use
+1. Use the appropriate tab for each project type
+2. Regularly organize your projects using the "Move to Projects" feature
+3. Take advantage of the drag-and-drop functionality
+4. Use the multi-select feature for batch operations
+5. Keep your workspace organized by project type
+
+## Support
+For issues, suggestions, or contributions, please contact Chris Loetz.
+"""
+        readme_text.setMarkdown(readme_content)
+        
+        # Add to layout
+        layout.addWidget(readme_text)
+        
+        # Style the text editor
+        readme_text.setStyleSheet(f"""
+            QTextEdit {{
+                background-color: {self.colors['secondary_bg']};
+                color: {self.colors['text']};
+                border: none;
+                padding: 15px;
+                font-size: 14px;
+            }}
+        """)
+        
+
+    def create_editor_pane(self, tab_type):
+        """Stack the tab's editor with a read-only folder summary view"""
+        stack = QStackedWidget()
+        summary_view = QTextEdit()
+        summary_view.setReadOnly(True)
+        
+        stack.addWidget(getattr(self, f'{tab_type}_editor'))
+        stack.addWidget(summary_view)
+        
+        setattr(self, f'{tab_type}_summary', summary_view)
+        setattr(self, f'{tab_type}_editor_stack', stack)
+        return stack
+
+    def create_outline_panel(self, tab_type):
+        """Create the Python outline panel for a tab"""
+        outline = QTreeWidget()
+        outline.setHeaderLabels(["Outline"])
+        outline.itemClicked.connect(lambda item: self.jump_to_line(tab_type, item.data(0, Qt.ItemDataRole.UserRole)))
+        setattr(self, f'{tab_type}_outline', outline)
+        
+        # Re-parse edits once typing pauses
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.OUTLINE_REPARSE_MS)
+        timer.timeout.connect(lambda: self.refresh_outline(tab_type))
+        self.outline_timers[tab_type] = timer
+        getattr(self, f'{tab_type}_editor').textChanged.connect(timer.start)
+        return outline
+
+    def create_running_panel(self):
+        """Create the dock listing runs launched from any tab"""
+        dock = QDockWidget("Running", self)
+        dock.setObjectName("running_dock")
+        self.running_dock = dock
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
+        
+        # Toolbar
+        toolbar = QHBoxLayout()
+        stop_btn = QPushButton("Stop")
+        restart_btn = QPushButton("Restart")
+        clear_btn = QPushButton("Clear Finished")
+        toolbar.addWidget(stop_btn)
+        toolbar.addWidget(restart_btn)
+        toolbar.addWidget(clear_btn)
+        toolbar.addStretch()
+        
+        # Create splitter
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        
+        self.running_tree = QTreeWidget()
+        self.running_tree.setHeaderLabels([
+            "Project", "Type", "State", "PID", "Started", "Run Time", "Exit Code",
+            "CPU Time", "Peak Memory", "Output", "Trend"
+        ])
+        self.running_tree.setRootIsDecorated(False)
+        self.running_items = {}
+        
+        # Output of the selected run
+        self.output_view = QPlainTextEdit()
+        self.output_view.setReadOnly(True)
+        self.output_view.setMaximumBlockCount(self.OUTPUT_MAX_LINES)
+        self.output_view.setStyleSheet(f"""
+            QPlainTextEdit {{
+                background-color: {self.colors['secondary_bg']};
+                color: {self.colors['text']};
+                border: none;
+                font-family: Consolas, monospace;
+            }}
+        """)
+        self.output_run_id = None
+        self.output_pending_runs = set()
+        self.output_timer = QTimer(self)
+        self.output_timer.setSingleShot(True)
+        self.output_timer.setInterval(self.OUTPUT_FLUSH_MS)
+        self.output_timer.timeout.connect(self.flush_output)
+        
+        splitter.addWidget(self.running_tree)
+        splitter.addWidget(self.output_view)
+        
+        layout.addLayout(toolbar)
+        layout.addWidget(splitter)
+        dock.setWidget(panel)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, dock)
+        
+        # Keep run times of active runs current
+        self.running_timer = QTimer(self)
+        self.running_timer.timeout.connect(self.refresh_running_times)
+        self.running_timer.start(1000)
+        
+        # Connect signals
+        stop_btn.clicked.connect(lambda: self.for_selected_run(self.supervisor.stop))
+        restart_btn.clicked.connect(lambda: self.for_selected_run(self.supervisor.restart))
+        clear_btn.clicked.connect(self.clear_finished_runs)
+        self.running_tree.currentItemChanged.connect(
+            lambda item, previous: self.show_run_output(item.data(0, Qt.ItemDataRole.UserRole) if item else None))
+
+    def for_selected_run(self, action):
+        """Apply a supervisor action to the run selected in the Running panel"""
+        selected_items = self.running_tree.selectedItems()
+        if not selected_items:
+            QMessageBox.warning(self, "Warning", "Please select a run")
+            return
+        action(selected_items[0].data(0, Qt.ItemDataRole.UserRole))
+
+    def update_running_item(self, run_id):
+        """Show the current state of a run in the Running panel"""
+        record = self.supervisor.runs[run_id]
+        item = self.running_items.get(run_id)
+        if item is None:
+            item = QTreeWidgetItem([record.name, self.tabs.tabText(self.tab_index(record.tab_type))])
+            item.setData(0, Qt.ItemDataRole.UserRole, run_id)
+            self.running_tree.insertTopLevelItem(0, item)
+            self.running_items[run_id] = item
+            self.running_tree.setCurrentItem(item)  # Follow the newest run's output
+        
+        item.setText(2, record.state)
+        item.setText(3, str(record.pid or ''))
+        item.setText(4, time.strftime('%H:%M:%S', time.localtime(record.start_time)))
+        item.setText(5, f"{record.duration:.1f}s")
+        item.setText(6, '' if record.exit_code is None else str(record.exit_code))
+        self.set_run_usage(item, record)
+        if record.history is not None:
+            item.setText(10, '; '.join(record.history['flags']))
+            item.setForeground(10, QBrush(QColor(self.colors['highlight'])))
+        
+        colors = {'running': self.colors['accent'], 'failed': '#FF6347', 'crashed': '#FF6347',
+                  'timed out': '#FF6347'}
+        if record.state == 'finished' and record.exit_code:
+            colors['finished'] = self.colors['highlight']
+        item.setForeground(2, QBrush(QColor(colors.get(record.state, self.colors['text']))))
+
+    def schedule_output_flush(self, run_id):
+        """Queue a run's new output for the next frame"""
+        self.output_pending_runs.add(run_id)
+        if not self.output_timer.isActive():
+            self.output_timer.start()
+
+    def flush_output(self):
+        """Append output that arrived since the last frame to the output pane"""
+        for run_id in self.output_pending_runs:
+            record = self.supervisor.runs.get(run_id)
+            if record is None:
+                continue
+            chunks, redraw = record.output.take_pending()
+            if run_id == self.output_run_id:
+                self.append_output(chunks, redraw)
+        self.output_pending_runs.clear()
+
+    def show_run_output(self, run_id):
+        """Show the buffered output of a run in the output pane"""
+        self.output_run_id = run_id
+        record = self.supervisor.runs.get(run_id)
+        if record is None:
+            self.output_view.clear()
+            return
+        record.output.take_pending()  # Everything buffered is drawn now
+        self.append_output(list(record.output.chunks), True)
+
+    def append_output(self, chunks, redraw):
+        """Write output chunks to the pane in one edit, keeping it scrolled to the end if it was"""
+        scrollbar = self.output_view.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        if redraw:
+            self.output_view.clear()
+        
+        stdout_format = QTextCharFormat()
+        stderr_format = QTextCharFormat()
+        stderr_format.setForeground(QBrush(QColor('#FF6347')))
+        
+        cursor = QTextCursor(self.output_view.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for channel, text in chunks:
+            cursor.insertText(text, stderr_format if channel == 'stderr' else stdout_format)
+        cursor.endEditBlock()
+        
+        if at_bottom or redraw:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def refresh_running_times(self):
+        for run_id, item in self.running_items.items():
+            record = self.supervisor.runs[run_id]
+            if record.active:
+                item.setText(5, f"{record.duration:.1f}s")
+                self.set_run_usage(item, record)
+
+    def set_run_usage(self, item, record):
+        item.setText(7, '' if record.cpu_time is None else f"{record.cpu_time:.2f}s")
+        item.setText(8, '' if record.peak_rss is None else format_size(record.peak_rss))
+        item.setText(9, f"{record.output.total_chars} chars")
+
+    def record_run_history(self, run_id):
+        """Store the metrics of a run in the history once it ended"""
+        record = self.supervisor.runs.get(run_id)
+        if record is None or record.active or record.history is not None or record.start_time is None:
+            return
+        try:
+            record.history = self.run_history.add(f"{record.tab_type}/{record.name}", {
+                'time': record.start_time,
+                'wall': round(record.duration, 3),
+                'cpu': None if record.cpu_time is None else round(record.cpu_time, 3),
+                'peak_rss': record.peak_rss,
+                'exit_code': record.exit_code,
+                'output_chars': record.output.total_chars,
+                'state': record.state,
+                'warm': record.started_warm,
+                'setup': bool(record.prepare)
+            })
+            for flag in record.history['flags']:
+                run_log.warning("Regression in %s: %s", record.name, flag)
+        except Exception as e:
+            record.history = {'flags': []}
+            run_log.error("Error recording run history: %s", e)
+
+    def clear_finished_runs(self):
+        """Remove runs that are no longer active from the Running panel"""
+        for run_id in list(self.running_items):
+            if not self.supervisor.runs[run_id].active:
+                item = self.running_items.pop(run_id)
+                self.running_tree.takeTopLevelItem(self.running_tree.indexOfTopLevelItem(item))
+                del self.supervisor.runs[run_id]
+                if run_id == self.output_run_id:
+                    self.show_run_output(None)
+
+    def create_queue_panel(self):
+        """Create the dock listing queued project runs, tabbed with the Running panel"""
+        dock = QDockWidget("Run Queue", self)
+        dock.setObjectName("queue_dock")
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
+        
+        # Toolbar
+        toolbar = QHBoxLayout()
+        parallel_spin = QSpinBox()
+        parallel_spin.setRange(1, 16)
+        parallel_spin.setValue(self.run_queue.max_parallel)
+        pause_btn = QPushButton("Pause")
+        pause_btn.setCheckable(True)
+        remove_btn = QPushButton("Remove")
+        clear_btn = QPushButton("Clear Done")
+        toolbar.addWidget(QLabel("Max parallel:"))
+        toolbar.addWidget(parallel_spin)
+        toolbar.addWidget(pause_btn)
+        toolbar.addWidget(remove_btn)
+        toolbar.addWidget(clear_btn)
+        toolbar.addStretch()
+        
+        self.queue_tree = QTreeWidget()
+        self.queue_tree.setHeaderLabels(["#", "Project", "Type", "Arguments", "After", "Timeout", "State"])
+        self.queue_tree.setRootIsDecorated(False)
+        self.queue_items = {}
+        
+        layout.addLayout(toolbar)
+        layout.addWidget(self.queue_tree)
+        dock.setWidget(panel)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, dock)
+        self.tabifyDockWidget(self.running_dock, dock)
+        self.running_dock.raise_()
+        
+        # Connect signals
+        parallel_spin.valueChanged.connect(self.set_queue_parallelism)
+        pause_btn.toggled.connect(self.run_queue.set_paused)
+        remove_btn.clicked.connect(self.remove_queue_job)
+        clear_btn.clicked.connect(self.clear_done_jobs)
+        self.queue_tree.itemDoubleClicked.connect(lambda item, column: self.show_queue_job_run(item))
+
+    def set_queue_parallelism(self, max_parallel):
+        self.run_queue.set_max_parallel(max_parallel)
+        self.settings.setValue('queue_max_parallel', max_parallel)
+
+    def update_queue_item(self, job_id):
+        """Show the current state of a queue job in the Run Queue panel"""
+        job = self.run_queue.jobs[job_id]
+        item = self.queue_items.get(job_id)
+        if item is None:
+            item = QTreeWidgetItem([
+                str(job.job_id), job.name, self.tabs.tabText(self.tab_index(job.tab_type)),
+                ' '.join(job.args), ', '.join(map(str, job.depends_on)),
+                f"{job.timeout}s" if job.timeout else ''
+            ])
+            item.setData(0, Qt.ItemDataRole.UserRole, job_id)
+            self.queue_tree.addTopLevelItem(item)
+            self.queue_items[job_id] = item
+        
+        item.setText(6, job.state)
+        item.setToolTip(6, job.error or '')
+        colors = {'running': self.colors['accent'], 'failed': '#FF6347', 'timed out': '#FF6347',
+                  'skipped': self.colors['secondary_text']}
+        item.setForeground(6, QBrush(QColor(colors.get(job.state, self.colors['text']))))
+
+    def remove_queue_job(self):
+        """Remove the selected job from the run queue"""
+        selected_items = self.queue_tree.selectedItems()
+        if not selected_items:
+            QMessageBox.warning(self, "Warning", "Please select a queued job")
+            return
+        job_id = selected_items[0].data(0, Qt.ItemDataRole.UserRole)
+        if not self.run_queue.remove(job_id):
+            QMessageBox.warning(self, "Warning", "Stop the job's run in the Running panel before removing it")
+            return
+        self.queue_tree.takeTopLevelItem(self.queue_tree.indexOfTopLevelItem(self.queue_items.pop(job_id)))
+        for other in self.run_queue.jobs.values():
+            self.queue_items[other.job_id].setText(4, ', '.join(map(str, other.depends_on)))
+
+    def clear_done_jobs(self):
+        """Remove jobs that have ended from the Run Queue panel"""
+        for job_id, job in list(self.run_queue.jobs.items()):
+            # Keep ended jobs that queued jobs still wait on
+            waited_on = any(job_id in other.depends_on for other in self.run_queue.jobs.values() if other.pending)
+            if not job.pending and not waited_on:
+                self.run_queue.remove(job_id)
+                self.queue_tree.takeTopLevelItem(self.queue_tree.indexOfTopLevelItem(self.queue_items.pop(job_id)))
+
+    def show_queue_job_run(self, item):
+        """Select a queue job's run in the Running panel"""
+        job = self.run_queue.jobs.get(item.data(0, Qt.ItemDataRole.UserRole))
+        run_item = self.running_items.get(job.run_id) if job else None
+        if run_item is not None:
+            self.running_tree.setCurrentItem(run_item)
+            self.running_dock.raise_()
 
-## Support
-For issues, suggestions, or contributions, please contact Chris Loetz.
-"""
-        readme_text.setMarkdown(readme_content)
+    def create_tests_panel(self):
+        """Create the dock showing test results, tabbed with the Running panel"""
+        dock = QDockWidget("Tests", self)
+        dock.setObjectName("tests_dock")
+        self.tests_dock = dock
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
         
-        # Add to layout
-        layout.addWidget(readme_text)
+        # Toolbar
+        toolbar = QHBoxLayout()
+        parallel_spin = QSpinBox()
+        parallel_spin.setRange(1, 32)
+        parallel_spin.setValue(self.settings.value('test_max_parallel', os.cpu_count() or 2, type=int))
+        self.rerun_failed_btn = QPushButton("Rerun Failed")
+        self.stop_tests_btn = QPushButton("Stop")
+        clear_btn = QPushButton("Clear")
+        self.tests_summary = QLabel("")
+        toolbar.addWidget(QLabel("Max parallel:"))
+        toolbar.addWidget(parallel_spin)
+        toolbar.addWidget(self.rerun_failed_btn)
+        toolbar.addWidget(self.stop_tests_btn)
+        toolbar.addWidget(clear_btn)
+        toolbar.addWidget(self.tests_summary)
+        toolbar.addStretch()
         
-        # Style the text editor
-        readme_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {self.colors['secondary_bg']};
-                color: {self.colors['text']};
-                border: none;
-                padding: 15px;
-                font-size: 14px;
-            }}
-        """)
+        # Create splitter
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        
+        self.tests_tree = QTreeWidget()
+        self.tests_tree.setHeaderLabels(["Test", "Result", "Time"])
+        self.test_project_items = {}  # project_dir -> item
+        self.test_items = {}  # (project_dir, test id) -> item
+        self.test_results = {}  # (project_dir, test id) -> latest result
+        
+        # Traceback of the selected test
+        self.test_message_view = QPlainTextEdit()
+        self.test_message_view.setReadOnly(True)
+        
+        splitter.addWidget(self.tests_tree)
+        splitter.addWidget(self.test_message_view)
+        splitter.setSizes([500, 400])
+        layout.addLayout(toolbar)
+        layout.addWidget(splitter)
+        dock.setWidget(panel)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, dock)
+        self.tabifyDockWidget(self.running_dock, dock)
+        self.running_dock.raise_()
+        self.update_test_controls()
         
-        self.tabs.addTab(tab, "README")
+        # Connect signals
+        parallel_spin.valueChanged.connect(lambda value: self.settings.setValue('test_max_parallel', value))
+        self.rerun_failed_btn.clicked.connect(self.rerun_failed_tests)
+        self.stop_tests_btn.clicked.connect(lambda: self.test_session.stop() if self.test_session else None)
+        clear_btn.clicked.connect(self.clear_test_results)
+        self.tests_tree.currentItemChanged.connect(self.show_test_message)
+
+    def update_test_controls(self):
+        active = self.test_session is not None and self.test_session.active
+        self.stop_tests_btn.setEnabled(active)
+        self.rerun_failed_btn.setEnabled(not active and any(
+            result['outcome'] in ('failed', 'error') for result in self.test_results.values()))
+
+    def tab_index(self, tab_type):
+        """Return the tab index showing a project type"""
+        page = self.tab_pages.get(tab_type)
+        return self.tabs.indexOf(page) if page is not None else -1
+
+    def add_lazy_tab(self, tab_type, title, builder, icon=None):
+        """Add an empty tab page that its create method fills in when the tab is first shown"""
+        page = QWidget()
+        self.tab_pages[tab_type] = page
+        self.tab_builders[page] = builder
+        if icon is not None:
+            self.tabs.addTab(page, icon, title)
+        else:
+            self.tabs.addTab(page, title)
 
+    def build_tab(self, index):
+        """Build a tab's widgets and scan its projects if it was not shown before"""
+        builder = self.tab_builders.pop(self.tabs.widget(index), None)
+        if builder is not None:
+            builder()
+
+    def on_tab_changed(self, index):
+        self.build_tab(index)
+        for tab_type, page in self.tab_pages.items():
+            if page is self.tabs.widget(index):
+                self.settings.setValue('last_tab', tab_type)
+
+    @traced(describe=lambda self, tree, directory: {'directory': directory})
     def load_projects(self, tree, directory):
         """Load projects from directory into tree widget with color coding"""
         try:
@@ -647,8 +2250,13 @@ For issues, suggestions, or contributions, please contact Chris Loetz.
             # Enable selection
             tree.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
             
+            # Check Python projects in the background
+            for tab_type in self.python_tabs:
+                if self.dirs[tab_type] == directory:
+                    self.start_static_checks(tab_type)
+            
         except Exception as e:
-            print(f"Error loading projects: {e}")
+            tabs_log.error("Error loading projects: %s", e)
 
     def browse_directory(self, tab_type):
         """Open directory browser dialog with multi-selection"""
@@ -678,9 +2286,10 @@ For issues, suggestions, or contributions, please contact Chris Loetz.
             tree = getattr(self, f'{tab_type}_tree')
             self.load_projects(tree, self.dirs[tab_type])
 
+    @traced(describe=lambda self, tab_type: {'tab_type': tab_type})
     def move_selected_to_projects(self, tab_type):
         """Move all external items (gray background) to projects directory"""
-        print("Starting move operation...")
+        files_log.debug("Starting move operation...")
         tree = getattr(self, f'{tab_type}_tree')
         
         # Get all items in the tree
@@ -735,25 +2344,22 @@ For issues, suggestions, or contributions, please contact Chris Loetz.
                     
                     # Move the file or directory
                     try:
-                        if os.path.isdir(source_path):
-                            shutil.copytree(source_path, destination)
-                            shutil.rmtree(source_path)
-                        else:
-                            shutil.move(source_path, destination)
+                        move_into_workspace(source_path, destination)
                         moved_count += 1
-                        print(f"Successfully moved {item.text(0)}")
+                        files_log.info("Moved %s", source_path)
+                        self.after_import(tab_type, destination)
                     except Exception as e:
-                        print(f"Error moving {item.text(0)}: {e}")
+                        files_log.error("Error moving %s: %s", source_path, e)
                         QMessageBox.warning(
                             self,
                             "Move Error",
                             f"Failed to move {item.text(0)}: {str(e)}"
                         )
                 else:
-                    print(f"Source path doesn't exist: {source_path}")
+                    files_log.warning("Source path doesn't exist: %s", source_path)
             
             except Exception as e:
-                print(f"Error processing item {item.text(0)}: {str(e)}")
+                files_log.error("Error processing item %s: %s", item.text(0), e)
                 continue
         
         # Update browsed paths
@@ -774,30 +2380,20 @@ For issues, suggestions, or contributions, please contact Chris Loetz.
                 f"Successfully moved {moved_count} item{'s' if moved_count > 1 else ''}"
             )
         
-        print("Move operation complete")
+        files_log.debug("Move operation complete")
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter events"""
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
 
+    @traced()
     def dropEvent(self, event: QDropEvent):
         """Handle drop events"""
-        current_tab_index = self.tabs.currentIndex()
-        tab_text = self.tabs.tabText(current_tab_index).lower()
-        
-        # Map tab text to directory type
-        tab_map = {
-            'html': 'html',
-            'chrome extensions': 'chrome',
-            'python scripts': 'scripts',
-            'python apps': 'apps',
-            'batch scripts': 'batch',
-            'powershell apps': 'powershell'
-        }
-        
-        target_type = tab_map.get(tab_text)
-        if not target_type:
+        # Drop into the project type of the current tab
+        current_page = self.tabs.currentWidget()
+        target_type = next((tab_type for tab_type, page in self.tab_pages.items() if page is current_page), None)
+        if target_type not in self.project_types:
             return
             
         # Process dropped items
@@ -806,7 +2402,9 @@ For issues, suggestions, or contributions, please contact Chris Loetz.
             if os.path.exists(source_path):
                 try:
                     destination = os.path.join(self.dirs[target_type], os.path.basename(source_path))
-                    shutil.move(source_path, destination)
+                    move_into_workspace(source_path, destination)
+                    files_log.info("Moved %s", source_path)
+                    self.after_import(target_type, destination)
                     
                     # Refresh the current tree
                     tree = getattr(self, f'{target_type}_tree')
@@ -817,17 +2415,33 @@ For issues, suggestions, or contributions, please contact Chris Loetz.
                 except Exception as e:
                     QMessageBox.warning(self, "Error", f"Failed to move item: {str(e)}")
 
+    @traced(describe=lambda self, filename, tab_type: {'file': filename, 'tab_type': tab_type})
     def load_file(self, filename, tab_type):
-        """Load file content into editor"""
+        """Schedule loading file content into editor (debounced)"""
+        # Invalidate any pending or in-flight load for this tab
+        self.preview_generation[tab_type] = self.preview_generation.get(tab_type, 0) + 1
+        if tab_type in self.preview_cancel:
+            self.preview_cancel[tab_type].set()
+        
+        timer = self.preview_timers.get(tab_type)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(self.PREVIEW_DEBOUNCE_MS)
+            timer.timeout.connect(lambda: self.start_preview_load(tab_type))
+            self.preview_timers[tab_type] = timer
+        timer.start()
+
+    @traced(describe=lambda self, tab_type: {'tab_type': tab_type})
+    def start_preview_load(self, tab_type):
+        """Start reading the selected item on the preview thread pool"""
         try:
-            print(f"Loading file: {filename} for tab: {tab_type}")
             tree = getattr(self, f'{tab_type}_tree')
-            editor = getattr(self, f'{tab_type}_editor')
             
             # Get selected item
             selected_items = tree.selectedItems()
             if not selected_items:
-                print("No item selected")
+                preview_log.debug("No item selected")
                 return
                 
             item = selected_items[0]
@@ -838,376 +2452,1023 @@ For issues, suggestions, or contributions, please contact Chris Loetz.
                 file_path = item.data(0, Qt.ItemDataRole.UserRole)
             else:
                 # Item from workspace
-                file_path = os.path.join(self.dirs[tab_type], filename)
+                file_path = os.path.join(self.dirs[tab_type], item.text(0))
             
-            print(f"File path: {file_path}")
-            
-            # Check if path exists
-            if not os.path.exists(file_path):
-                print(f"File not found: {file_path}")
-                return
-            
-            # Check if it's a directory
-            if os.path.isdir(file_path):
-                print("Selected item is a directory")
-                editor.clear()
-                return
+            preview_log.debug("Loading file: %s for tab: %s", file_path, tab_type)
             
-            # Load file content
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                editor.setText(content)
-                print("File loaded successfully")
+            cancel_event = threading.Event()
+            self.preview_cancel[tab_type] = cancel_event
+            self.preview_pool.start(PreviewLoadTask(
+                self.preview_signals, tab_type, self.preview_generation[tab_type],
+                file_path, cancel_event, self.folder_summary_cache))
                 
         except Exception as e:
-            print(f"Error loading file: {e}")
+            preview_log.error("Error loading file: %s", e)
             QMessageBox.warning(self, "Error", f"Error loading file: {str(e)}")
 
-    def run_html_file(self):
-        """Run HTML file in default browser"""
-        try:
-            tree = self.html_tree
-            selected_items = tree.selectedItems()
-            
-            if not selected_items:
-                QMessageBox.warning(self, "Warning", "Please select a project to run")
-                return
-            
-            item = selected_items[0]
-            if item.background(0).color().name() == '#808080':
-                path = item.data(0, Qt.ItemDataRole.UserRole)
+    @traced(describe=lambda self, tab_type, generation, kind, file_path, payload: {'path': file_path})
+    def apply_preview(self, tab_type, generation, kind, file_path, payload):
+        """Show a finished preview load, unless a newer selection superseded it"""
+        if generation != self.preview_generation.get(tab_type):
+            return
+        
+        editor = getattr(self, f'{tab_type}_editor')
+        stack = getattr(self, f'{tab_type}_editor_stack')
+        if kind == 'missing':
+            preview_log.warning("File not found: %s", file_path)
+        elif kind == 'dir':
+            preview_log.debug("Selected item is a directory")
+            self.journal_editor(tab_type, force=True)
+            editor.clear()
+            editor.document().setModified(False)
+            self.editor_paths[tab_type] = None
+            self.refresh_outline(tab_type)
+            if payload is not None:
+                summary_view = getattr(self, f'{tab_type}_summary')
+                summary_view.setHtml(self.format_folder_summary(file_path, payload))
+                stack.setCurrentWidget(summary_view)
+        elif kind == 'error':
+            preview_log.error("Error loading file: %s", payload)
+            QMessageBox.warning(self, "Error", f"Error loading file: {payload}")
+        else:
+            self.journal_editor(tab_type, force=True)
+            editor.setPlainText(payload)
+            editor.document().setModified(False)
+            self.editor_paths[tab_type] = file_path
+            stack.setCurrentWidget(editor)
+            self.refresh_outline(tab_type, payload)
+            preview_log.debug("File loaded successfully")
+
+    def refresh_outline(self, tab_type, source=None):
+        """Rebuild a tab's outline from the file just loaded or the edited buffer"""
+        outline = getattr(self, f'{tab_type}_outline', None)
+        if outline is None:
+            return
+        
+        self.outline_generation[tab_type] = self.outline_generation.get(tab_type, 0) + 1
+        file_path = self.editor_paths.get(tab_type)
+        if not file_path or not file_path.endswith(('.py', '.pyw')):
+            outline.clear()
+            outline.setHeaderLabels(["Outline"])
+            return
+        
+        editor = getattr(self, f'{tab_type}_editor')
+        if source is None:
+            if not editor.document().isModified():
+                return  # Buffer matches the file the outline came from
+            source, file_path = editor.toPlainText(), None
+        
+        self.outline_pool.start(OutlineTask(
+            self.outline_signals, self.outline_builder, self.outline_cache,
+            tab_type, self.outline_generation[tab_type], source, file_path))
+
+    def apply_outline(self, tab_type, generation, entries, error):
+        """Show a finished outline, unless the editor changed since it was requested"""
+        if generation != self.outline_generation.get(tab_type):
+            return
+        
+        outline = getattr(self, f'{tab_type}_outline')
+        if entries is None:
+            # Keep the last good outline while the buffer doesn't parse
+            outline.setHeaderLabels([f"Outline ({error})"])
+            return
+        
+        outline.clear()
+        outline.setHeaderLabels(["Outline"])
+        parents = []
+        for kind, name, lineno, depth in entries:
+            del parents[depth:]
+            label = f"{name}()" if kind != 'class' else name
+            item = QTreeWidgetItem([label])
+            item.setData(0, Qt.ItemDataRole.UserRole, lineno)
+            item.setToolTip(0, f"{kind} {name}, line {lineno}")
+            if kind == 'class':
+                item.setForeground(0, QBrush(QColor(self.colors['highlight'])))
+            if parents:
+                parents[-1].addChild(item)
             else:
-                path = os.path.join(self.dirs['html'], item.text(0))
+                outline.addTopLevelItem(item)
+            parents.append(item)
+        outline.expandAll()
+
+    def jump_to_line(self, tab_type, lineno):
+        """Move the editor cursor to a line and scroll it into view"""
+        if not lineno:
+            return
+        editor = getattr(self, f'{tab_type}_editor')
+        block = editor.document().findBlockByLineNumber(lineno - 1)
+        cursor = editor.textCursor()
+        cursor.setPosition(block.position())
+        editor.setTextCursor(cursor)
+        editor.ensureCursorVisible()
+        editor.setFocus()
+
+    def item_path(self, item, tab_type):
+        """Return the full path of a tree item"""
+        if item.background(0).color().name() == '#808080':
+            # Item from browsed directory
+            return item.data(0, Qt.ItemDataRole.UserRole)
+        return os.path.join(self.dirs[tab_type], item.text(0))
+
+    def start_static_checks(self, tab_type):
+        """Queue a static check pass over the projects shown in a tab"""
+        tree = getattr(self, f'{tab_type}_tree', None)
+        if tree is None:
+            return
+        
+        root = tree.invisibleRootItem()
+        projects = [self.item_path(root.child(i), tab_type) for i in range(root.childCount())]
+        self.check_pool.start(StaticCheckPass(
+            self.check_signals, self.process_executor(), self.check_file_hashes,
+            self.check_results, tab_type, projects))
+
+    def process_executor(self):
+        """Return the process pool for CPU-bound background work, creating it on first use"""
+        if self.check_executor is None:
+            # Spawned workers don't inherit the Qt process state, and run
+            # devspace_core rather than this module so they never import Qt
+            self.check_executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max(1, min(4, (os.cpu_count() or 2) - 1)),
+                mp_context=CoreSpawnContext()
+            )
+        return self.check_executor
+
+    def start_precompile(self, projects):
+        """Byte-compile the stale Python files of some projects in the background"""
+        self.check_pool.start(PrecompilePass(self.process_executor(), projects))
+
+    def after_import(self, tab_type, destination):
+        """Run optional post-import steps for a project moved into the workspace"""
+        if tab_type in self.python_tabs and self.settings.value('precompile_on_import', False, type=bool):
+            self.start_precompile([destination])
+
+    def set_precompile_on_import(self, enabled):
+        self.settings.setValue('precompile_on_import', enabled)
+
+    def apply_check_results(self, tab_type, results):
+        """Badge tree items whose projects have static check findings"""
+        tree = getattr(self, f'{tab_type}_tree')
+        root = tree.invisibleRootItem()
+        for i in range(root.childCount()):
+            item = root.child(i)
+            diagnostics = results.get(self.item_path(item, tab_type))
+            if diagnostics is None:
+                continue  # Item added after the pass started
             
-            # Look for index.html in the folder
-            if os.path.isdir(path):
-                index_path = os.path.join(path, 'index.html')
-                if os.path.exists(index_path):
-                    os.startfile(index_path)
-                else:
-                    QMessageBox.warning(self, "Error", "No index.html file found in the selected folder")
+            if diagnostics:
+                item.setIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxWarning))
+                lines = [f"{path}:{lineno}: {code} {message}" for path, lineno, code, message in diagnostics[:10]]
+                if len(diagnostics) > 10:
+                    lines.append(f"... and {len(diagnostics) - 10} more")
+                item.setToolTip(0, "\n".join(lines))
             else:
-                QMessageBox.warning(self, "Error", "Please select a folder")
+                path = self.item_path(item, tab_type)
+                icon = QStyle.StandardPixmap.SP_DirIcon if os.path.isdir(path) else QStyle.StandardPixmap.SP_FileIcon
+                item.setIcon(0, self.style().standardIcon(icon))
+                item.setToolTip(0, "")
+
+    def save_file(self, tab_type):
+        """Save the editor content back to its file"""
+        try:
+            editor = getattr(self, f'{tab_type}_editor')
+            file_path = self.editor_paths.get(tab_type)
+            if not file_path:
+                file_path, _ = QFileDialog.getSaveFileName(self, "Save File", self.dirs[tab_type])
+                if not file_path:
+                    return
+            
+            with open(file_path, 'w', encoding='utf-8') as file:
+                file.write(editor.toPlainText())
+            
+            # Saved content no longer needs a recovery entry
+            journal_key = self.journal_key(tab_type)
+            editor.document().setModified(False)
+            self.editor_paths[tab_type] = file_path
+            self.discard_journal_entry(journal_key)
+            if tab_type in self.python_tabs:
+                self.start_static_checks(tab_type)
+            if tab_type in self.python_tabs and file_path.endswith('.py') \
+                    and self.settings.value('precompile_on_import', False, type=bool):
+                self.start_precompile([os.path.dirname(file_path)])
+            files_log.info("Saved file: %s", file_path)
         
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to run HTML file: {str(e)}")
+            files_log.error("Error saving file: %s", e)
+            QMessageBox.warning(self, "Error", f"Error saving file: {str(e)}")
 
-    def run_chrome_extension(self):
-        """Run Chrome Extension (placeholder)"""
-        QMessageBox.information(
-            self,
-            "Not Implemented",
-            "Chrome Extension running functionality will be implemented in a future update."
-        )
+    def journal_key(self, tab_type):
+        """Return the journal entry name for the document open in a tab"""
+        file_path = self.editor_paths.get(tab_type)
+        if file_path:
+            return hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+        return f"untitled-{tab_type}"
 
-    def run_python_script(self):
-        """Run Python script in a separate process"""
+    def journal_editor(self, tab_type, force=False):
+        """Snapshot a tab's editor into the journal if it changed since the last snapshot"""
+        editor = getattr(self, f'{tab_type}_editor', None)
+        if editor is None:
+            return False
+        
+        document = editor.document()
+        if not document.isModified():
+            return False
+        key = self.journal_key(tab_type)
+        revision = document.revision()
+        if self.journal_revisions.get(key) == revision:
+            return False
+        
+        # Rate limit snapshots per document, more strictly for large ones
+        now = time.monotonic()
+        if not force:
+            gap = (self.AUTOSAVE_LARGE_DOC_GAP
+                   if document.characterCount() > self.AUTOSAVE_LARGE_DOC_CHARS
+                   else self.AUTOSAVE_MIN_GAP)
+            if now - self.journal_times.get(key, 0) < gap:
+                return False
+        
+        record = {
+            'tab_type': tab_type,
+            'path': self.editor_paths.get(tab_type),
+            'saved_at': time.time(),
+            'text': editor.toPlainText()
+        }
+        self.journal_revisions[key] = revision
+        self.journal_times[key] = now
+        self.journal_pool.start(JournalWriteTask(os.path.join(self.recovery_dir, key + '.json'), record))
+        return True
+
+    def discard_journal_entry(self, key):
+        """Remove a document's journal entry"""
+        self.journal_revisions.pop(key, None)
+        self.journal_times.pop(key, None)
+        self.journal_pool.start(JournalWriteTask(os.path.join(self.recovery_dir, key + '.json')))
+
+    def autosave_tick(self):
+        """Journal changed editors, staying within the per-pass GUI time budget"""
+        start = time.perf_counter()
+        for tab_type in self.dirs:
+            if (time.perf_counter() - start) * 1000 > self.AUTOSAVE_BUDGET_MS:
+                break  # Remaining editors are picked up on the next pass
+            try:
+                self.journal_editor(tab_type)
+            except Exception as e:
+                journal_log.error("Error autosaving %s: %s", tab_type, e)
+
+    def offer_recovery(self):
+        """Offer to restore buffers journaled by a session that did not save them"""
         try:
-            print("Starting Python script runner...")
-            tree = self.scripts_tree
-            selected_items = tree.selectedItems()
+            entries = []
+            for name in os.listdir(self.recovery_dir):
+                if not name.endswith('.json'):
+                    continue
+                entry_path = os.path.join(self.recovery_dir, name)
+                try:
+                    with open(entry_path, 'r', encoding='utf-8') as f:
+                        entries.append((entry_path, json.load(f)))
+                except (OSError, ValueError):
+                    os.remove(entry_path)  # Unreadable entry, nothing to recover
             
-            if not selected_items:
-                QMessageBox.warning(self, "Warning", "Please select a folder to run")
+            if not entries:
                 return
             
-            item = selected_items[0]
-            print(f"Selected item: {item.text(0)}")
-            
-            if item.background(0).color().name() == '#808080':
-                path = item.data(0, Qt.ItemDataRole.UserRole)
-            else:
-                path = os.path.join(self.dirs['scripts'], item.text(0))
+            response = QMessageBox.question(
+                self,
+                "Recover Unsaved Changes",
+                f"Found unsaved changes to {len(entries)} document(s) from a previous session.\n"
+                "Restore them as .recovered copies next to the original files?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
             
-            print(f"Path to check: {path}")
+            restored = []
+            for entry_path, record in entries:
+                if response == QMessageBox.StandardButton.Yes:
+                    original = record.get('path')
+                    if not original:
+                        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(record.get('saved_at', time.time())))
+                        original = os.path.join(self.dirs.get(record.get('tab_type'), self.workspace_dir),
+                                                f"Recovered-{stamp}.txt")
+                    recovered_path = original + '.recovered'
+                    with open(recovered_path, 'w', encoding='utf-8') as f:
+                        f.write(record.get('text', ''))
+                    restored.append(recovered_path)
+                os.remove(entry_path)
             
-            # Find and run .py file in the folder
-            if os.path.isdir(path):
-                print("Path is a directory, searching for files...")
-                py_files = [f for f in os.listdir(path) if f.endswith('.py')]
-                print(f"Found PY files: {py_files}")
-                
-                if py_files:
-                    script_path = os.path.join(path, py_files[0])
-                    print(f"Running Python file: {script_path}")
-                    
-                    # Modified batch file creation to hide window
-                    batch_path = os.path.join(path, "_temp_run.bat")
-                    with open(batch_path, 'w') as f:
-                        f.write('@echo off\n')
-                        f.write('if "%PROCESSOR_ARCHITECTURE%"=="x86" pythonw "%~dp0%1"\n')
-                        f.write('if "%PROCESSOR_ARCHITECTURE%"=="AMD64" pythonw "%~dp0%1"\n')
-                        f.write('exit\n')
-                    
-                    # Run the batch file with hidden window
-                    startupinfo = subprocess.STARTUPINFO()
-                    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                    startupinfo.wShowWindow = subprocess.SW_HIDE
-                    
-                    subprocess.Popen(batch_path, 
-                                  startupinfo=startupinfo,
-                                  creationflags=subprocess.CREATE_NO_WINDOW,
-                                  cwd=os.path.dirname(script_path))
-                    
-                    # Clean up the temp batch file after a short delay
-                    def cleanup():
-                        time.sleep(2)  # Wait 2 seconds
-                        try:
-                            os.remove(batch_path)
-                        except:
-                            pass
-                    
-                    threading.Thread(target=cleanup).start()
-                    
-                else:
-                    print("No suitable files found")
-                    QMessageBox.warning(
-                        self, 
-                        "Error", 
-                        "No suitable files found in the selected folder.\nSearched for: .py"
-                    )
-            else:
-                print("Selected item is not a directory")
-                QMessageBox.warning(self, "Error", "Please select a folder")
+            if restored:
+                QMessageBox.information(
+                    self,
+                    "Recovered",
+                    "Restored unsaved changes to:\n" + "\n".join(restored)
+                )
         
         except Exception as e:
-            print(f"Error running Python script: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to run Python script: {str(e)}")
+            journal_log.error("Error recovering autosave journal: %s", e)
+            QMessageBox.warning(self, "Error", f"Error recovering unsaved changes: {str(e)}")
+
+    def closeEvent(self, event):
+        """Flush the autosave journal and stop runs before closing"""
+        active_runs = self.supervisor.active_runs()
+        if active_runs:
+            response = QMessageBox.question(
+                self,
+                "Confirm Exit",
+                f"{len(active_runs)} project run(s) are still active. Stop them and exit?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if response == QMessageBox.StandardButton.No:
+                event.ignore()
+                return
+            self.run_queue.set_paused(True)  # Nothing new may start while runs stop
+            self.watch_restarts.clear()
+            self.supervisor.stop_all()
+        
+        for tab_type in self.dirs:
+            try:
+                self.journal_editor(tab_type, force=True)
+            except Exception as e:
+                journal_log.error("Error autosaving %s: %s", tab_type, e)
+        self.journal_pool.waitForDone()
+        for watcher in self.watchers.values():
+            watcher.stop()
+        for path in list(self.html_servers):
+            self.stop_html_server(path)
+        self.supervisor.set_warm_pool(False)
+        if self.test_session is not None and self.test_session.active:
+            self.test_session.stop()
+        self.run_logs.stop()
+        if self.check_executor is not None:
+            self.check_executor.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
+
+    def format_folder_summary(self, path, summary):
+        """Render a folder summary as HTML for the summary view"""
+        languages = sorted(summary['languages'].items(), key=lambda pair: -pair[1])
+        language_text = ', '.join(f"{name} ({count})" for name, count in languages) or 'None detected'
+        modified = (time.strftime('%Y-%m-%d %H:%M', time.localtime(summary['modified']))
+                    if summary['modified'] else 'Unknown')
+        file_count = f"{summary['files']}{'+' if summary['truncated'] else ''}"
+        
+        rows = [
+            ('Files', f"{file_count} in {summary['folders'] + 1} folder(s)"),
+            ('Total size', format_size(summary['size'])),
+            ('Languages', language_text),
+            ('Entry point', summary['entry_point'] or 'Not detected'),
+            ('Last modified', modified),
+        ]
+        
+        parts = [
+            f"<h2 style=\"color: {self.colors['highlight']};\">{html.escape(os.path.basename(path))}</h2>",
+            "<table cellpadding=\"4\">"
+        ]
+        for label, value in rows:
+            parts.append(
+                f"<tr><td style=\"color: {self.colors['secondary_text']};\">{label}</td>"
+                f"<td>{html.escape(str(value))}</td></tr>"
+            )
+        parts.append("</table>")
+        if summary['readme']:
+            parts.append(f"<h3 style=\"color: {self.colors['accent']};\">README</h3>")
+            parts.append(f"<pre style=\"white-space: pre-wrap;\">{html.escape(summary['readme'])}</pre>")
+        return ''.join(parts)
 
-    def run_python_app(self):
-        """Run Python application in a separate process"""
+    @traced(describe=lambda self, tab_type: {'tab_type': tab_type})
+    def run_project(self, tab_type):
+        """Run the selected project the way its type runs: launch, serve or package it"""
+        project_type = self.project_types[tab_type]
         try:
-            print("Starting Python app runner...")
-            tree = self.apps_tree
-            selected_items = tree.selectedItems()
-            
+            selected_items = getattr(self, f'{tab_type}_tree').selectedItems()
             if not selected_items:
-                QMessageBox.warning(self, "Warning", "Please select a folder to run")
+                QMessageBox.warning(self, "Warning", "Please select a project to run")
                 return
             
-            item = selected_items[0]
-            print(f"Selected item: {item.text(0)}")
-            
-            if item.background(0).color().name() == '#808080':
-                path = item.data(0, Qt.ItemDataRole.UserRole)
-            else:
-                path = os.path.join(self.dirs['apps'], item.text(0))
-            
-            print(f"Path to check: {path}")
+            path = self.item_path(selected_items[0], tab_type)
+            if not os.path.isdir(path):
+                QMessageBox.warning(self, "Error", "Please select a folder")
+                return
             
-            # Find and run .py file in the folder
-            if os.path.isdir(path):
-                print("Path is a directory, searching for files...")
-                py_files = [f for f in os.listdir(path) if f.endswith('.py')]
-                print(f"Found PY files: {py_files}")
-                
-                if py_files:
-                    script_path = os.path.join(path, py_files[0])
-                    print(f"Running Python file: {script_path}")
-                    
-                    # Modified command file creation to hide window
-                    cmd_path = os.path.join(path, "_temp_run.cmd")
-                    with open(cmd_path, 'w') as f:
-                        f.write('@echo off\n')
-                        f.write(f'pythonw -m pip install PyGithub PyQt5 > nul\n')
-                        f.write(f'pythonw "{script_path}"\n')
-                    
-                    # Run with hidden window
-                    startupinfo = subprocess.STARTUPINFO()
-                    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                    startupinfo.wShowWindow = subprocess.SW_HIDE
-                    
-                    subprocess.Popen(
-                        ['cmd', '/C', cmd_path],
-                        startupinfo=startupinfo,
-                        creationflags=subprocess.CREATE_NO_WINDOW,
-                        cwd=os.path.dirname(script_path),
-                        env=dict(os.environ, PYTHONIOENCODING='utf-8')
-                    )
-                    
-                    # Clean up the temp files after a delay
-                    def cleanup():
-                        time.sleep(5)
-                        try:
-                            if os.path.exists(cmd_path):
-                                os.remove(cmd_path)
-                            if os.path.exists(wrapper_path):
-                                os.remove(wrapper_path)
-                        except:
-                            pass
-                    
-                    threading.Thread(target=cleanup).start()
-                    
+            if project_type.runner == 'browser':
+                # Serve the folder and open its index.html
+                if os.path.exists(os.path.join(path, 'index.html')):
+                    webbrowser.open(self.serve_html_project(tab_type, path))
                 else:
-                    print("No suitable files found")
-                    QMessageBox.warning(
-                        self, 
-                        "Error", 
-                        "No suitable files found in the selected folder.\nSearched for: .py"
-                    )
-            else:
-                print("Selected item is not a directory")
-                QMessageBox.warning(self, "Error", "Please select a folder")
+                    QMessageBox.warning(self, "Error", "No index.html file found in the selected folder")
+            elif project_type.runner == 'package':
+                packaging_log.info("Packaging %s project: %s", project_type.title, path)
+                self.package_pool.start(PackageTask(self.package_signals, self.packager, path, self.packages_dir))
+            elif self.launch_project(tab_type, path, warm=project_type.fast_run and self.fast_run) is None:
+                QMessageBox.warning(
+                    self,
+                    "Error",
+                    f"No suitable files found in the selected folder.\nSearched for: {', '.join(project_type.entry_extensions)}"
+                )
         
         except Exception as e:
-            print(f"Error running Python app: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to run Python app: {str(e)}")
+            run_log.error("Error running %s project: %s", project_type.title, e)
+            QMessageBox.warning(self, "Error", f"Failed to run {project_type.title} project: {str(e)}")
 
-    def run_python_app_direct(self, script_path):
-        """Direct execution fallback for Python apps"""
+    def new_file(self, tab_type):
+        """Create a project folder, with its type's starter file, in the workspace"""
+        project_type = self.project_types[tab_type]
+        name, ok = QInputDialog.getText(self, project_type.new_label, "Name:")
+        name = name.strip()
+        if not ok or not name:
+            return
+        if os.path.basename(name) != name:
+            QMessageBox.warning(self, "Error", f"{name} is not a valid folder name")
+            return
+        
+        path = os.path.join(self.dirs[tab_type], name)
         try:
-            # Try running with regular Python to see any error messages
-            process = subprocess.Popen(
-                ['python', script_path],
-                creationflags=subprocess.CREATE_NEW_CONSOLE,
-                cwd=os.path.dirname(script_path)
-            )
-            return process.returncode == 0
+            os.makedirs(path)
+            if project_type.starter_file:
+                open(os.path.join(path, project_type.starter_file), 'x', encoding='utf-8').close()
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"Failed to create {name}: {str(e)}")
+            return
+        files_log.info("Created project: %s", path)
+        self.load_projects(getattr(self, f'{tab_type}_tree'), self.dirs[tab_type])
+
+    def apply_package_result(self, path, result):
+        """Report manifest problems and the package that was built"""
+        name = os.path.basename(os.path.normpath(path))
+        if 'error' in result:
+            QMessageBox.warning(self, "Error", f"Failed to package {name}: {result['error']}")
+            return
+        
+        lines = [f"{level.title()}: {message}" for level, message in result.get('problems', [])]
+        if 'zip_path' not in result:
+            QMessageBox.warning(self, "Invalid Manifest", f"{name} was not packaged:\n\n" + "\n".join(lines))
+            return
+        
+        packaging_log.info("Packaged %s: %d compressed, %d reused in %.2fs",
+                          name, result['compressed'], result['reused'], result['seconds'])
+        summary = (
+            f"Built {result['zip_path']}\n\n"
+            f"{result['files']} file(s), {format_size(result['size'])} in {result['seconds']:.2f}s\n"
+            f"{result['compressed']} compressed, {result['reused']} unchanged"
+        )
+        if lines:
+            summary += "\n\n" + "\n".join(lines)
+        QMessageBox.information(self, "Extension Packaged", summary)
+
+    def show_project_menu(self, tab_type, position):
+        """Show the context menu for a project in a tree"""
+        tree = getattr(self, f'{tab_type}_tree')
+        item = tree.itemAt(position)
+        project_type = self.project_types[tab_type]
+        if item is None or not (project_type.watch_files or project_type.runnable):
+            return
+        
+        path = self.item_path(item, tab_type)
+        if not os.path.isdir(path):
+            return
+        menu = QMenu(self)
+        set_action = clear_action = queue_action = history_action = logs_action = limits_action = None
+        precompile_action = import_action = watch_action = None
+        if project_type.entry_extensions:
+            current = self.entry_points.resolve(path, project_type.entry_extensions)
+            info = menu.addAction(f"Entry point: {os.path.basename(current) if current else 'none'}")
+            info.setEnabled(False)
+            set_action = menu.addAction("Set Entry Point...")
+            clear_action = menu.addAction("Use Automatic Entry Point")
+            clear_action.setEnabled(self.entry_points.override(path) is not None)
+            menu.addSeparator()
+        if project_type.runnable:
+            queue_action = menu.addAction("Add to Run Queue...")
+            history_action = menu.addAction("Run History...")
+            logs_action = menu.addAction("Run Logs...")
+            limits_action = menu.addAction("Set Run Limits...")
+        if project_type.watch_files:
+            watch_action = menu.addAction("Watch and Rerun" if project_type.runner != 'browser' else "Watch and Reload")
+            watch_action.setCheckable(True)
+            watch_action.setChecked(path in self.watchers)
+        server_action = None
+        if path in self.html_servers:
+            server_action = menu.addAction(f"Stop Server ({self.html_servers[path].url})")
+        tests_action = category_tests_action = None
+        if project_type.python:
+            menu.addSeparator()
+            tests_action = menu.addAction("Run Tests")
+            category_tests_action = menu.addAction(f"Run All Tests in {self.tabs.tabText(self.tab_index(tab_type))}")
+        if project_type.python:
+            menu.addSeparator()
+            precompile_action = menu.addAction("Precompile Bytecode")
+            import_action = menu.addAction("Precompile Projects on Import")
+            import_action.setCheckable(True)
+            import_action.setChecked(self.settings.value('precompile_on_import', False, type=bool))
+        
+        chosen = menu.exec(tree.viewport().mapToGlobal(position))
+        if chosen is None:
+            return
+        if chosen is watch_action:
+            self.set_watch(tab_type, path, watch_action.isChecked())
+        elif chosen == server_action:
+            self.stop_html_server(path)
+        elif chosen == queue_action:
+            self.enqueue_project(tab_type, path)
+        elif chosen == history_action:
+            self.show_run_history(tab_type, path)
+        elif chosen == logs_action:
+            self.show_run_logs(tab_type, path)
+        elif chosen == limits_action:
+            self.edit_run_limits(path)
+        elif chosen == tests_action:
+            self.run_tests([path])
+        elif chosen == category_tests_action:
+            directory = self.dirs[tab_type]
+            self.run_tests([os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                            if os.path.isdir(os.path.join(directory, name))])
+        elif chosen == precompile_action:
+            self.start_precompile([path])
+        elif chosen == import_action:
+            self.set_precompile_on_import(import_action.isChecked())
+        elif chosen == set_action:
+            self.choose_entry_point(tab_type, path)
+        elif chosen == clear_action:
+            self.entry_points.set_override(path, None)
+
+    def set_watch(self, tab_type, path, enabled):
+        """Start or stop rerunning a project when its files change"""
+        watcher = self.watchers.pop(path, None)
+        if watcher is not None:
+            watcher.stop()
+            watcher.deleteLater()
+            self.watch_runs.pop(path, None)
+            self.watch_restarts.discard(path)
+            watch_log.info("Stopped watching %s", path)
+        if enabled:
+            watcher = ProjectWatcher(tab_type, path, self.project_types[tab_type].watch_files, self.watch_pool, self)
+            watcher.changed.connect(self.on_watch_changed)
+            self.watchers[path] = watcher
+            watch_log.info("Watching %s", path)
+
+    def on_watch_changed(self, path, changes):
+        """Rerun (or for HTML, reload) a watched project after its files changed"""
+        watcher = self.watchers.get(path)
+        if watcher is None:
+            return
+        watch_log.info("%d file(s) changed in %s", len(changes), path)
+        try:
+            precompile = self.settings.value('precompile_on_import', False, type=bool)
+            if watcher.tab_type in self.python_tabs and precompile:
+                self.start_precompile([path])
+            if self.project_types[watcher.tab_type].runner == 'browser':
+                self.reload_html_project(path)
+            else:
+                self.rerun_watched(watcher.tab_type, path)
         except Exception as e:
-            print(f"Error in direct execution: {e}")
-            return False
+            watch_log.error("Error rerunning %s: %s", path, e)
+
+    def rerun_watched(self, tab_type, path):
+        """Start a watched project, stopping its previous run first if it is still going"""
+        record = self.supervisor.runs.get(self.watch_runs.get(path))
+        if record is None or not record.active:
+            # Adopt a run of the project started by hand
+            name = os.path.basename(os.path.normpath(path))
+            runs = [r for r in self.supervisor.active_runs() if r.tab_type == tab_type and r.name == name]
+            record = max(runs, key=lambda r: r.run_id) if runs else None
+            if record is not None:
+                self.watch_runs[path] = record.run_id
+        if record is not None and record.active:
+            # Changes that arrive while it stops are covered by the coming rerun
+            if path not in self.watch_restarts:
+                self.watch_restarts.add(path)
+                self.supervisor.stop(record.run_id)
+            return
+        record = self.launch_project(tab_type, path)
+        if record is None:
+            watch_log.warning("Nothing to run in %s", path)
+            return
+        self.watch_runs[path] = record.run_id
+
+    def rerun_after_stop(self, run_id):
+        """Relaunch a watched project once the run a change stopped has exited"""
+        record = self.supervisor.runs.get(run_id)
+        if record is None or record.active:
+            return
+        for path, watched_run_id in list(self.watch_runs.items()):
+            if watched_run_id == run_id and path in self.watch_restarts:
+                self.watch_restarts.discard(path)
+                watcher = self.watchers.get(path)
+                if watcher is not None:
+                    self.rerun_watched(watcher.tab_type, path)
+
+    def reload_html_project(self, path):
+        """Show the current version of an HTML project's page"""
+        server = self.html_servers.get(path)
+        if server is not None:
+            server.notify_reload()
+            return
+        index_path = os.path.join(path, 'index.html')
+        if os.path.exists(index_path):
+            webbrowser.open(pathlib.Path(index_path).as_uri(), new=0)
+
+    def serve_html_project(self, tab_type, path):
+        """Start (or reuse) the live reload server of an HTML project and return its URL"""
+        server = self.html_servers.get(path)
+        if server is None:
+            server = LiveReloadServer(path)
+            server.start()
+            self.html_servers[path] = server
+            run_log.info("Serving %s at %s", path, server.url)
+        if path not in self.watchers:
+            self.set_watch(tab_type, path, True)
+        return server.url
 
-    def run_batch_script(self):
-        """Run Batch script"""
+    def stop_html_server(self, path):
+        server = self.html_servers.pop(path, None)
+        if server is not None:
+            server.stop()
+            run_log.info("Stopped serving %s", path)
+
+    def choose_entry_point(self, tab_type, path):
+        """Let the user pick which file runs a project"""
         try:
-            tree = self.batch_tree
-            selected_items = tree.selectedItems()
-            
-            if not selected_items:
-                QMessageBox.warning(self, "Warning", "Please select a folder to run")
+            extensions = self.project_types[tab_type].entry_extensions
+            candidates = self.entry_points.candidates(path, extensions)
+            if not candidates:
+                QMessageBox.warning(self, "Error", "No runnable files found in the selected folder")
                 return
             
-            item = selected_items[0]
-            if item.background(0).color().name() == '#808080':
-                path = item.data(0, Qt.ItemDataRole.UserRole)
-            else:
-                path = os.path.join(self.dirs['batch'], item.text(0))
-            
-            # Find and run .bat file in the folder
-            if os.path.isdir(path):
-                bat_files = [f for f in os.listdir(path) if f.endswith('.bat')]
-                if bat_files:
-                    script_path = os.path.join(path, bat_files[0])
-                    os.startfile(script_path)
-                else:
-                    QMessageBox.warning(self, "Error", "No .bat file found in the selected folder")
-            else:
-                QMessageBox.warning(self, "Error", "Please select a folder")
+            current = self.entry_points.resolve(path, extensions)
+            index = candidates.index(os.path.basename(current)) if current else 0
+            filename, ok = QInputDialog.getItem(
+                self, "Set Entry Point", f"File to run for {os.path.basename(path)}:", candidates, index, False)
+            if ok and filename:
+                self.entry_points.set_override(path, filename)
         
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to run batch script: {str(e)}")
+            QMessageBox.warning(self, "Error", f"Failed to set entry point: {str(e)}")
 
-    def run_powershell_app(self):
-        """Run PowerShell application"""
+    def edit_run_limits(self, path):
+        """Let the user set a project's timeout, memory and CPU time limits"""
         try:
-            print("Starting PowerShell app runner...")
-            tree = self.powershell_tree
-            selected_items = tree.selectedItems()
-            
-            if not selected_items:
-                QMessageBox.warning(self, "Warning", "Please select a folder to run")
-                return
+            limits = self.run_limits.get(path)
+            dialog = QDialog(self)
+            dialog.setWindowTitle(f"Run Limits - {os.path.basename(os.path.normpath(path))}")
+            form = QFormLayout(dialog)
+            spins = {}
+            for key, label, suffix, maximum in (('timeout', "Timeout:", " s", 7 * 24 * 3600),
+                                                 ('memory_mb', "Memory:", " MB", 1024 * 1024),
+                                                 ('cpu_seconds', "CPU time:", " s", 7 * 24 * 3600)):
+                spin = QSpinBox()
+                spin.setRange(0, maximum)
+                spin.setSuffix(suffix)
+                spin.setSpecialValueText("No limit")
+                spin.setValue(limits[key])
+                form.addRow(label, spin)
+                spins[key] = spin
+            buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+            buttons.accepted.connect(dialog.accept)
+            buttons.rejected.connect(dialog.reject)
+            form.addRow(buttons)
+            if dialog.exec() == QDialog.DialogCode.Accepted:
+                self.run_limits.set(path, {key: spin.value() for key, spin in spins.items()})
+        
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Failed to set run limits: {str(e)}")
+
+    def show_run_history(self, tab_type, path):
+        """Show a project's past run metrics with a trend chart"""
+        try:
+            name = os.path.basename(os.path.normpath(path))
+            project = f"{tab_type}/{name}"
+            runs = self.run_history.project_runs(project)
             
-            item = selected_items[0]
-            print(f"Selected item: {item.text(0)}")
+            dialog = QDialog(self)
+            dialog.setWindowTitle(f"Run History - {name}")
+            dialog.resize(760, 480)
+            layout = QVBoxLayout(dialog)
+            metric_combo = QComboBox()
+            metrics = [('wall', "Wall Time"), ('cpu', "CPU Time"), ('peak_rss', "Peak Memory"),
+                       ('output_chars', "Output Size")]
+            for key, label in metrics:
+                metric_combo.addItem(label, key)
+            chart = TrendChart(self.colors)
+            flagged = [i for i, entry in enumerate(runs) if entry.get('flags')]
             
-            if item.background(0).color().name() == '#808080':
-                path = item.data(0, Qt.ItemDataRole.UserRole)
-            else:
-                path = os.path.join(self.dirs['powershell'], item.text(0))
+            def show_metric():
+                metric = metric_combo.currentData()
+                baseline = self.run_history.baseline(project, metric)
+                chart.set_series([entry.get(metric) for entry in runs], flagged, baseline[0] if baseline else None)
+            metric_combo.currentIndexChanged.connect(show_metric)
+            show_metric()
             
-            print(f"Path to check: {path}")
+            table = QTreeWidget()
+            table.setRootIsDecorated(False)
+            table.setHeaderLabels(["Started", "Wall Time", "CPU Time", "Peak Memory", "Output", "Exit Code",
+                                   "State", "Flags"])
+            for entry in reversed(runs):
+                row = QTreeWidgetItem([
+                    time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry.get('time', 0))),
+                    f"{entry.get('wall', 0):.2f}s",
+                    '' if entry.get('cpu') is None else f"{entry['cpu']:.2f}s",
+                    '' if entry.get('peak_rss') is None else format_size(entry['peak_rss']),
+                    '' if entry.get('output_chars') is None else f"{entry['output_chars']} chars",
+                    '' if entry.get('exit_code') is None else str(entry['exit_code']),
+                    entry.get('state', ''),
+                    '; '.join(entry.get('flags', []))
+                ])
+                if entry.get('flags'):
+                    row.setForeground(7, QBrush(QColor(self.colors['highlight'])))
+                table.addTopLevelItem(row)
             
-            # Find and run .bat or .ps1 file in the folder
-            if os.path.isdir(path):
-                print("Path is a directory, searching for files...")
-                bat_files = [f for f in os.listdir(path) if f.endswith('.bat')]
-                ps1_files = [f for f in os.listdir(path) if f.endswith('.ps1')]
-                
-                print(f"Found BAT files: {bat_files}")
-                print(f"Found PS1 files: {ps1_files}")
-                
-                if bat_files:  # Try .bat first
-                    script_path = os.path.join(path, bat_files[0])
-                    print(f"Running BAT file: {script_path}")
-                    os.startfile(script_path)
-                elif ps1_files:  # Fall back to .ps1
-                    script_path = os.path.join(path, ps1_files[0])
-                    print(f"Running PS1 file: {script_path}")
-                    os.system(f'powershell -ExecutionPolicy Bypass -File "{script_path}"')
-                else:
-                    print("No suitable files found")
-                    QMessageBox.warning(
-                        self, 
-                        "Error", 
-                        "No suitable files found in the selected folder.\nSearched for: .bat, .ps1"
-                    )
-            else:
-                print("Selected item is not a directory")
-                QMessageBox.warning(self, "Error", "Please select a folder")
+            layout.addWidget(metric_combo)
+            layout.addWidget(chart)
+            layout.addWidget(table)
+            dialog.exec()
         
         except Exception as e:
-            print(f"Error running PowerShell app: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to run PowerShell app: {str(e)}")
+            QMessageBox.warning(self, "Error", f"Failed to show run history: {str(e)}")
 
-    def run_ubif_project(self):
-        """Run UBIF project"""
+    def show_run_logs(self, tab_type, path):
+        """Show the saved output of a project's past runs"""
         try:
-            tree = self.ubif_tree
-            selected_items = tree.selectedItems()
+            name = os.path.basename(os.path.normpath(path))
+            entries = self.run_logs.project_runs(f"{tab_type}/{name}")
             
-            if not selected_items:
-                QMessageBox.warning(self, "Warning", "Please select a project to run")
-                return
+            dialog = QDialog(self)
+            dialog.setWindowTitle(f"Run Logs - {name}")
+            dialog.resize(900, 560)
+            layout = QHBoxLayout(dialog)
+            splitter = QSplitter(Qt.Orientation.Horizontal)
+            log_list = QListWidget()
+            log_view = QPlainTextEdit()
+            log_view.setReadOnly(True)
+            for entry in reversed(entries):
+                exit_code = '' if entry.get('exit_code') is None else f" ({entry['exit_code']})"
+                list_item = QListWidgetItem(
+                    f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['start']))}  "
+                    f"{entry['state']}{exit_code}  {format_size(entry.get('size', 0))}"
+                )
+                list_item.setData(Qt.ItemDataRole.UserRole, entry)
+                log_list.addItem(list_item)
             
-            item = selected_items[0]
-            if item.background(0).color().name() == '#808080':
-                path = item.data(0, Qt.ItemDataRole.UserRole)
+            def show_log(current, previous=None):
+                if current is not None:
+                    log_view.setPlainText(self.run_logs.read(current.data(Qt.ItemDataRole.UserRole),
+                                                             self.LOG_VIEW_CHARS))
+            log_list.currentItemChanged.connect(show_log)
+            if log_list.count():
+                log_list.setCurrentRow(0)
             else:
-                path = os.path.join(self.dirs['ubif'], item.text(0))
+                log_view.setPlainText("No saved runs yet")
             
-            # Look for main.py or similar file in the folder
-            if os.path.isdir(path):
-                py_files = [f for f in os.listdir(path) if f.endswith('.py')]
-                if py_files:
-                    script_path = os.path.join(path, py_files[0])
-                    
-                    # Modified batch file creation to hide window
-                    batch_path = os.path.join(path, "_temp_run.bat")
-                    with open(batch_path, 'w') as f:
-                        f.write('@echo off\n')
-                        f.write(f'pythonw "{script_path}"\n')
-                    
-                    # Run with hidden window
-                    startupinfo = subprocess.STARTUPINFO()
-                    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                    startupinfo.wShowWindow = subprocess.SW_HIDE
-                    
-                    subprocess.Popen(batch_path, 
-                                  startupinfo=startupinfo,
-                                  creationflags=subprocess.CREATE_NO_WINDOW,
-                                  cwd=os.path.dirname(script_path))
-                    
-                    # Clean up the temp batch file after a short delay
-                    def cleanup():
-                        time.sleep(2)
-                        try:
-                            os.remove(batch_path)
-                        except:
-                            pass
-                    
-                    threading.Thread(target=cleanup).start()
-                else:
-                    QMessageBox.warning(self, "Error", "No Python files found in the selected folder")
-            else:
-                QMessageBox.warning(self, "Error", "Please select a folder")
+            splitter.addWidget(log_list)
+            splitter.addWidget(log_view)
+            splitter.setSizes([280, 620])
+            layout.addWidget(splitter)
+            dialog.exec()
+        
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Failed to show run logs: {str(e)}")
+
+    def enqueue_project(self, tab_type, path):
+        """Ask for a project's arguments, timeout and dependencies and add it to the run queue"""
+        try:
+            dialog = QDialog(self)
+            dialog.setWindowTitle(f"Queue {os.path.basename(path)}")
+            form = QFormLayout(dialog)
+            args_edit = QLineEdit()
+            timeout_spin = QSpinBox()
+            timeout_spin.setRange(0, 24 * 3600)
+            timeout_spin.setSuffix(" s")
+            timeout_spin.setSpecialValueText("Project default")
+            depends_list = QListWidget()
+            for job in self.run_queue.jobs.values():
+                if job.state in ('queued', 'running', 'done'):
+                    entry = QListWidgetItem(f"#{job.job_id} {job.name}")
+                    entry.setData(Qt.ItemDataRole.UserRole, job.job_id)
+                    entry.setCheckState(Qt.CheckState.Unchecked)
+                    depends_list.addItem(entry)
+            buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+            buttons.accepted.connect(dialog.accept)
+            buttons.rejected.connect(dialog.reject)
+            form.addRow("Arguments:", args_edit)
+            form.addRow("Timeout:", timeout_spin)
+            form.addRow("Run after:", depends_list)
+            form.addRow(buttons)
+            if dialog.exec() != QDialog.DialogCode.Accepted:
+                return
+            
+            args = shlex.split(args_edit.text(), posix=os.name != 'nt')
+            depends_on = [
+                depends_list.item(row).data(Qt.ItemDataRole.UserRole)
+                for row in range(depends_list.count())
+                if depends_list.item(row).checkState() == Qt.CheckState.Checked
+            ]
+            self.run_queue.add(tab_type, path, args, depends_on, timeout_spin.value())
+            self.findChild(QDockWidget, "queue_dock").raise_()
         
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to run UBIF project: {str(e)}")
+            QMessageBox.warning(self, "Error", f"Failed to queue project: {str(e)}")
+
+    def run_tests(self, paths, test_ids=None):
+        """Run the test suites of some projects on a pool of test workers.
+        
+        test_ids ({project_dir: {test file: [ids]}}) limits a project to some
+        files and tests; files without ids listed there run whole.
+        """
+        if self.test_session is not None and self.test_session.active:
+            QMessageBox.warning(self, "Warning", "Tests are already running")
+            return
+        
+        max_parallel = self.settings.value('test_max_parallel', os.cpu_count() or 2, type=int)
+        session = TestSession(self.test_history, max_parallel, self)
+        for path in paths:
+            test_files = discover_tests(path)
+            if test_ids is not None:
+                test_files = {test_file: framework for test_file, framework in test_files.items()
+                              if test_file in test_ids.get(path, {})}
+            if not test_files:
+                continue
+            digest, interpreter, setup = self.environments.prepare(path)
+            if setup:
+                building = self.supervisor.runs.get(self.env_builds.get(digest))
+                if building is not None and building.state == 'preparing':
+                    tests_log.warning("Skipping tests of %s: its environment is still being built", path)
+                    continue
+            session.add_project(path, interpreter, setup, test_files, (test_ids or {}).get(path))
+        
+        if not session.jobs:
+            QMessageBox.information(self, "Info", "No test files (test_*.py or *_test.py) found")
+            session.deleteLater()
+            return
+        
+        for path in session.projects:
+            self.test_project_item(path).setText(1, 'running')
+        tests_log.info("Running %d test file(s) from %d project(s)", len(session.jobs), len(session.projects))
+        session.result_ready.connect(self.add_test_result)
+        session.finished.connect(self.tests_finished)
+        self.test_session = session
+        self.tests_summary.setText("Running...")
+        self.tests_dock.raise_()
+        session.start()
+        self.update_test_controls()
+
+    def test_project_item(self, project_dir):
+        item = self.test_project_items.get(project_dir)
+        if item is None:
+            item = QTreeWidgetItem([os.path.basename(os.path.normpath(project_dir)), '', ''])
+            item.setToolTip(0, project_dir)
+            self.tests_tree.addTopLevelItem(item)
+            item.setExpanded(True)
+            self.test_project_items[project_dir] = item
+        return item
+
+    def add_test_result(self, project_dir, result):
+        """Show a test result as it arrives"""
+        key = (project_dir, result['id'])
+        self.test_results[key] = result
+        item = self.test_items.get(key)
+        if item is None:
+            item = QTreeWidgetItem([result['id']])
+            item.setData(0, Qt.ItemDataRole.UserRole, key)
+            self.test_project_item(project_dir).addChild(item)
+            self.test_items[key] = item
+        item.setText(1, result['outcome'])
+        item.setText(2, f"{result['duration']:.3f}s")
+        colors = {'passed': self.colors['accent'], 'failed': '#FF6347', 'error': '#FF6347',
+                  'skipped': self.colors['secondary_text']}
+        item.setForeground(1, QBrush(QColor(colors.get(result['outcome'], self.colors['text']))))
+        if self.tests_tree.currentItem() is item:
+            self.show_test_message(item)
+
+    def tests_finished(self):
+        """Summarize a test session once its last worker exited"""
+        session = self.test_session
+        for project_dir, item in self.test_project_items.items():
+            outcomes = [result['outcome'] for (path, test_id), result in self.test_results.items()
+                        if path == project_dir]
+            failed = sum(1 for outcome in outcomes if outcome in ('failed', 'error'))
+            item.setText(1, f"{failed} failed" if failed else f"{len(outcomes)} passed")
+            item.setForeground(1, QBrush(QColor('#FF6347' if failed else self.colors['accent'])))
+        
+        counts = session.counts()
+        summary = ', '.join(f"{counts[outcome]} {outcome}" for outcome in ('passed', 'failed', 'error', 'skipped')
+                            if counts.get(outcome))
+        self.tests_summary.setText(f"{summary or 'No tests ran'} in {session.duration:.1f}s"
+                                   + (" (stopped)" if session.stopped else ''))
+        tests_log.info("Tests finished: %s", self.tests_summary.text())
+        self.update_test_controls()
+
+    def rerun_failed_tests(self):
+        """Run again only the tests that failed or errored in the results shown"""
+        test_ids = {}
+        for (project_dir, test_id), result in self.test_results.items():
+            if result['outcome'] not in ('failed', 'error'):
+                continue
+            files = test_ids.setdefault(project_dir, {})
+            test_file = test_file_of(test_id)
+            if test_id == test_file:
+                files[test_file] = []  # The file itself failed, so run all of it
+            elif files.get(test_file, ()) != []:
+                files.setdefault(test_file, []).append(test_id)
+        if test_ids:
+            self.run_tests(list(test_ids), test_ids)
+
+    def clear_test_results(self):
+        if self.test_session is not None and self.test_session.active:
+            return
+        self.tests_tree.clear()
+        self.test_project_items.clear()
+        self.test_items.clear()
+        self.test_results.clear()
+        self.test_message_view.clear()
+        self.tests_summary.setText("")
+        self.update_test_controls()
+
+    def show_test_message(self, item, previous=None):
+        """Show the traceback or skip reason of the selected test"""
+        key = item.data(0, Qt.ItemDataRole.UserRole) if item is not None else None
+        result = self.test_results.get(key) if key else None
+        self.test_message_view.setPlainText(result['message'] if result else '')
+
+    @traced(describe=lambda self, tab_type, path, *args, **kwargs: {'path': path})
+    def launch_project(self, tab_type, path, args=(), timeout=0, warm=False):
+        """Run a project folder's entry point, returning the run or None if it has nothing to run.
+        
+        The project's run limits apply; a nonzero timeout replaces its own.
+        """
+        project_type = self.project_types[tab_type]
+        if not project_type.runnable:
+            return None
+        script_path = None
+        if project_type.entry_extensions:
+            script_path = self.entry_points.resolve(path, project_type.entry_extensions)
+            if not script_path:
+                return None
+        
+        name = os.path.basename(os.path.normpath(path))
+        limits = self.run_limits.get(path)
+        if timeout:
+            limits['timeout'] = timeout
+        if project_type.runner == 'python':
+            run_log.info("Running Python file: %s", script_path)
+            return self.launch_python_project(tab_type, name, script_path, args, warm, limits)
+        
+        run_log.info("Running %s project: %s", project_type.title, script_path or path)
+        argv = project_type.command(path, script_path) + list(args)
+        return self.supervisor.launch(tab_type, name, argv, path, limits=limits)
+
+    def launch_python_project(self, tab_type, name, script_path, args=(), warm=False, limits=None):
+        """Run a Python script in its project's cached dependency environment"""
+        project_dir = os.path.dirname(script_path)
+        digest, interpreter, setup = self.environments.prepare(project_dir)
+        
+        if setup:
+            # Two runs must not build the same environment at once
+            building = self.supervisor.runs.get(self.env_builds.get(digest))
+            if building is not None and building.state == 'preparing':
+                raise RuntimeError(f"The environment for {name} is still being built by another run.")
+            run_log.info("Building environment %s for %s", digest, name)
+        
+        record = self.supervisor.launch(
+            tab_type, name,
+            build_launch_command('python', script_path, interpreter) + list(args),
+            project_dir,
+            prepare=setup,
+            script=script_path,
+            warm=warm,
+            limits=limits
+        )
+        if setup:
+            self.env_builds[digest] = record.run_id
+        return record
+
+    def set_fast_run(self, enabled):
+        """Turn the warm worker pool for Python Scripts on or off"""
+        self.fast_run = enabled
+        self.settings.setValue('fast_run', enabled)
+        self.supervisor.set_warm_pool(enabled)
+
+    def show_run_timings(self):
+        """Compare wall times of warm and cold script runs"""
+        lines = []
+        medians = {}
+        for mode in ('cold', 'warm'):
+            durations = sorted(self.supervisor.timings[mode])
+            if durations:
+                medians[mode] = durations[len(durations) // 2]
+                mean = sum(durations) / len(durations)
+                lines.append(f"{mode.title()}: {len(durations)} run(s), median {medians[mode]:.2f}s, mean {mean:.2f}s")
+            else:
+                lines.append(f"{mode.title()}: no runs yet")
+        
+        if len(medians) == 2 and medians['warm'] > 0:
+            lines.append(f"\nWarm runs are {medians['cold'] / medians['warm']:.1f}x faster (median)")
+        
+        QMessageBox.information(self, "Script Run Timing", "\n".join(lines))
 
 if __name__ == "__main__":
+    configure_logging()
+    # --trace PATH (or DEVSPACE_TRACE) saves startup and hot path timings when the app exits
+    trace_file = trace_path(sys.argv)
+    if trace_file:
+        TRACER.start(trace_file)
     hide_console()  # Hide console before creating the application
-    app = QApplication(sys.argv)
-    window = DeveloperWorkspace()
-    window.show()
+    with TRACER.span('startup'):
+        app = QApplication(sys.argv)
+        window = DeveloperWorkspace()
+        window.show()
+    QTimer.singleShot(0, lambda: TRACER.mark('event loop started'))
     sys.exit(app.exec())
\ No newline at end of file
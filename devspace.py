@@ -0,0 +1,555 @@
+"""Command line interface to the developer workspace.
+
+Drives the same workspace folders, entry points, environments, run limits
+and run history as the GUI without importing PyQt6 or win32, so scripts
+and scheduled jobs don't pay for GUI startup:
+
+    python devspace.py list [CATEGORY ...]
+    python devspace.py run CATEGORY PROJECT [--timeout SECONDS] [-- ARGS ...]
+    python devspace.py move SOURCE CATEGORY [--replace]
+    python devspace.py search PATTERN [--category CATEGORY] [--content REGEX]
+    python devspace.py index
+    python devspace.py stats
+"""
+import argparse
+import codecs
+import concurrent.futures
+import fnmatch
+import json
+import os
+import re
+import shlex
+import shutil
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from devspace_core import (
+    LANGUAGE_EXTENSIONS, LOG_ENV, LOG_FILE_ENV, TRACE_ENV, TRACER, EntryPointResolver, EnvironmentManager,
+    RunHistory, RunLimits, RunLogStore, WindowsJob, build_launch_command, configure_logging, default_workspace_dir,
+    format_size, iter_project_files, limited_command, move_into_workspace, parse_log_levels, project_types,
+    python_interpreter, signal_process_group, summarize_folder, traced, workspace_dirs
+)
+
+# Exit status of a run stopped by its timeout, as with timeout(1)
+TIMEOUT_EXIT_CODE = 124
+# Seconds a stopped run gets to exit before it is killed
+STOP_GRACE_SECONDS = 5
+# Seconds a run's output may stay open after it exits (held by a background child)
+OUTPUT_DRAIN_SECONDS = 1
+# Files larger than this are skipped by content search
+SEARCH_MAX_FILE_SIZE = 1024 * 1024
+
+class Workspace:
+    """The workspace folders and the stores the GUI keeps in its cache folder"""
+
+    def __init__(self, workspace_dir=None):
+        self.workspace_dir = workspace_dir or default_workspace_dir()
+        self.types = project_types()
+        self.dirs = workspace_dirs(self.workspace_dir)
+        self.cache_dir = os.path.join(self.workspace_dir, ".cache")
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self.entry_points = EntryPointResolver(os.path.join(self.cache_dir, "entry_points.json"))
+        self.environments = EnvironmentManager(os.path.join(self.cache_dir, "envs"))
+        self.run_history = RunHistory(os.path.join(self.cache_dir, "run_history.jsonl"))
+        self.run_limits = RunLimits(os.path.join(self.cache_dir, "run_limits.json"))
+        self.run_logs = RunLogStore(os.path.join(self.cache_dir, "logs"))
+
+    def projects(self, category):
+        """Return the full paths of a category's projects, sorted by name"""
+        try:
+            names = sorted(os.listdir(self.dirs[category]), key=str.lower)
+        except OSError:
+            return []
+        return [os.path.join(self.dirs[category], name) for name in names]
+
+    def entry_point(self, category, path):
+        """Return the script a project runs, or None"""
+        extensions = self.types[category].entry_extensions
+        if not extensions:
+            return None
+        if os.path.isfile(path):
+            return path if path.lower().endswith(extensions) else None
+        return self.entry_points.resolve(path, extensions)
+
+def print_json(data):
+    json.dump(data, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+def command_list(workspace, args):
+    """List the projects of some or all categories with their entry points"""
+    unknown = [category for category in args.categories if category not in workspace.types]
+    if unknown:
+        print(f"Unknown category: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    listing = {}
+    for category in args.categories or list(workspace.types):
+        listing[category] = []
+        for path in workspace.projects(category):
+            script_path = workspace.entry_point(category, path)
+            listing[category].append({
+                'name': os.path.basename(path),
+                'path': path,
+                'entry_point': os.path.basename(script_path) if script_path else None
+            })
+
+    if args.json:
+        print_json(listing)
+        return 0
+    for category, projects in listing.items():
+        print(f"{category} ({workspace.types[category].folder}): {len(projects)} project(s)")
+        for project in projects:
+            entry_point = f"  [{project['entry_point']}]" if project['entry_point'] else ''
+            print(f"  {project['name']}{entry_point}")
+    return 0
+
+def command_run(workspace, args):
+    """Run a project in the foreground and return its exit code"""
+    path = os.path.join(workspace.dirs[args.category], args.project)
+    if not os.path.exists(path):
+        print(f"No project {args.project} in {args.category}", file=sys.stderr)
+        return 2
+    project_type = workspace.types[args.category]
+    script_path = workspace.entry_point(args.category, path)
+    if project_type.entry_extensions and not script_path:
+        print(f"Nothing to run in {path}", file=sys.stderr)
+        return 2
+
+    project_dir = os.path.dirname(script_path) if script_path else path
+    name = os.path.basename(os.path.normpath(path))
+    limits = workspace.run_limits.get(project_dir)
+    if args.timeout:
+        limits['timeout'] = args.timeout
+
+    setup = []
+    if project_type.runner == 'python':
+        digest, interpreter, setup = workspace.environments.prepare(project_dir)
+        if digest is not None:
+            interpreter = workspace.environments.env_python(digest, windowed=False)
+        else:
+            interpreter = python_interpreter(windowed=False)
+        argv = build_launch_command('python', script_path, interpreter)
+    else:
+        argv = project_type.command(path, script_path)
+    argv += args.args
+
+    for command in setup:
+        # Keep the build's output off stdout, which belongs to the script
+        print(f"$ {subprocess.list2cmdline(command)}", file=sys.stderr)
+        if subprocess.run(command, stdout=sys.stderr).returncode != 0:
+            print(f"Building the environment for {name} failed", file=sys.stderr)
+            return 1
+
+    project = f"{args.category}/{name}"
+    log_id = workspace.run_logs.open(project, time.time(), shlex.join(argv))
+    try:
+        result = run_process(
+            limited_command(argv, limits['memory_mb'], limits['cpu_seconds']), project_dir, limits,
+            lambda text: workspace.run_logs.write(log_id, text)
+        )
+        workspace.run_logs.close(log_id, result['state'], result['exit_code'])
+    finally:
+        workspace.run_logs.stop()
+
+    entry = workspace.run_history.add(project, {
+        'time': result['start'],
+        'wall': round(result['wall'], 3),
+        'cpu': None if result['cpu'] is None else round(result['cpu'], 3),
+        'peak_rss': result['peak_rss'],
+        'exit_code': result['exit_code'],
+        'output_chars': result['output_chars'],
+        'state': result['state'],
+        'warm': False,
+        'setup': bool(setup)
+    })
+    for flag in entry['flags']:
+        print(f"Regression in {name}: {flag}", file=sys.stderr)
+    if result['state'] == 'timed out':
+        print(f"{name} timed out after {limits['timeout']}s", file=sys.stderr)
+        return TIMEOUT_EXIT_CODE
+    return result['exit_code']
+
+@traced(describe=lambda argv, cwd, limits, output=None: {'command': subprocess.list2cmdline(argv)})
+def run_process(argv, cwd, limits, output=None):
+    """Run a command in its own process group or job, stopping the whole tree on timeout or Ctrl+C.
+
+    With output, the command's stdout and stderr are piped rather than
+    inherited: they are still copied to ours as they arrive, and their
+    decoded text is also passed to output(text).
+    """
+    env = dict(os.environ)
+    env.setdefault('PYTHONIOENCODING', 'utf-8')
+    pipe = None
+    if output is not None:
+        pipe = subprocess.PIPE
+        # Behind a pipe Python would buffer its output instead of streaming it
+        env.setdefault('PYTHONUNBUFFERED', '1')
+    start_time = time.time()
+    started = time.perf_counter()
+    if os.name == 'nt':
+        process = subprocess.Popen(argv, cwd=cwd, env=env, stdout=pipe, stderr=pipe,
+                                   creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+        job = WindowsJob(limits['memory_mb'], limits['cpu_seconds'])
+        job.assign(process.pid)
+    else:
+        process = subprocess.Popen(argv, cwd=cwd, env=env, stdout=pipe, stderr=pipe, start_new_session=True)
+        job = None
+
+    output_chars = 0
+    output_lock = threading.Lock()
+
+    def copy_output(source, target):
+        nonlocal output_chars
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        target.flush()
+        while True:
+            data = os.read(source.fileno(), 65536)
+            if data:
+                target.buffer.write(data)
+                target.buffer.flush()
+            text = decoder.decode(data, final=not data)
+            if text:
+                with output_lock:
+                    output_chars += len(text)
+                    output(text)
+            if not data:
+                break
+        source.close()
+
+    copiers = []
+    if output is not None:
+        for source, target in ((process.stdout, sys.stdout), (process.stderr, sys.stderr)):
+            copier = threading.Thread(target=copy_output, args=(source, target), daemon=True)
+            copier.start()
+            copiers.append(copier)
+
+    timed_out = threading.Event()
+    timers = []
+
+    def stop(kill=False):
+        if job is not None:
+            job.terminate()
+        if signal_process_group(process.pid, kill):
+            return
+        if kill:
+            process.kill()
+        else:
+            process.terminate()
+
+    def expire():
+        timed_out.set()
+        stop()
+        start_timer(STOP_GRACE_SECONDS, stop, True)
+
+    def start_timer(seconds, function, *args):
+        timer = threading.Timer(seconds, function, args)
+        timer.daemon = True
+        timer.start()
+        timers.append(timer)
+
+    if limits['timeout']:
+        start_timer(limits['timeout'], expire)
+
+    usage = None
+    interrupted = False
+    while True:
+        try:
+            if os.name == 'nt':
+                process.wait()
+            else:
+                # wait4 reports the exact CPU time and peak memory of this run
+                pid, status, usage = os.wait4(process.pid, 0)
+                process.returncode = os.waitstatus_to_exitcode(status)
+            break
+        except KeyboardInterrupt:
+            # A second Ctrl+C kills what the first one asked to exit
+            stop(kill=interrupted)
+            interrupted = True
+        except ChildProcessError:
+            process.wait()
+            break
+    wall = time.perf_counter() - started
+    for timer in timers:
+        timer.cancel()
+    for copier in copiers:
+        copier.join(OUTPUT_DRAIN_SECONDS)
+    if job is not None:
+        job.close()
+
+    exit_code = process.returncode
+    if timed_out.is_set():
+        state = 'timed out'
+    elif interrupted:
+        state = 'stopped'
+    elif exit_code < 0 or (os.name == 'nt' and exit_code >= 0xC0000000):
+        state = 'crashed'
+    else:
+        state = 'finished'
+    return {
+        'start': start_time,
+        'wall': wall,
+        'cpu': usage.ru_utime + usage.ru_stime if usage else None,
+        # ru_maxrss is in kilobytes except on macOS
+        'peak_rss': usage.ru_maxrss * (1 if sys.platform == 'darwin' else 1024) if usage else None,
+        'exit_code': exit_code,
+        'output_chars': output_chars if output is not None else None,
+        'state': state
+    }
+
+def command_move(workspace, args):
+    """Move files or folders into a category's workspace folder"""
+    failed = 0
+    for source_path in args.sources:
+        source_path = os.path.abspath(source_path)
+        destination = os.path.join(workspace.dirs[args.category], os.path.basename(source_path))
+        try:
+            if not os.path.exists(source_path):
+                raise FileNotFoundError(f"{source_path} does not exist")
+            if os.path.exists(destination):
+                if not args.replace:
+                    raise FileExistsError(f"{destination} already exists, use --replace to overwrite it")
+                if os.path.isdir(destination):
+                    shutil.rmtree(destination)
+                else:
+                    os.remove(destination)
+            os.makedirs(workspace.dirs[args.category], exist_ok=True)
+            move_into_workspace(source_path, destination)
+            print(destination)
+        except OSError as e:
+            print(f"Failed to move {source_path}: {e}", file=sys.stderr)
+            failed += 1
+    return 1 if failed else 0
+
+def name_matcher(pattern):
+    """Match names against a glob, or a case-insensitive substring when there is no wildcard"""
+    pattern = pattern.lower()
+    if any(char in pattern for char in '*?['):
+        return lambda name: fnmatch.fnmatch(name.lower(), pattern)
+    return lambda name: pattern in name.lower()
+
+def command_search(workspace, args):
+    """Find projects by name, or lines in project files matching a regular expression"""
+    matches = name_matcher(args.pattern)
+    content = re.compile(args.content) if args.content else None
+    results = []
+    for category in args.category or list(workspace.types):
+        for path in workspace.projects(category):
+            if not matches(os.path.basename(path)):
+                continue
+            if content is None:
+                results.append({'category': category, 'path': path})
+                continue
+            for file_path in iter_project_files(path, tuple(LANGUAGE_EXTENSIONS)):
+                for lineno, line in search_file(file_path, content):
+                    results.append({'category': category, 'path': file_path, 'line': lineno, 'text': line})
+
+    if args.json:
+        print_json(results)
+    else:
+        for result in results:
+            if 'line' in result:
+                print(f"{result['path']}:{result['line']}: {result['text']}")
+            else:
+                print(f"{result['category']}/{os.path.basename(result['path'])}")
+    return 0 if results else 1
+
+def search_file(file_path, pattern):
+    """Yield (line number, line) for lines of a text file matching a pattern"""
+    try:
+        if os.path.getsize(file_path) > SEARCH_MAX_FILE_SIZE:
+            return
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            for lineno, line in enumerate(f, 1):
+                if pattern.search(line):
+                    yield lineno, line.rstrip('\n')
+    except OSError:
+        return
+
+def build_index(workspace):
+    """Summarize every project in the workspace and store the result in the cache"""
+    projects = [(category, path) for category in workspace.types for path in workspace.projects(category)]
+
+    @traced('summarize', lambda project: {'path': project[1]})
+    def summarize(project):
+        category, path = project
+        if os.path.isdir(path):
+            summary = summarize_folder(path)
+        else:
+            stat = os.stat(path)
+            summary = {
+                'files': 1, 'folders': 0, 'size': stat.st_size, 'languages': {},
+                'entry_point': None, 'modified': stat.st_mtime, 'readme': None, 'truncated': False
+            }
+            language = LANGUAGE_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+            if language:
+                summary['languages'][language] = 1
+        script_path = workspace.entry_point(category, path)
+        if script_path:
+            summary['entry_point'] = os.path.basename(script_path)
+        return dict(summary, category=category, name=os.path.basename(path), path=path)
+
+    # Summaries are bound by disk access, so threads overlap the waiting
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        entries = list(executor.map(summarize, projects))
+    index = {'built': time.time(), 'workspace': workspace.workspace_dir, 'projects': entries}
+
+    os.makedirs(workspace.cache_dir, exist_ok=True)
+    temp_path = workspace.index_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+    os.replace(temp_path, workspace.index_path)
+    return index
+
+def load_index(workspace):
+    try:
+        with open(workspace.index_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def command_index(workspace, args):
+    """Rebuild the project index"""
+    started = time.perf_counter()
+    index = build_index(workspace)
+    print(f"Indexed {len(index['projects'])} project(s) in {time.perf_counter() - started:.2f}s: "
+          f"{workspace.index_path}")
+    return 0
+
+def command_stats(workspace, args):
+    """Report project counts, sizes and languages per category, and run history per project"""
+    index = load_index(workspace)
+    if index is None or args.refresh:
+        index = build_index(workspace)
+
+    categories = {}
+    for project in index['projects']:
+        totals = categories.setdefault(project['category'], {'projects': 0, 'files': 0, 'size': 0, 'languages': {}})
+        totals['projects'] += 1
+        totals['files'] += project['files']
+        totals['size'] += project['size']
+        for language, count in project['languages'].items():
+            totals['languages'][language] = totals['languages'].get(language, 0) + count
+
+    runs = {}
+    for project, entries in sorted(workspace.run_history.load().items()):
+        walls = [entry['wall'] for entry in entries if entry.get('state') == 'finished' and entry.get('wall')]
+        runs[project] = {
+            'runs': len(entries),
+            'failed': sum(1 for entry in entries if entry.get('state') != 'finished' or entry.get('exit_code')),
+            'median_wall': round(statistics.median(walls), 3) if walls else None,
+            'last_state': entries[-1].get('state'),
+            'last_flags': entries[-1].get('flags', [])
+        }
+
+    if args.json:
+        print_json({'indexed': index['built'], 'categories': categories, 'runs': runs})
+        return 0
+    print(f"Index built {time.strftime('%Y-%m-%d %H:%M', time.localtime(index['built']))}")
+    for category, totals in categories.items():
+        languages = sorted(totals['languages'].items(), key=lambda item: -item[1])[:3]
+        print(f"{category}: {totals['projects']} project(s), {totals['files']} file(s), "
+              f"{format_size(totals['size'])}"
+              + (f" ({', '.join(language for language, count in languages)})" if languages else ''))
+    if runs:
+        print("Runs:")
+        for project, summary in runs.items():
+            median = f"median {summary['median_wall']:.2f}s" if summary['median_wall'] is not None else 'no clean runs'
+            print(f"  {project}: {summary['runs']} run(s), {summary['failed']} failed, {median}, "
+                  f"last {summary['last_state']}")
+            for flag in summary['last_flags']:
+                print(f"    {flag}")
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='devspace', description="Manage the developer workspace without the GUI")
+    parser.add_argument('--workspace', help="workspace folder (default: %(default)s)", default=default_workspace_dir())
+    parser.add_argument('--trace', metavar='PATH', default=os.environ.get(TRACE_ENV),
+                        help="save a Chrome trace (or PATH.speedscope.json) of the command")
+    parser.add_argument('--log', metavar='LEVELS', default=os.environ.get(LOG_ENV, ''),
+                        help="diagnostic log levels, e.g. info or warning,run=debug (default: warning)")
+    parser.add_argument('--log-file', metavar='PATH', default=os.environ.get(LOG_FILE_ENV),
+                        help="also write diagnostics to a rotating log file")
+    commands = parser.add_subparsers(dest='command', required=True)
+    types = project_types()
+    categories = list(types)
+
+    list_parser = commands.add_parser('list', help="list projects")
+    list_parser.add_argument('categories', nargs='*', metavar='CATEGORY', help=f"one of {', '.join(categories)}")
+    list_parser.add_argument('--json', action='store_true')
+    list_parser.set_defaults(handler=command_list)
+
+    run_parser = commands.add_parser('run', help="run a project in the foreground")
+    run_parser.add_argument('category', choices=[key for key, project_type in types.items() if project_type.runnable])
+    run_parser.add_argument('project')
+    run_parser.add_argument('--timeout', type=int, default=0, help="seconds before the run is stopped")
+    run_parser.add_argument('args', nargs='*', help="arguments passed to the project (put any options after --)")
+    run_parser.set_defaults(handler=command_run)
+
+    move_parser = commands.add_parser('move', help="move files or folders into the workspace")
+    move_parser.add_argument('sources', nargs='+', metavar='SOURCE')
+    move_parser.add_argument('category', choices=categories)
+    move_parser.add_argument('--replace', action='store_true', help="replace projects that already exist")
+    move_parser.set_defaults(handler=command_move)
+
+    search_parser = commands.add_parser('search', help="find projects by name or content")
+    search_parser.add_argument('pattern', help="project name glob or substring")
+    search_parser.add_argument('--category', action='append', choices=categories)
+    search_parser.add_argument('--content', metavar='REGEX', help="search lines of the matching projects' files")
+    search_parser.add_argument('--json', action='store_true')
+    search_parser.set_defaults(handler=command_search)
+
+    index_parser = commands.add_parser('index', help="rebuild the project index")
+    index_parser.set_defaults(handler=command_index)
+
+    stats_parser = commands.add_parser('stats', help="show workspace and run statistics")
+    stats_parser.add_argument('--refresh', action='store_true', help="rebuild the index first")
+    stats_parser.add_argument('--json', action='store_true')
+    stats_parser.set_defaults(handler=command_stats)
+    return parser
+
+def parse_args(parser, argv):
+    """Parse a command line, passing everything after -- and stray positionals to the project of run.
+
+    argparse fills run's optional args positional (with nothing) before it
+    sees --timeout, so arguments after the options would be rejected.
+    """
+    argv = list(argv)
+    passthrough = []
+    if '--' in argv:
+        split = argv.index('--')
+        argv, passthrough = argv[:split], argv[split + 1:]
+    args, extra = parser.parse_known_args(argv)
+    if args.command == 'run':
+        unknown = [arg for arg in extra if arg.startswith('-')]
+        if not unknown:
+            args.args = args.args + extra + passthrough
+            return args
+        extra = unknown
+    elif passthrough:
+        extra = extra + ['--'] + passthrough
+    if extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    return args
+
+def main(argv=None):
+    parser = build_parser()
+    args = parse_args(parser, sys.argv[1:] if argv is None else argv)
+    try:
+        parse_log_levels(args.log)
+    except ValueError as e:
+        parser.error(str(e))
+    configure_logging(args.log, args.log_file)
+    if args.trace:
+        TRACER.start(args.trace)
+    try:
+        with TRACER.span(f"devspace {args.command}"):
+            return args.handler(Workspace(args.workspace), args)
+    except re.error as e:
+        print(f"Invalid pattern: {e}", file=sys.stderr)
+        return 2
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,2408 @@
+import ast
+import atexit
+import builtins
+import email.utils
+import functools
+import gzip
+import hashlib
+import importlib
+import importlib.util
+import json
+import logging
+import logging.handlers
+import mimetypes
+import multiprocessing.context
+import os
+import py_compile
+import queue
+import re
+import runpy
+import shutil
+import signal
+import statistics
+import struct
+import sys
+import threading
+import time
+import unittest
+import urllib.parse
+import zlib
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11, pyproject.toml dependencies are not read
+    tomllib = None
+
+try:
+    import resource
+except ImportError:  # Windows, usage of exited children is not available
+    resource = None
+
+# Names available in every module without being bound in it
+MODULE_GLOBALS = {
+    '__file__', '__name__', '__doc__', '__builtins__', '__spec__', '__loader__',
+    '__package__', '__path__', '__annotations__', '__dict__', '__class__', '__debug__'
+}
+BUILTIN_NAMES = set(dir(builtins)) | MODULE_GLOBALS
+
+# Folders never scanned inside a project
+SKIP_DIRS = {'.git', '__pycache__', 'node_modules', '.venv', 'venv', '.mypy_cache'}
+
+# Diagnostics go to a 'devspace.<subsystem>' logger per subsystem. DEVSPACE_LOG
+# sets levels, e.g. "info" or "warning,run=debug", and DEVSPACE_LOG_FILE adds a
+# rotating log file.
+LOG_ROOT = 'devspace'
+LOG_ENV = 'DEVSPACE_LOG'
+LOG_FILE_ENV = 'DEVSPACE_LOG_FILE'
+LOG_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+LOG_FILE_BYTES = 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+def get_logger(subsystem):
+    return logging.getLogger(f'{LOG_ROOT}.{subsystem}')
+
+def parse_log_levels(spec):
+    """Parse "LEVEL,subsystem=LEVEL,..." into {subsystem: level}, '' being the default level"""
+    levels = {}
+    for part in spec.split(','):
+        if not part.strip():
+            continue
+        subsystem, _, name = part.rpartition('=')
+        level = logging.getLevelName(name.strip().upper())
+        if not isinstance(level, int):
+            raise ValueError(f"Unknown log level: {name.strip()}")
+        levels[subsystem.strip()] = level
+    return levels
+
+def configure_logging(levels=None, log_file=None):
+    """Set the subsystem log levels and add the console and optional rotating file handlers.
+
+    levels is a parse_log_levels() spec, DEVSPACE_LOG by default; only
+    warnings and errors are logged unless it says otherwise. Messages are
+    formatted only when their level is enabled.
+    """
+    error = None
+    if levels is None:
+        levels = os.environ.get(LOG_ENV, '')
+    try:
+        levels = parse_log_levels(levels)
+    except ValueError as e:
+        levels, error = {}, e
+    if log_file is None:
+        log_file = os.environ.get(LOG_FILE_ENV) or None
+    
+    root = logging.getLogger(LOG_ROOT)
+    root.setLevel(levels.pop('', logging.WARNING))
+    for subsystem, level in levels.items():
+        get_logger(subsystem).setLevel(level)
+    root.propagate = False
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    
+    formatter = logging.Formatter(LOG_FORMAT)
+    if sys.stderr is not None:  # None under pythonw
+        handler = logging.StreamHandler()
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+    if log_file:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=LOG_FILE_BYTES, backupCount=LOG_FILE_BACKUPS, encoding='utf-8', delay=True)
+            handler.setFormatter(formatter)
+            root.addHandler(handler)
+        except OSError as e:
+            root.error("Could not open log file %s: %s", log_file, e)
+    if error is not None:
+        root.warning("Ignoring %s: %s", LOG_ENV, error)
+    return root
+
+plugins_log = get_logger('plugins')
+logs_log = get_logger('logs')
+trace_log = get_logger('trace')
+
+def default_workspace_dir():
+    """Return the workspace folder in the user's Documents folder"""
+    return os.path.join(os.path.expanduser("~/Documents"), "DeveloperWorkspace")
+
+def workspace_dirs(workspace_dir):
+    """Return the project folder of each category in a workspace"""
+    return {key: os.path.join(workspace_dir, project_type.folder) for key, project_type in project_types().items()}
+
+def iter_project_files(path, extensions):
+    """Yield files under a project folder (or the path itself) with the given extensions"""
+    if os.path.isfile(path):
+        if path.lower().endswith(extensions):
+            yield path
+        return
+
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            pending.append(entry.path)
+                    elif entry.name.lower().endswith(extensions):
+                        yield entry.path
+        except OSError:
+            continue
+
+def project_snapshot(path, suffixes):
+    """Return ({file: (mtime_ns, size)}, [folders]) for files under a project with the given suffixes"""
+    files = {}
+    folders = []
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            folders.append(entry.path)
+                            pending.append(entry.path)
+                    elif entry.name.lower().endswith(suffixes):
+                        stat = entry.stat()
+                        files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            continue
+    return files, folders
+
+def snapshot_changes(old, new):
+    """Return the files added, removed or modified between two snapshots"""
+    changed = {file_path for file_path, stamp in new.items() if old.get(file_path) != stamp}
+    changed.update(file_path for file_path in old if file_path not in new)
+    return sorted(changed)
+
+# File extensions shown as languages in folder summaries
+LANGUAGE_EXTENSIONS = {
+    '.py': 'Python', '.pyw': 'Python', '.html': 'HTML', '.htm': 'HTML',
+    '.css': 'CSS', '.js': 'JavaScript', '.ts': 'TypeScript', '.json': 'JSON',
+    '.bat': 'Batch', '.cmd': 'Batch', '.ps1': 'PowerShell', '.psm1': 'PowerShell',
+    '.md': 'Markdown', '.txt': 'Text', '.xml': 'XML', '.yml': 'YAML', '.yaml': 'YAML',
+    '.ini': 'INI', '.toml': 'TOML', '.sql': 'SQL', '.sh': 'Shell', '.c': 'C',
+    '.cpp': 'C++', '.h': 'C/C++ Header', '.cs': 'C#', '.java': 'Java',
+}
+
+# Files that usually start a project, in order of preference
+ENTRY_POINT_NAMES = [
+    '__main__.py', 'main.py', 'app.py', 'run.py', 'index.html',
+    'manifest.json', 'main.ps1', 'run.bat', 'start.bat',
+]
+
+# Stop walking very large folders after this many entries
+SUMMARY_MAX_ENTRIES = 20000
+
+def format_size(size):
+    """Format a byte count for display"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+def summarize_folder(path, cancel_event=None):
+    """Collect a project summary for a folder with a single scandir walk"""
+    summary = {
+        'files': 0, 'folders': 0, 'size': 0, 'languages': {},
+        'entry_point': None, 'modified': None, 'readme': None, 'truncated': False
+    }
+    top_level_files = []
+    readme_path = None
+    entries_seen = 0
+    pending = [path]
+    
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    entries_seen += 1
+                    if entries_seen > SUMMARY_MAX_ENTRIES:
+                        summary['truncated'] = True
+                        pending.clear()
+                        break
+                    if cancel_event is not None and cancel_event.is_set():
+                        return None
+                    
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            summary['folders'] += 1
+                            pending.append(entry.path)
+                        continue
+                    
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    summary['files'] += 1
+                    summary['size'] += stat.st_size
+                    if summary['modified'] is None or stat.st_mtime > summary['modified']:
+                        summary['modified'] = stat.st_mtime
+                    
+                    language = LANGUAGE_EXTENSIONS.get(os.path.splitext(entry.name)[1].lower())
+                    if language:
+                        summary['languages'][language] = summary['languages'].get(language, 0) + 1
+                    
+                    if current == path:
+                        top_level_files.append(entry.name)
+                        if readme_path is None and entry.name.lower().startswith('readme'):
+                            readme_path = entry.path
+        except OSError:
+            continue
+    
+    # Detect entry point among the top-level files
+    for name in ENTRY_POINT_NAMES:
+        if name in top_level_files:
+            summary['entry_point'] = name
+            break
+    else:
+        for ext in ('.py', '.bat', '.ps1', '.html'):
+            candidates = sorted(f for f in top_level_files if f.lower().endswith(ext))
+            if len(candidates) == 1:
+                summary['entry_point'] = candidates[0]
+                break
+    
+    # README excerpt
+    if readme_path:
+        try:
+            with open(readme_path, 'r', encoding='utf-8', errors='replace') as file:
+                summary['readme'] = file.read(800).strip()
+        except OSError:
+            pass
+    
+    return summary
+
+def check_python_source(source, filename='<string>'):
+    """Return lint-style diagnostics for Python source as (lineno, code, message) tuples.
+
+    Reports syntax errors (E999), unused imports (F401) and undefined
+    names (F821). Name resolution ignores scopes, so a name counts as
+    defined if it is bound anywhere in the file; this keeps false
+    positives rare at the cost of missing some real errors.
+    """
+    try:
+        tree = ast.parse(source, filename)
+    except SyntaxError as e:
+        return [(e.lineno or 1, 'E999', f"SyntaxError: {e.msg}")]
+    except ValueError as e:  # e.g. null bytes
+        return [(1, 'E999', str(e))]
+
+    bound = set()
+    loaded = {}
+    imports = []
+    star_import = False
+    exported = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if isinstance(node.ctx, ast.Load):
+                loaded.setdefault(node.id, node.lineno)
+            else:
+                bound.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.add(node.name)
+        elif isinstance(node, ast.arg):
+            bound.add(node.arg)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            if isinstance(node, ast.ImportFrom) and node.module == '__future__':
+                continue
+            for alias in node.names:
+                if alias.name == '*':
+                    star_import = True
+                    continue
+                name = alias.asname or alias.name.split('.')[0]
+                bound.add(name)
+                # "import x as x" marks an intentional re-export
+                if alias.asname is None or alias.asname != alias.name:
+                    imports.append((name, node.lineno))
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            bound.add(node.name)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            bound.update(node.names)
+        elif isinstance(node, (ast.MatchAs, ast.MatchStar)) and node.name:
+            bound.add(node.name)
+        elif isinstance(node, ast.MatchMapping) and node.rest:
+            bound.add(node.rest)
+        elif isinstance(node, ast.Assign):
+            # Names listed in __all__ count as used
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id == '__all__':
+                    if isinstance(node.value, (ast.List, ast.Tuple)):
+                        exported.update(
+                            elt.value for elt in node.value.elts
+                            if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                        )
+
+    diagnostics = []
+    if os.path.basename(filename) != '__init__.py':
+        reported = set()
+        for name, lineno in imports:
+            if name not in loaded and name not in exported and name not in reported:
+                reported.add(name)
+                diagnostics.append((lineno, 'F401', f"'{name}' imported but unused"))
+
+    if not star_import:
+        for name, lineno in loaded.items():
+            if name not in bound and name not in BUILTIN_NAMES:
+                diagnostics.append((lineno, 'F821', f"undefined name '{name}'"))
+
+    diagnostics.sort()
+    return diagnostics
+
+def bytecode_stale(source_path):
+    """Return True if a source file's cached bytecode is missing or out of date"""
+    try:
+        stat = os.stat(source_path)
+        with open(importlib.util.cache_from_source(source_path), 'rb') as f:
+            header = f.read(16)
+    except (OSError, ValueError):
+        return True
+    if len(header) < 16 or header[:4] != importlib.util.MAGIC_NUMBER or int.from_bytes(header[4:8], 'little'):
+        return True  # Other interpreter, or hash-based bytecode
+    mtime = int.from_bytes(header[8:12], 'little')
+    size = int.from_bytes(header[12:16], 'little')
+    return mtime != int(stat.st_mtime) & 0xFFFFFFFF or size != stat.st_size & 0xFFFFFFFF
+
+def compile_python_files(source_paths):
+    """Byte-compile files into their __pycache__, returning (path, error or None) for each"""
+    results = []
+    for source_path in source_paths:
+        try:
+            py_compile.compile(source_path, doraise=True,
+                               invalidation_mode=py_compile.PycInvalidationMode.TIMESTAMP)
+            results.append((source_path, None))
+        except py_compile.PyCompileError as e:
+            results.append((source_path, f"{e.exc_type_name}: {e.exc_value}"))
+        except OSError as e:
+            results.append((source_path, str(e)))
+    return results
+
+_spawn_lock = threading.Lock()
+
+class CoreSpawnProcess(multiprocessing.context.SpawnProcess):
+    """A spawned process that runs devspace_core as its main module instead of the parent's script.
+
+    A spawned child re-runs the parent's __main__ before it can unpickle
+    any work, which for the GUI means importing PyQt6 and defining every
+    widget. Pooled work only needs this module, so __main__ is swapped for
+    it while the child's start-up data is written.
+    """
+
+    @staticmethod
+    def _Popen(process_obj):
+        with _spawn_lock:
+            main = sys.modules['__main__']
+            sys.modules['__main__'] = sys.modules[__name__]
+            try:
+                return multiprocessing.context.SpawnProcess._Popen(process_obj)
+            finally:
+                sys.modules['__main__'] = main
+
+class CoreSpawnContext(multiprocessing.context.SpawnContext):
+    """Spawn context for process pools whose workers should not import the app"""
+    Process = CoreSpawnProcess
+
+def python_interpreter(windowed=True):
+    """Return the interpreter used to launch Python projects.
+
+    On Windows the windowless pythonw.exe next to the current interpreter
+    is preferred so GUI apps don't flash a console.
+    """
+    if windowed and os.name == 'nt':
+        pythonw = os.path.join(os.path.dirname(sys.executable), 'pythonw.exe')
+        if os.path.exists(pythonw):
+            return pythonw
+    return sys.executable
+
+def build_launch_command(kind, script_path, interpreter=None):
+    """Return the argument vector that runs a script of the given kind on this platform"""
+    if kind == 'python':
+        # Unbuffered so output streams to the output pane as it is printed
+        return [interpreter or python_interpreter(), '-u', script_path]
+    if kind == 'batch':
+        if os.name == 'nt':
+            return ['cmd', '/c', script_path]
+        return ['sh', script_path]
+    if kind == 'powershell':
+        if os.name == 'nt':
+            return ['powershell', '-NoProfile', '-ExecutionPolicy', 'Bypass', '-File', script_path]
+        return ['pwsh', '-NoProfile', '-File', script_path]
+    raise ValueError(f"Unknown script kind: {kind}")
+
+def batch_extensions():
+    """Return the shell script extensions runnable on this platform"""
+    return ('.bat', '.cmd') if os.name == 'nt' else ('.sh',)
+
+class ProjectType:
+    """A category of project: its workspace folder, how it is shown and how it runs.
+
+    runner is 'python' (entry point run in the project's environment),
+    'script' (batch or PowerShell entry point), 'browser' (served with live
+    reload), 'package' (built into an extension zip) or a 'module:attribute'
+    plugin runner. icon names a QStyle standard pixmap or an image file.
+    """
+
+    def __init__(self, key, title, folder, runner='script', icon='SP_DirIcon', tree_title=None,
+                 entry_extensions=(), watch_files=(), python=False, fast_run=False,
+                 new_label="New Project", run_label="Run", starter_file=None):
+        self.key = key
+        self.title = title
+        self.folder = folder
+        self.runner = runner
+        self.icon = icon
+        self.tree_title = tree_title or title
+        self.entry_extensions = tuple(entry_extensions)
+        self.watch_files = tuple(watch_files)
+        self.python = python  # Outline, static checks, tests and precompilation
+        self.fast_run = fast_run
+        self.new_label = new_label
+        self.run_label = run_label
+        self.starter_file = starter_file
+        self._runner = None
+
+    @property
+    def plugin(self):
+        return ':' in self.runner
+
+    @property
+    def runnable(self):
+        """Whether projects of this type are launched as a process"""
+        return self.plugin or bool(self.entry_extensions)
+
+    def load_runner(self):
+        """Return the plugin runner, importing its module on first use.
+
+        A runner has a command(project_dir, script_path) method returning the
+        argument vector to launch; script_path is the resolved entry point, or
+        None when the type declares no entry extensions.
+        """
+        if self._runner is None:
+            module_name, _, attribute = self.runner.partition(':')
+            runner = getattr(importlib.import_module(module_name), attribute)
+            self._runner = runner() if isinstance(runner, type) else runner
+        return self._runner
+
+    def command(self, project_dir, script_path):
+        """Return the argument vector launching a non-Python project"""
+        if self.plugin:
+            return list(self.load_runner().command(project_dir, script_path))
+        # Batch files rank ahead of .ps1 unless an override says otherwise
+        kind = 'powershell' if script_path.lower().endswith('.ps1') else 'batch'
+        return build_launch_command(kind, script_path)
+
+PYTHON_WATCH_FILES = ('.py', '.pyw', '.cfg', '.ini', '.toml', 'requirements.txt')
+HTML_WATCH_FILES = ('.html', '.htm', '.css', '.js', '.mjs', '.json', '.svg', '.png', '.jpg', '.jpeg', '.gif', '.webp')
+
+BUILTIN_PROJECT_TYPES = [
+    ProjectType('ubif', "UBIF", "UBIF_Projects", runner='python', icon='SP_ComputerIcon',
+                tree_title="UBIF Projects", entry_extensions=('.py',), watch_files=PYTHON_WATCH_FILES,
+                python=True, starter_file='main.py'),
+    ProjectType('html', "HTML", "HTML_Projects", runner='browser', icon='SP_FileDialogContentsView',
+                tree_title="HTML Projects", watch_files=HTML_WATCH_FILES, starter_file='index.html'),
+    ProjectType('chrome', "Chrome Extensions", "Chrome_Extensions", runner='package', icon='SP_DriveNetIcon',
+                run_label="Package", starter_file='manifest.json'),
+    ProjectType('scripts', "Python Scripts", "Python_Scripts", runner='python', icon='SP_FileIcon',
+                entry_extensions=('.py',), watch_files=PYTHON_WATCH_FILES, python=True, fast_run=True,
+                new_label="New Script", starter_file='main.py'),
+    ProjectType('apps', "Python Apps", "Python_Apps", runner='python', icon='SP_DesktopIcon',
+                entry_extensions=('.py',), watch_files=PYTHON_WATCH_FILES, python=True,
+                new_label="New App", starter_file='main.py'),
+    ProjectType('batch', "Batch Scripts", "Batch_Scripts", icon='SP_CommandLink',
+                entry_extensions=batch_extensions(), watch_files=batch_extensions() + ('.ps1', '.py'),
+                new_label="New Script", starter_file='run.bat' if os.name == 'nt' else 'run.sh'),
+    ProjectType('powershell', "PowerShell Apps", "PowerShell_Apps", icon='SP_MediaPlay',
+                entry_extensions=batch_extensions() + ('.ps1',), watch_files=batch_extensions() + ('.ps1', '.py'),
+                new_label="New App", starter_file='main.ps1'),
+]
+
+# Entry point group plugins register extra ProjectTypes under
+PROJECT_TYPE_GROUP = 'devspace.project_types'
+
+_project_types = {}
+
+def project_types():
+    """Return the project types by key, built-in types first, then plugin types.
+
+    Only the module declaring a plugin type is imported here; its runner is
+    imported the first time one of its projects is run.
+    """
+    if not _project_types:
+        _project_types.update((project_type.key, project_type) for project_type in BUILTIN_PROJECT_TYPES)
+        try:
+            import importlib.metadata
+            entry_points = importlib.metadata.entry_points(group=PROJECT_TYPE_GROUP)
+        except Exception as e:
+            plugins_log.error("Error reading project type plugins: %s", e)
+            entry_points = ()
+        for entry_point in entry_points:
+            try:
+                project_type = entry_point.load()
+            except Exception as e:
+                plugins_log.error("Error loading project type plugin %s: %s", entry_point.name, e)
+                continue
+            if not isinstance(project_type, ProjectType) or project_type.key in _project_types:
+                plugins_log.warning("Ignoring project type plugin %s", entry_point.name)
+                continue
+            _project_types[project_type.key] = project_type
+    return _project_types
+
+def move_into_workspace(source_path, destination):
+    """Move a file or folder into a workspace folder, replacing nothing.
+
+    On the same drive this is a rename; across drives shutil.move copies
+    and then removes the source.
+    """
+    if os.path.exists(destination):
+        raise FileExistsError(f"{destination} already exists")
+    shutil.move(source_path, destination)
+    return destination
+
+# Modules every warm worker imports before it is handed a script
+WARM_PRELOAD_MODULES = [
+    'argparse', 'collections', 'csv', 'dataclasses', 'datetime', 'functools',
+    'itertools', 'json', 'logging', 'math', 'pathlib', 're', 'random', 'shutil',
+    'subprocess', 'threading', 'typing', 'urllib.request',
+]
+
+def script_imports(script_path):
+    """Return the absolute top-level modules a script imports, excluding its own local modules"""
+    try:
+        with open(script_path, 'rb') as f:
+            tree = ast.parse(f.read(), script_path)
+    except (OSError, SyntaxError, ValueError):
+        return []
+    
+    folder = os.path.dirname(script_path)
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            root = name.split('.')[0]
+            local = (os.path.exists(os.path.join(folder, root + '.py')) or
+                     os.path.isdir(os.path.join(folder, root)))
+            if not local and root not in modules:
+                modules.append(root)
+    return modules
+
+def warm_worker_command(interpreter, preload):
+    """Return the argument vector that starts a warm worker"""
+    return [interpreter, '-u', os.path.abspath(__file__), '--warm-worker'] + list(preload)
+
+def warm_worker_main(preload):
+    """Import modules up front, then run the one script sent as a JSON line on stdin"""
+    for name in preload:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # A module that fails to preload is imported (and fails) in the script itself
+    
+    line = sys.stdin.readline()
+    if not line:
+        return
+    job = json.loads(line)
+    script = os.path.abspath(job['script'])
+    os.chdir(job.get('cwd') or os.path.dirname(script))
+    if job.get('usage') and resource is not None:
+        from devspace_launch import write_usage  # While sys.path still finds it
+
+        def report_usage(before=script_usage()):
+            cpu, peak_rss = script_usage()
+            # Less the CPU preloading took; the peak includes the preloaded modules
+            write_usage(job['usage'], {'pid': os.getpid(), 'cpu': cpu - before[0], 'peak_rss': peak_rss})
+        atexit.register(report_usage)
+    sys.argv = [script] + job.get('args', [])
+    sys.path[0] = os.path.dirname(script)
+    runpy.run_path(script, run_name='__main__')
+
+def script_usage():
+    """Return (cpu_seconds, peak_rss_bytes) of this process and the children it waited for"""
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # ru_maxrss is in kilobytes except on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return (own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime,
+            max(own.ru_maxrss, children.ru_maxrss) * scale)
+
+def has_main_guard(script_path):
+    """Return True if a script has a top-level if __name__ == "__main__" block"""
+    try:
+        with open(script_path, 'rb') as f:
+            tree = ast.parse(f.read(), script_path)
+    except (OSError, SyntaxError, ValueError):
+        return False
+    
+    for node in tree.body:
+        if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare):
+            continue
+        test = node.test
+        if len(test.ops) != 1 or not isinstance(test.ops[0], ast.Eq):
+            continue
+        sides = [test.left, test.comparators[0]]
+        if (any(isinstance(side, ast.Name) and side.id == '__name__' for side in sides) and
+                any(isinstance(side, ast.Constant) and side.value == '__main__' for side in sides)):
+            return True
+    return False
+
+class EntryPointResolver:
+    """Pick the file that starts a project, deterministically.
+    
+    Candidates are the project's top-level files with the requested
+    extensions (earlier extensions win). An explicit per-project override
+    always wins; otherwise __main__.py, then main.*, then Python files with
+    a __main__ guard, then files named after the project or app/run/start,
+    then everything else by name. Helper-looking files (_*, test*, setup.py)
+    come last. Results are cached per project until its folder mtime or
+    override changes.
+    """
+    PREFERRED_NAMES = ('app', 'run', 'start')
+    UNLIKELY_NAMES = ('setup.py', 'conftest.py')
+
+    def __init__(self, overrides_path):
+        self.overrides_path = overrides_path
+        self.overrides = None
+        self.cache = {}
+
+    def load_overrides(self):
+        if self.overrides is None:
+            try:
+                with open(self.overrides_path, 'r', encoding='utf-8') as f:
+                    self.overrides = json.load(f)
+            except (OSError, ValueError):
+                self.overrides = {}
+        return self.overrides
+
+    def override(self, project_dir):
+        return self.load_overrides().get(os.path.abspath(project_dir))
+
+    def set_override(self, project_dir, filename):
+        """Set (or with filename None, clear) the entry point of a project"""
+        overrides = self.load_overrides()
+        key = os.path.abspath(project_dir)
+        if filename:
+            overrides[key] = filename
+        else:
+            overrides.pop(key, None)
+        
+        os.makedirs(os.path.dirname(self.overrides_path), exist_ok=True)
+        temp_path = self.overrides_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(overrides, f, indent=2)
+        os.replace(temp_path, self.overrides_path)
+
+    def candidates(self, project_dir, extensions):
+        """Return the project's candidate files, best first"""
+        project_name = os.path.basename(os.path.normpath(project_dir)).lower()
+        ranked = []
+        with os.scandir(project_dir) as entries:
+            for entry in entries:
+                lower = entry.name.lower()
+                ext_rank = next((i for i, ext in enumerate(extensions) if lower.endswith(ext)), None)
+                if ext_rank is None or not entry.is_file():
+                    continue
+                
+                stem = os.path.splitext(lower)[0]
+                if lower == '__main__.py':
+                    name_rank = 0
+                elif stem == 'main':
+                    name_rank = 1
+                elif stem == project_name or stem in self.PREFERRED_NAMES:
+                    name_rank = 3
+                elif lower.startswith(('_', 'test')) or lower in self.UNLIKELY_NAMES:
+                    name_rank = 5
+                else:
+                    name_rank = 4
+                guarded = name_rank > 1 and lower.endswith('.py') and has_main_guard(entry.path)
+                ranked.append(((ext_rank, min(name_rank, 2), not guarded, name_rank, lower), entry.name))
+        return [name for key, name in sorted(ranked)]
+
+    def resolve(self, project_dir, extensions):
+        """Return the full path of the project's entry point, or None"""
+        try:
+            mtime = os.stat(project_dir).st_mtime_ns
+        except OSError:
+            return None
+        override = self.override(project_dir)
+        key = (os.path.abspath(project_dir), tuple(extensions))
+        cached = self.cache.get(key)
+        if cached and cached[0] == mtime and cached[1] == override:
+            return cached[2]
+        
+        if override and os.path.isfile(os.path.join(project_dir, override)):
+            result = os.path.join(project_dir, override)
+        else:
+            candidates = self.candidates(project_dir, extensions)
+            result = os.path.join(project_dir, candidates[0]) if candidates else None
+        self.cache[key] = (mtime, override, result)
+        return result
+
+class EnvironmentManager:
+    """Build one virtualenv per distinct dependency spec and reuse it across runs.
+
+    A project's spec is its requirements.txt and the dependencies listed in
+    pyproject.toml. Environments live in a shared cache keyed by a hash of
+    the spec and the interpreter version, so projects with the same spec
+    share one environment and a rebuild only happens when the spec changes.
+    They see the base interpreter's site-packages, so packages that are
+    already installed there are not downloaded again.
+    """
+    READY_MARKER = '.devspace-ready'
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def dependency_spec(self, project_dir):
+        """Return (digest, pip install arguments) for a project, or None if it declares nothing"""
+        hasher = hashlib.sha256()
+        pip_args = []
+        
+        requirements = os.path.join(project_dir, 'requirements.txt')
+        if os.path.isfile(requirements):
+            with open(requirements, 'rb') as f:
+                hasher.update(b'requirements.txt\0' + f.read())
+            pip_args += ['-r', requirements]
+        
+        pyproject = os.path.join(project_dir, 'pyproject.toml')
+        if tomllib is not None and os.path.isfile(pyproject):
+            try:
+                with open(pyproject, 'rb') as f:
+                    dependencies = tomllib.load(f).get('project', {}).get('dependencies', [])
+            except (OSError, ValueError):
+                dependencies = []
+            if dependencies:
+                hasher.update(b'pyproject.toml\0' + '\n'.join(dependencies).encode('utf-8'))
+                pip_args += dependencies
+        
+        if not pip_args:
+            return None
+        hasher.update(f"{sys.version_info[0]}.{sys.version_info[1]}-{sys.platform}".encode('utf-8'))
+        return hasher.hexdigest()[:16], pip_args
+
+    def env_dir(self, digest):
+        return os.path.join(self.cache_dir, digest)
+
+    def env_python(self, digest, windowed=True):
+        """Return the interpreter inside an environment"""
+        if os.name == 'nt':
+            name = 'pythonw.exe' if windowed else 'python.exe'
+            return os.path.join(self.env_dir(digest), 'Scripts', name)
+        return os.path.join(self.env_dir(digest), 'bin', 'python')
+
+    def is_ready(self, digest):
+        return os.path.exists(os.path.join(self.env_dir(digest), self.READY_MARKER))
+
+    def prepare(self, project_dir):
+        """Return (digest, interpreter, setup commands) for running a project.
+
+        The commands are empty when no build is needed; digest is None for
+        projects without a dependency spec, which run on the base interpreter.
+        """
+        spec = self.dependency_spec(project_dir)
+        if spec is None:
+            return None, python_interpreter(), []
+        
+        digest, pip_args = spec
+        interpreter = self.env_python(digest)
+        if self.is_ready(digest):
+            return digest, interpreter, []
+        
+        env_dir = self.env_dir(digest)
+        console_python = self.env_python(digest, windowed=False)
+        commands = [
+            [sys.executable, '-m', 'venv', '--clear', '--system-site-packages', env_dir],
+            [console_python, '-m', 'pip', 'install', '--disable-pip-version-check'] + pip_args,
+            # Only reached if everything above succeeded
+            [console_python, '-c', "import sys; open(sys.argv[1], 'w').close()",
+             os.path.join(env_dir, self.READY_MARKER)],
+        ]
+        return digest, interpreter, commands
+
+def process_usage(pid):
+    """Return (cpu_seconds, peak_rss_bytes) of a running process, or None if it cannot be read.
+
+    On Linux the CPU time includes children the process has waited for (the
+    script a batch shell ran, for example).
+    """
+    if not pid:
+        return None
+    try:
+        if os.name == 'nt':
+            return _windows_process_usage(pid)
+        with open(f'/proc/{pid}/stat', 'r') as f:
+            # Fields after the command name, which may itself contain spaces
+            fields = f.read().rsplit(')', 1)[1].split()
+        ticks = sum(int(value) for value in fields[11:15])  # utime, stime, cutime, cstime
+        peak_rss = None
+        with open(f'/proc/{pid}/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    peak_rss = int(line.split()[1]) * 1024
+                    break
+        return ticks / os.sysconf('SC_CLK_TCK'), peak_rss
+    except (OSError, ValueError, IndexError):
+        return None
+
+@functools.lru_cache(maxsize=None)
+def _win32():
+    """Return kernel32 and psapi with the prototypes used here declared.
+
+    Without them HANDLE results are truncated to a C int on 64-bit Windows,
+    and use_last_error keeps each call's error code for ctypes.get_last_error().
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    psapi = ctypes.WinDLL('psapi', use_last_error=True)
+    prototypes = [
+        (kernel32.OpenProcess, wintypes.HANDLE, [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]),
+        (kernel32.CloseHandle, wintypes.BOOL, [wintypes.HANDLE]),
+        (kernel32.GetProcessTimes, wintypes.BOOL, [wintypes.HANDLE] + [ctypes.POINTER(wintypes.FILETIME)] * 4),
+        (kernel32.CreateJobObjectW, wintypes.HANDLE, [ctypes.c_void_p, wintypes.LPCWSTR]),
+        (kernel32.SetInformationJobObject, wintypes.BOOL,
+         [wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, wintypes.DWORD]),
+        (kernel32.AssignProcessToJobObject, wintypes.BOOL, [wintypes.HANDLE, wintypes.HANDLE]),
+        (kernel32.TerminateJobObject, wintypes.BOOL, [wintypes.HANDLE, wintypes.UINT]),
+        (psapi.GetProcessMemoryInfo, wintypes.BOOL, [wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD]),
+    ]
+    for function, restype, argtypes in prototypes:
+        function.restype = restype
+        function.argtypes = argtypes
+    return kernel32, psapi
+
+def _windows_process_usage(pid):
+    handle = ProcessHandle(pid)
+    try:
+        return handle.usage()
+    finally:
+        handle.close()
+
+class ProcessHandle:
+    """An open handle to a Windows process.
+
+    Windows keeps an exited process's times and memory counters while a
+    handle to it is open, so a handle taken when a command starts reads its
+    exact usage after it exits, which sampling by pid cannot.
+    """
+
+    def __init__(self, pid):
+        kernel32, psapi = _win32()
+        self.handle = kernel32.OpenProcess(0x1000 | 0x0010, False, pid)  # QUERY_LIMITED_INFORMATION | VM_READ
+
+    def usage(self):
+        """Return (cpu_seconds, peak_rss_bytes), or None if the process cannot be read"""
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)
+            ]
+
+        if not self.handle:
+            return None
+        kernel32, psapi = _win32()
+        creation, exit_time, kernel, user = (wintypes.FILETIME() for _ in range(4))
+        if not kernel32.GetProcessTimes(self.handle, ctypes.byref(creation), ctypes.byref(exit_time),
+                                        ctypes.byref(kernel), ctypes.byref(user)):
+            return None
+        cpu = sum((t.dwHighDateTime << 32 | t.dwLowDateTime) for t in (kernel, user)) / 1e7
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        if psapi.GetProcessMemoryInfo(self.handle, ctypes.byref(counters), counters.cb):
+            return cpu, counters.PeakWorkingSetSize
+        return cpu, None
+
+    def close(self):
+        if self.handle:
+            _win32()[0].CloseHandle(self.handle)
+            self.handle = None
+
+class RunHistory:
+    """Metrics of past runs per project, stored as JSON lines.
+
+    Each entry has the run's start time, wall and CPU seconds, peak RSS,
+    exit code, output size and final state. A run is flagged as a
+    regression when it took REGRESSION_FACTOR times the median of the
+    project's last BASELINE_RUNS comparable runs (clean exits that did not
+    build an environment), in wall time or memory.
+    """
+    MAX_RUNS = 200  # Kept per project
+    BASELINE_RUNS = 30
+    MIN_BASELINE_RUNS = 5
+    REGRESSION_FACTOR = 3.0
+
+    def __init__(self, path):
+        self.path = path
+        self.runs = None
+        self.lines = 0
+
+    def load(self):
+        if self.runs is None:
+            self.runs = {}
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        self.lines += 1
+                        try:
+                            entry = json.loads(line)
+                            self.runs.setdefault(entry['project'], []).append(entry)
+                        except (ValueError, KeyError, TypeError):
+                            continue  # Torn write
+            except OSError:
+                pass
+            for project in self.runs:
+                del self.runs[project][:-self.MAX_RUNS]
+        return self.runs
+
+    def project_runs(self, project):
+        return self.load().get(project, [])
+
+    def baseline(self, project, metric):
+        """Return (median, run count) of a metric over recent comparable runs, or None if too few"""
+        values = [
+            entry[metric] for entry in self.project_runs(project)
+            if entry.get('state') == 'finished' and entry.get('exit_code') == 0
+            and not entry.get('setup') and entry.get(metric)
+        ][-self.BASELINE_RUNS:]
+        if len(values) < self.MIN_BASELINE_RUNS:
+            return None
+        return statistics.median(values), len(values)
+
+    def regressions(self, project, entry):
+        """Describe how a new run compares badly against the project's history"""
+        flags = []
+        if entry.get('state') != 'finished' or entry.get('setup'):
+            return flags
+        for metric, description in (('wall', 'slower than'), ('peak_rss', 'the memory of')):
+            baseline = self.baseline(project, metric)
+            if baseline and entry.get(metric) and entry[metric] >= baseline[0] * self.REGRESSION_FACTOR:
+                flags.append(f"{entry[metric] / baseline[0]:.1f}\u00d7 {description} its {baseline[1]}-run median")
+        return flags
+
+    def add(self, project, entry):
+        """Record a run, flagging regressions against the runs before it"""
+        entry = dict(entry, project=project)
+        entry['flags'] = self.regressions(project, entry)
+        runs = self.load().setdefault(project, [])
+        runs.append(entry)
+        del runs[:-self.MAX_RUNS]
+        
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if self.lines >= 2 * self.MAX_RUNS and self.lines > 2 * sum(len(r) for r in self.runs.values()):
+            self.compact()
+        else:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+            self.lines += 1
+        return entry
+
+    def compact(self):
+        """Rewrite the store without runs that fell out of the per-project window"""
+        entries = sorted((e for runs in self.runs.values() for e in runs), key=lambda e: e.get('time', 0))
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + '\n')
+        os.replace(temp_path, self.path)
+        self.lines = len(entries)
+
+class RunLimits:
+    """Per-project run limits: wall-clock timeout, memory and CPU time.
+
+    Stored as JSON keyed by project folder; a value of 0 means no limit.
+    """
+    KEYS = ('timeout', 'memory_mb', 'cpu_seconds')
+
+    def __init__(self, path):
+        self.path = path
+        self.limits = None
+
+    def load(self):
+        if self.limits is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.limits = json.load(f)
+            except (OSError, ValueError):
+                self.limits = {}
+        return self.limits
+
+    def get(self, project_dir):
+        stored = self.load().get(os.path.abspath(project_dir), {})
+        return {key: int(stored.get(key, 0)) for key in self.KEYS}
+
+    def set(self, project_dir, limits):
+        """Store a project's limits, forgetting the project when none are set"""
+        all_limits = self.load()
+        key = os.path.abspath(project_dir)
+        limits = {name: int(limits.get(name, 0)) for name in self.KEYS if limits.get(name)}
+        if limits:
+            all_limits[key] = limits
+        else:
+            all_limits.pop(key, None)
+        
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(all_limits, f, indent=2)
+        os.replace(temp_path, self.path)
+
+def limited_command(argv, memory_mb=0, cpu_seconds=0, new_session=False, usage_path=None):
+    """Wrap a command so it starts with memory and CPU limits, optionally in its own session.
+
+    POSIX only: the wrapper (devspace_launch.py) applies setrlimit and execs
+    the command, so the process keeps the wrapper's pid. With usage_path the
+    wrapper instead forks the command, waits for it and exits the same way,
+    writing the command's pid and then its exact usage to usage_path (see
+    read_usage). Elsewhere the command is returned as is.
+    """
+    if os.name == 'nt' or not (memory_mb or cpu_seconds or new_session or usage_path):
+        return argv
+    launcher = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'devspace_launch.py')
+    return [sys.executable, launcher, str(memory_mb), str(cpu_seconds), str(int(new_session)),
+            usage_path or '', '--'] + list(argv)
+
+def read_usage(path):
+    """Return a command's usage report: its pid once it started, then cpu and peak_rss too.
+
+    Reports come from the launch wrapper or a warm worker. Returns an empty
+    dict while nothing has been written.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def signal_process_group(pid, kill=False):
+    """Signal the process group led by pid, returning False if pid does not lead one"""
+    if os.name == 'nt' or not pid:
+        return False
+    try:
+        if os.getpgid(pid) != pid:
+            return False
+        os.killpg(pid, signal.SIGKILL if kill else signal.SIGTERM)
+        return True
+    except OSError:
+        return False
+
+def process_group(pid):
+    """Return the process group led by pid, or None if it does not lead one (or on Windows)"""
+    if os.name == 'nt' or not pid:
+        return None
+    try:
+        return pid if os.getpgid(pid) == pid else None
+    except OSError:
+        return None
+
+def kill_process_group(pgid):
+    """Kill whatever is left of a process group, which may have lost its leader"""
+    if not pgid:
+        return
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+class WindowsJob:
+    """A Windows job object holding a run's process tree.
+
+    Processes started by a process in the job join it, so terminating the
+    job stops the whole tree. Memory and CPU limits apply to the job.
+
+    A process is added once it is running (QProcess and subprocess give no
+    way to create it suspended and resume it afterwards). Anything it starts
+    before assign() returns is outside the job: it is not stopped with the
+    run and not held to its limits.
+    """
+    JOB_OBJECT_LIMIT_JOB_TIME = 0x4
+    JOB_OBJECT_LIMIT_JOB_MEMORY = 0x200
+    JobObjectExtendedLimitInformation = 9
+
+    def __init__(self, memory_mb=0, cpu_seconds=0):
+        import ctypes
+        from ctypes import wintypes
+
+        class BasicLimits(ctypes.Structure):
+            _fields_ = [
+                ('PerProcessUserTimeLimit', ctypes.c_int64), ('PerJobUserTimeLimit', ctypes.c_int64),
+                ('LimitFlags', wintypes.DWORD), ('MinimumWorkingSetSize', ctypes.c_size_t),
+                ('MaximumWorkingSetSize', ctypes.c_size_t), ('ActiveProcessLimit', wintypes.DWORD),
+                ('Affinity', ctypes.c_size_t), ('PriorityClass', wintypes.DWORD),
+                ('SchedulingClass', wintypes.DWORD)
+            ]
+
+        class ExtendedLimits(ctypes.Structure):
+            _fields_ = [
+                ('BasicLimitInformation', BasicLimits), ('IoInfo', ctypes.c_uint64 * 6),
+                ('ProcessMemoryLimit', ctypes.c_size_t), ('JobMemoryLimit', ctypes.c_size_t),
+                ('PeakProcessMemoryUsed', ctypes.c_size_t), ('PeakJobMemoryUsed', ctypes.c_size_t)
+            ]
+
+        self.kernel32 = _win32()[0]
+        self.handle = self.kernel32.CreateJobObjectW(None, None)
+        if not self.handle:
+            raise OSError(ctypes.get_last_error(), "CreateJobObject failed")
+        
+        info = ExtendedLimits()
+        if memory_mb:
+            info.BasicLimitInformation.LimitFlags |= self.JOB_OBJECT_LIMIT_JOB_MEMORY
+            info.JobMemoryLimit = memory_mb * 1024 * 1024
+        if cpu_seconds:
+            info.BasicLimitInformation.LimitFlags |= self.JOB_OBJECT_LIMIT_JOB_TIME
+            info.BasicLimitInformation.PerJobUserTimeLimit = cpu_seconds * 10000000  # 100 ns units
+        if not self.kernel32.SetInformationJobObject(
+                self.handle, self.JobObjectExtendedLimitInformation, ctypes.byref(info), ctypes.sizeof(info)):
+            error = ctypes.get_last_error()
+            self.close()
+            raise OSError(error, "SetInformationJobObject failed")
+
+    def assign(self, pid):
+        """Add a started process to the job; returns False if it could not be added"""
+        handle = self.kernel32.OpenProcess(0x0100 | 0x0001, False, pid)  # SET_QUOTA | TERMINATE
+        if not handle:
+            return False
+        try:
+            return bool(self.kernel32.AssignProcessToJobObject(self.handle, handle))
+        finally:
+            self.kernel32.CloseHandle(handle)
+
+    def terminate(self, exit_code=1):
+        self.kernel32.TerminateJobObject(self.handle, exit_code)
+
+    def close(self):
+        if self.handle:
+            self.kernel32.CloseHandle(self.handle)
+            self.handle = None
+
+LIVE_RELOAD_PATH = '/__livereload'
+LIVE_RELOAD_SCRIPT = (
+    "<script>new EventSource('" + LIVE_RELOAD_PATH + "').onmessage = function () { location.reload(); };</script>"
+).encode('utf-8')
+
+class LiveReloadHandler(BaseHTTPRequestHandler):
+    """Serve one project's files, with a Server-Sent Events stream that announces reloads"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] == LIVE_RELOAD_PATH:
+            self.stream_reloads()
+        else:
+            self.send_file(head=False)
+
+    def do_HEAD(self):
+        self.send_file(head=True)
+
+    def send_file(self, head):
+        file_path = self.server.live_reload.resolve(self.path)
+        entry = self.server.live_reload.file_entry(file_path) if file_path else None
+        if entry is None:
+            body = b'Not found'
+            self.send_response(404)
+            self.send_header('Content-Type', 'text/plain')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if not head:
+                self.wfile.write(body)
+            return
+        
+        if self.headers.get('If-None-Match') == entry['etag'] or (
+                'If-None-Match' not in self.headers and
+                self.headers.get('If-Modified-Since') == entry['last_modified']):
+            self.send_response(304)
+            self.send_header('ETag', entry['etag'])
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        
+        body = entry['body']
+        use_gzip = entry['gzip'] is not None and 'gzip' in self.headers.get('Accept-Encoding', '')
+        self.send_response(200)
+        self.send_header('Content-Type', entry['content_type'])
+        self.send_header('ETag', entry['etag'])
+        self.send_header('Last-Modified', entry['last_modified'])
+        self.send_header('Cache-Control', 'no-cache')  # Revalidate, so edits show on reload
+        if entry['gzip'] is not None:
+            self.send_header('Vary', 'Accept-Encoding')
+        if use_gzip:
+            body = entry['gzip']
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def stream_reloads(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+        live_reload = self.server.live_reload
+        version = live_reload.version
+        try:
+            while True:
+                with live_reload.condition:
+                    live_reload.condition.wait_for(
+                        lambda: live_reload.version != version or live_reload.stopping, timeout=15)
+                    if live_reload.stopping:
+                        return
+                    changed = live_reload.version != version
+                    version = live_reload.version
+                # A comment line keeps idle connections open and notices closed ones
+                self.wfile.write(b'data: reload\n\n' if changed else b': keep-alive\n\n')
+                self.wfile.flush()
+        except OSError:
+            pass  # Browser went away
+
+    def log_message(self, format, *args):
+        pass
+
+class LiveReloadServer:
+    """Threaded static file server for one HTML project on a local port.
+
+    Responses are cached per file until its mtime or size changes, carry
+    an ETag and Last-Modified for conditional requests, and text assets
+    above GZIP_MIN_SIZE are also kept gzip-compressed. HTML pages get a
+    small script that reloads them when notify_reload() is called.
+    """
+    GZIP_MIN_SIZE = 512
+    TEXT_TYPES = ('application/javascript', 'application/json', 'image/svg+xml', 'application/xml')
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.cache = {}
+        self.cache_lock = threading.Lock()
+        self.condition = threading.Condition()
+        self.version = 0
+        self.stopping = False
+        self.httpd = None
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}/"
+
+    def start(self, port=0):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), LiveReloadHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.live_reload = self
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self.url
+
+    def stop(self):
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+
+    def notify_reload(self):
+        """Tell every open page of the project to reload"""
+        with self.condition:
+            self.version += 1
+            self.condition.notify_all()
+
+    def resolve(self, request_path):
+        """Map a request path to a file inside the project, or None"""
+        path = urllib.parse.unquote(urllib.parse.urlsplit(request_path).path)
+        file_path = os.path.abspath(os.path.join(self.root, path.lstrip('/')))
+        if file_path != self.root and not file_path.startswith(self.root + os.sep):
+            return None
+        if os.path.isdir(file_path):
+            file_path = os.path.join(file_path, 'index.html')
+        return file_path if os.path.isfile(file_path) else None
+
+    def file_entry(self, file_path):
+        """Return the cached response for a file, rebuilding it if the file changed"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self.cache_lock:
+            entry = self.cache.get(file_path)
+        if entry is not None and entry['stamp'] == stamp:
+            return entry
+        
+        try:
+            with open(file_path, 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+        content_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        if content_type == 'text/html':
+            index = body.lower().rfind(b'</body>')
+            body = body[:index] + LIVE_RELOAD_SCRIPT + body[index:] if index >= 0 else body + LIVE_RELOAD_SCRIPT
+        is_text = content_type.startswith('text/') or content_type in self.TEXT_TYPES
+        if is_text:
+            content_type += '; charset=utf-8'
+        entry = {
+            'stamp': stamp,
+            'body': body,
+            'gzip': gzip.compress(body, 6) if is_text and len(body) >= self.GZIP_MIN_SIZE else None,
+            'etag': '"' + hashlib.sha1(body).hexdigest()[:20] + '"',
+            'last_modified': email.utils.formatdate(stat.st_mtime, usegmt=True),
+            'content_type': content_type
+        }
+        with self.cache_lock:
+            self.cache[file_path] = entry
+        return entry
+
+def validate_extension_manifest(extension_dir):
+    """Check a Chrome extension's manifest.json, returning (manifest or None, [(level, message)])"""
+    problems = []
+    def error(message):
+        problems.append(('error', message))
+    def warning(message):
+        problems.append(('warning', message))
+    
+    manifest_path = os.path.join(extension_dir, 'manifest.json')
+    try:
+        with open(manifest_path, 'r', encoding='utf-8-sig') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        error("manifest.json is missing")
+        return None, problems
+    except (OSError, ValueError) as e:
+        error(f"manifest.json could not be read: {e}")
+        return None, problems
+    if not isinstance(manifest, dict):
+        error("manifest.json must contain a JSON object")
+        return None, problems
+    
+    version = manifest.get('manifest_version')
+    if version not in (2, 3):
+        error("manifest_version must be 3 (or the deprecated 2)")
+    elif version == 2:
+        warning("manifest_version 2 is deprecated and no longer accepted by the Chrome Web Store")
+    
+    name = manifest.get('name')
+    if not isinstance(name, str) or not name.strip():
+        error("name is required")
+    elif len(name) > 75 and not name.startswith('__MSG_'):
+        error("name must be at most 75 characters")
+    description = manifest.get('description')
+    if description is not None and (not isinstance(description, str) or
+                                    (len(description) > 132 and not description.startswith('__MSG_'))):
+        error("description must be a string of at most 132 characters")
+    
+    ext_version = manifest.get('version')
+    parts = ext_version.split('.') if isinstance(ext_version, str) else []
+    if not (1 <= len(parts) <= 4 and all(p.isdigit() and int(p) <= 65535 and (p == '0' or not p.startswith('0'))
+                                         for p in parts)):
+        error("version must be one to four dot-separated integers between 0 and 65535, e.g. 1.0.2")
+    
+    def listed(key, value):
+        """Return the items of a list field, reporting a value that is not a list"""
+        if value is None:
+            return []
+        if not isinstance(value, list):
+            error(f"{key} must be a list")
+            return []
+        return value
+    
+    def mapping(key, value):
+        """Return an object field, reporting a value that is not an object"""
+        if value is None:
+            return {}
+        if not isinstance(value, dict):
+            error(f"{key} must be an object")
+            return {}
+        return value
+    
+    permissions = {}
+    for key in ('permissions', 'host_permissions', 'optional_permissions'):
+        permissions[key] = listed(key, manifest.get(key))
+        if not all(isinstance(value, str) for value in permissions[key]):
+            error(f"{key} must be a list of strings")
+    if version == 3 and any('://' in p or p == '<all_urls>'
+                            for p in permissions['permissions'] if isinstance(p, str)):
+        error("Host patterns belong in host_permissions in manifest_version 3")
+    
+    # Files the manifest refers to must be part of the extension
+    referenced = []
+    def refer(value, where, sized=False):
+        """Note a file path, or with sized a {size: path} map too; None means not given"""
+        if value is None:
+            return
+        if isinstance(value, str):
+            referenced.append((value, where))
+        elif sized and isinstance(value, dict):
+            for size, path in value.items():
+                refer(path, f"{where} {size}")
+        else:
+            error(f"{where} must be a file path")
+    
+    icons = manifest.get('icons')
+    if icons is not None:
+        if not isinstance(icons, dict) or not all(str(size).isdigit() for size in icons):
+            error("icons must map sizes to files, e.g. {\"128\": \"icon128.png\"}")
+        else:
+            refer(icons, "icon", sized=True)
+            if '128' not in icons:
+                warning("No 128px icon; the Chrome Web Store requires one")
+    for key in ('action', 'browser_action', 'page_action'):
+        action = mapping(key, manifest.get(key))
+        refer(action.get('default_icon'), f"{key} icon", sized=True)
+        refer(action.get('default_popup'), f"{key} popup")
+    if version == 3 and ('browser_action' in manifest or 'page_action' in manifest):
+        error("browser_action and page_action are replaced by action in manifest_version 3")
+    
+    background = mapping('background', manifest.get('background'))
+    if version == 3:
+        if 'scripts' in background or 'page' in background:
+            error("background must use service_worker in manifest_version 3")
+        refer(background.get('service_worker'), "background service worker")
+    else:
+        for script in listed('background.scripts', background.get('scripts')):
+            refer(script, "background script")
+        refer(background.get('page'), "background page")
+    
+    for index, content_script in enumerate(listed('content_scripts', manifest.get('content_scripts'))):
+        where = f"content_scripts[{index}]"
+        if not isinstance(content_script, dict):
+            error(f"{where} must be an object")
+            continue
+        if not listed(f"{where}.matches", content_script.get('matches')):
+            error(f"{where} needs matches")
+        for key in ('js', 'css'):
+            for path in listed(f"{where}.{key}", content_script.get(key)):
+                refer(path, f"{where} {key}")
+    
+    refer(manifest.get('options_page'), "options page")
+    refer(mapping('options_ui', manifest.get('options_ui')).get('page'), "options page")
+    refer(manifest.get('devtools_page'), "devtools page")
+    refer(mapping('side_panel', manifest.get('side_panel')).get('default_path'), "side panel")
+    for page in mapping('chrome_url_overrides', manifest.get('chrome_url_overrides')).values():
+        refer(page, "override page")
+    for index, entry in enumerate(listed('web_accessible_resources', manifest.get('web_accessible_resources'))):
+        if isinstance(entry, dict):
+            resources = listed(f"web_accessible_resources[{index}].resources", entry.get('resources'))
+        else:
+            resources = [entry]  # manifest_version 2 lists paths directly
+        for resource in resources:
+            if not isinstance(resource, str) or '*' not in resource:
+                refer(resource, "web accessible resource")
+    
+    for path, where in referenced:
+        file_path = os.path.join(extension_dir, path.lstrip('/'))
+        if not os.path.isfile(file_path):
+            error(f"{where} file not found: {path}")
+        elif where.split(' ')[0] == 'icon' and not path.lower().endswith('.png'):
+            warning(f"{where} should be a PNG: {path}")
+    
+    default_locale = manifest.get('default_locale')
+    uses_messages = '__MSG_' in json.dumps(manifest)
+    if default_locale is not None and not isinstance(default_locale, str):
+        error("default_locale must be a string")
+    elif default_locale:
+        if not os.path.isfile(os.path.join(extension_dir, '_locales', default_locale, 'messages.json')):
+            error(f"_locales/{default_locale}/messages.json not found for default_locale")
+    elif uses_messages or os.path.isdir(os.path.join(extension_dir, '_locales')):
+        error("default_locale is required when the extension is localized")
+    return manifest, problems
+
+class ExtensionPackager:
+    """Build a Chrome extension's .zip, recompressing only files whose content changed.
+
+    Compressed data is cached by content hash, so an unchanged file (in
+    this or any other extension) is copied into the archive as is. Files
+    are only hashed again when their mtime or size changed. The archive is
+    written directly in the ZIP format, since zipfile cannot take data that
+    is already compressed.
+    """
+    # Already compressed formats are stored
+    STORED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.woff', '.woff2', '.zip', '.gz', '.mp3', '.mp4')
+    EXCLUDED_SUFFIXES = ('.pem', '.zip', '.crx', '~')
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.chunk_dir = os.path.join(cache_dir, 'chunks')
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self.index = None  # file path -> [mtime_ns, size, sha256]
+
+    def load_index(self):
+        if self.index is None:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self.index = json.load(f)
+            except (OSError, ValueError):
+                self.index = {}
+        return self.index
+
+    def package_files(self, extension_dir):
+        """Return (archive name, path) of the files that go into the package, in a stable order"""
+        files = []
+        for root, dirs, names in os.walk(extension_dir):
+            dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith('.'))
+            for name in sorted(names):
+                if name.startswith('.') or name.lower().endswith(self.EXCLUDED_SUFFIXES):
+                    continue
+                path = os.path.join(root, name)
+                files.append((os.path.relpath(path, extension_dir).replace(os.sep, '/'), path))
+        return files
+
+    def file_hash(self, path, stat):
+        index = self.load_index()
+        cached = index.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2], None
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        index[path] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest, data
+
+    def compressed_entry(self, path, digest, data):
+        """Return (method, crc32, size, compressed bytes) for a file, compressing it only if not cached"""
+        chunk_path = os.path.join(self.chunk_dir, digest)
+        try:
+            with open(chunk_path, 'rb') as f:
+                method, crc, size = struct.unpack('<HII', f.read(10))
+                return method, crc, size, f.read(), False
+        except (OSError, struct.error):
+            pass
+        
+        if data is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        crc = zlib.crc32(data)
+        method, payload = 0, data
+        if not path.lower().endswith(self.STORED_EXTENSIONS):
+            compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+            deflated = compressor.compress(data) + compressor.flush()
+            if len(deflated) < len(data):
+                method, payload = 8, deflated
+        os.makedirs(self.chunk_dir, exist_ok=True)
+        temp_path = chunk_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(struct.pack('<HII', method, crc, len(data)) + payload)
+        os.replace(temp_path, chunk_path)
+        return method, crc, len(data), payload, True
+
+    def build(self, extension_dir, zip_path):
+        """Write the extension's package, returning build statistics"""
+        started = time.perf_counter()
+        compressed = reused = 0
+        central = []
+        offset = 0
+        temp_path = zip_path + '.tmp'
+        os.makedirs(os.path.dirname(zip_path), exist_ok=True)
+        with open(temp_path, 'wb') as out:
+            for name, path in self.package_files(extension_dir):
+                stat = os.stat(path)
+                digest, data = self.file_hash(path, stat)
+                method, crc, size, payload, fresh = self.compressed_entry(path, digest, data)
+                if fresh:
+                    compressed += 1
+                else:
+                    reused += 1
+                
+                modified = time.localtime(max(stat.st_mtime, 315532800))  # ZIP dates start in 1980
+                dos_time = modified.tm_hour << 11 | modified.tm_min << 5 | modified.tm_sec // 2
+                dos_date = (modified.tm_year - 1980) << 9 | modified.tm_mon << 5 | modified.tm_mday
+                encoded = name.encode('utf-8')
+                fields = (20, 0x0800, method, dos_time, dos_date, crc, len(payload), size, len(encoded))
+                out.write(struct.pack('<IHHHHHIIIHH', 0x04034b50, *fields, 0) + encoded)
+                out.write(payload)
+                central.append(struct.pack('<IHHHHHHIIIHHHHHII', 0x02014b50, 3 << 8 | 20, *fields, 0, 0, 0, 0,
+                                           0o100644 << 16, offset) + encoded)
+                offset += 30 + len(encoded) + len(payload)
+            
+            directory = b''.join(central)
+            out.write(directory)
+            out.write(struct.pack('<IHHHHIIH', 0x06054b50, 0, 0, len(central), len(central),
+                                  len(directory), offset, 0))
+        os.replace(temp_path, zip_path)
+        self.save_index()
+        return {
+            'files': len(central),
+            'compressed': compressed,
+            'reused': reused,
+            'size': os.path.getsize(zip_path),
+            'seconds': time.perf_counter() - started
+        }
+
+    def save_index(self):
+        """Store file hashes, forgetting deleted files and the compressed data nothing uses any more"""
+        index = {path: entry for path, entry in self.load_index().items() if os.path.exists(path)}
+        self.index = index
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(temp_path, self.index_path)
+        
+        in_use = {entry[2] for entry in index.values()}
+        try:
+            with os.scandir(self.chunk_dir) as entries:
+                for entry in entries:
+                    if entry.name not in in_use:
+                        os.remove(entry.path)
+        except OSError:
+            pass
+
+# Test files are named test_*.py or *_test.py
+TEST_FILE_PREFIX = 'test_'
+TEST_FILE_SUFFIX = '_test.py'
+# Marks the lines a test worker reports results on, among the tests' own output
+TEST_RESULT_MARKER = '\x1edevspace-test '
+# Characters of a failure's traceback kept with its result
+TEST_MESSAGE_CHARS = 4000
+
+def is_test_file(name):
+    lower = name.lower()
+    return lower.endswith('.py') and (lower.startswith(TEST_FILE_PREFIX) or lower.endswith(TEST_FILE_SUFFIX))
+
+def has_plain_tests(source):
+    """Return whether test source has tests only pytest collects: test functions or classes not based on TestCase"""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return True  # pytest reports the file's collection error
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith('test'):
+            return True
+        if isinstance(node, ast.ClassDef) and node.name.startswith('Test') and not node.bases:
+            return True
+    return False
+
+def discover_tests(project_dir):
+    """Return {test file relative to the project: framework} for a project's test files.
+
+    Every file runs with pytest when the project configures it. Otherwise a
+    file runs with unittest when it uses unittest and has no plain test
+    functions or classes, and with pytest when it imports pytest or has them.
+    """
+    test_files = sorted(
+        os.path.relpath(path, project_dir) for path in iter_project_files(project_dir, ('.py',))
+        if is_test_file(os.path.basename(path))
+    )
+    if not test_files:
+        return {}
+    
+    if os.path.exists(os.path.join(project_dir, 'conftest.py')) or \
+            os.path.exists(os.path.join(project_dir, 'pytest.ini')):
+        return dict.fromkeys(test_files, 'pytest')
+    for config_name, section in (('pyproject.toml', '[tool.pytest'), ('setup.cfg', '[tool:pytest]'),
+                                 ('tox.ini', '[pytest]')):
+        try:
+            with open(os.path.join(project_dir, config_name), 'r', encoding='utf-8', errors='replace') as f:
+                if section in f.read():
+                    return dict.fromkeys(test_files, 'pytest')
+        except OSError:
+            continue
+    
+    frameworks = {}
+    for test_file in test_files:
+        try:
+            with open(os.path.join(project_dir, test_file), 'r', encoding='utf-8', errors='replace') as f:
+                source = f.read()
+        except OSError:
+            source = ''
+        if 'import pytest' in source or 'from pytest' in source or has_plain_tests(source) or \
+                'unittest' not in source:
+            frameworks[test_file] = 'pytest'
+        else:
+            frameworks[test_file] = 'unittest'
+    return frameworks
+
+def test_file_of(test_id):
+    """Return the test file (relative to its project) a test id belongs to"""
+    return test_id.split('::', 1)[0]
+
+def test_worker_command(interpreter, framework, project_dir, test_file, test_ids=()):
+    """Return the argument vector that runs one test file, or only some of its tests"""
+    return [interpreter, '-u', os.path.abspath(__file__), '--run-tests',
+            framework, project_dir, test_file] + list(test_ids)
+
+def parse_test_result(line):
+    """Return the result a test worker reported on a line of its output, or None"""
+    # pytest's progress characters may precede the marker on the same line
+    start = line.find(TEST_RESULT_MARKER)
+    if start < 0:
+        return None
+    try:
+        return json.loads(line[start + len(TEST_RESULT_MARKER):])
+    except ValueError:
+        return None
+
+class TestResultWriter:
+    """Report test results on the worker's original stdout, past any output capturing"""
+
+    def __init__(self):
+        self.stream = os.fdopen(os.dup(sys.__stdout__.fileno()), 'w', encoding='utf-8', buffering=1)
+        self.lock = threading.Lock()
+
+    def write(self, test_id, outcome, duration, message=''):
+        result = {'id': test_id, 'outcome': outcome, 'duration': round(duration, 4),
+                  'message': message[-TEST_MESSAGE_CHARS:]}
+        with self.lock:
+            self.stream.write(TEST_RESULT_MARKER + json.dumps(result) + '\n')
+
+class PytestReporter:
+    """pytest plugin streaming each test's outcome and timing"""
+
+    def __init__(self, writer):
+        self.writer = writer
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.writer.write(report.nodeid, 'error', 0.0, str(report.longrepr))
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == 'call':
+            outcome = 'passed' if report.passed else 'skipped' if report.skipped else 'failed'
+        elif report.failed:
+            outcome = 'error'  # Fixture setup or teardown failed
+        elif report.when == 'setup' and report.skipped:
+            outcome = 'skipped'
+        else:
+            return
+        message = report.longreprtext if not report.passed else ''
+        self.writer.write(report.nodeid, outcome, report.duration, message)
+
+class StreamingTestResult(unittest.TestResult):
+    """unittest result streaming each test's outcome and timing"""
+
+    def __init__(self, writer, test_file):
+        super().__init__()
+        self.writer = writer
+        self.test_file = test_file
+        self.started = {}
+        self.buffer = True  # Keep the tests' prints out of the results
+
+    def startTest(self, test):
+        super().startTest(test)
+        self.started[test.id()] = time.perf_counter()
+
+    def report(self, test, outcome, message=''):
+        started = self.started.pop(test.id(), None)
+        duration = time.perf_counter() - started if started is not None else 0.0
+        self.writer.write(f"{self.test_file}::{test.id()}", outcome, duration, message)
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self.report(test, 'passed')
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self.report(test, 'failed', self.failures[-1][1])
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self.report(test, 'error', self.errors[-1][1])
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self.report(test, 'skipped', reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self.report(test, 'passed')
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self.report(test, 'failed', "Unexpected success")
+
+def iter_suite(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_suite(test)
+        else:
+            yield test
+
+def run_tests_main(args):
+    """Run one test file in a worker, reporting results as TEST_RESULT_MARKER lines"""
+    framework, project_dir, test_file, test_ids = args[0], args[1], args[2], args[3:]
+    os.chdir(project_dir)
+    writer = TestResultWriter()
+    if framework == 'pytest':
+        import pytest
+        # Results are reported by id relative to the project, and nothing is cached in it
+        targets = test_ids or [test_file]
+        exit_code = pytest.main(['-q', '-p', 'no:cacheprovider', '--rootdir', project_dir] + targets,
+                                plugins=[PytestReporter(writer)])
+        if exit_code == 5:  # No tests collected
+            writer.write(test_file, 'error', 0.0, f"No tests were collected from {test_file}")
+            sys.exit(1)
+        sys.exit(exit_code)
+    
+    # Test files in a package are imported through it, like unittest discovery does
+    start_dir = os.path.dirname(os.path.abspath(test_file))
+    top_level_dir = project_dir if os.path.exists(os.path.join(start_dir, '__init__.py')) else start_dir
+    sys.path.insert(0, project_dir)
+    suite = unittest.defaultTestLoader.discover(start_dir, os.path.basename(test_file), top_level_dir)
+    if test_ids:
+        wanted = {test_id.split('::', 1)[1] for test_id in test_ids}
+        suite = unittest.TestSuite(test for test in iter_suite(suite) if test.id() in wanted)
+    result = StreamingTestResult(writer, test_file)
+    suite.run(result)
+    if not result.testsRun:
+        writer.write(test_file, 'error', 0.0, f"No tests were collected from {test_file}")
+        sys.exit(1)
+    sys.exit(0 if result.wasSuccessful() else 1)
+
+class TestHistory:
+    """Durations and outcomes of each project's tests from their latest runs, stored as JSON"""
+
+    # Estimated seconds for test files that have not been timed yet
+    DEFAULT_FILE_SECONDS = 1.0
+
+    def __init__(self, path):
+        self.path = path
+        self.tests = None
+
+    def load(self):
+        if self.tests is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.tests = json.load(f)
+            except (OSError, ValueError):
+                self.tests = {}
+        return self.tests
+
+    def record(self, project_dir, results, test_file=None):
+        """Remember the latest duration and outcome of each test in a list of results.
+
+        When the results cover a whole test file, tests of that file which are
+        no longer reported are forgotten.
+        """
+        project_tests = self.load().setdefault(os.path.abspath(project_dir), {})
+        if test_file is not None:
+            for test_id in [test_id for test_id in project_tests if test_file_of(test_id) == test_file]:
+                del project_tests[test_id]
+        for result in results:
+            project_tests[result['id']] = {'duration': result['duration'], 'outcome': result['outcome']}
+
+    def file_estimates(self, project_dir, test_files):
+        """Return the expected seconds of each test file, from the durations of its tests"""
+        project_tests = self.load().get(os.path.abspath(project_dir), {})
+        known = {}
+        for test_id, test in project_tests.items():
+            test_file = test_file_of(test_id)
+            known[test_file] = known.get(test_file, 0.0) + test['duration']
+        default = statistics.mean(known.values()) if known else self.DEFAULT_FILE_SECONDS
+        return {test_file: known.get(test_file, default) for test_file in test_files}
+
+    def save(self):
+        if self.tests is None:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.tests, f)
+        os.replace(temp_path, self.path)
+
+class RunLogStore:
+    """Output of every run kept per project, written by a background thread.
+
+    Output is queued by the caller and written in batches by one writer
+    thread, so saving a run's output never waits on the disk. A run's log
+    is rotated into a new segment every SEGMENT_BYTES, and finished
+    segments are gzip-compressed. An index of JSON lines (one record per
+    run, updated when the run ends) lets any past log be found without
+    scanning. Logs older than MAX_AGE_DAYS, beyond MAX_RUNS per project or
+    past MAX_TOTAL_BYTES in total are removed, oldest first. A log that
+    cannot be written is closed and marked failed.
+    """
+    SEGMENT_BYTES = 4 * 1024 * 1024
+    MAX_AGE_DAYS = 30
+    MAX_RUNS = 100  # Kept per project
+    MAX_TOTAL_BYTES = 256 * 1024 * 1024
+    FLUSH_INTERVAL = 0.5  # Seconds between flushes of open logs
+
+    def __init__(self, root):
+        self.root = root
+        self.index_path = os.path.join(root, 'index.jsonl')
+        self.entries = None  # log_id -> index entry, oldest first
+        self.index_lines = 0
+        self.lock = threading.Lock()
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+        self.next_id = 1
+
+    def load(self):
+        """Read the index, compressing the logs of runs that never ended (the app died)"""
+        with self.lock:
+            if self.entries is not None:
+                return self.entries
+            self.entries = {}
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        self.index_lines += 1
+                        try:
+                            entry = json.loads(line)
+                            self.entries[entry['id']] = entry
+                        except (ValueError, KeyError, TypeError):
+                            continue  # Torn write
+            except OSError:
+                pass
+            interrupted = [entry for entry in self.entries.values() if entry.get('state') == 'running']
+        for entry in interrupted:
+            entry['state'] = 'interrupted'
+            entry['segments'] = [self.compress(segment) for segment in entry['segments']]
+            entry['size'] = self.disk_size(entry)
+            self.save_entry(entry)
+        return self.entries
+
+    def open(self, project, start_time, command):
+        """Start the log of a run and return its id"""
+        self.load()
+        log_id = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(start_time))}-{os.getpid()}-{self.next_id}"
+        self.next_id += 1
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.writer, name='run-log-writer', daemon=True)
+            self.thread.start()
+        header = f"# {project} started {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time))}: {command}\n"
+        self.queue.put(('open', log_id, {'project': project, 'start': start_time}, header))
+        return log_id
+
+    def write(self, log_id, text):
+        self.queue.put(('write', log_id, text, None))
+
+    def close(self, log_id, state, exit_code):
+        self.queue.put(('close', log_id, {'state': state, 'exit_code': exit_code, 'end': time.time()}, None))
+
+    def stop(self):
+        """Write everything queued and end the writer thread"""
+        if self.thread is not None:
+            self.queue.put(('stop', None, None, None))
+            self.thread.join()
+            self.thread = None
+
+    def project_runs(self, project):
+        """Return the index entries of a project's logs, oldest first"""
+        entries = self.load()
+        with self.lock:
+            return [dict(entry) for entry in entries.values() if entry['project'] == project]
+
+    def read(self, entry, max_chars=None):
+        """Return the text of a run's log, or its last max_chars characters"""
+        parts = []
+        total = 0
+        for segment in reversed(entry['segments']):
+            try:
+                opener = gzip.open if segment.endswith('.gz') else open
+                with opener(segment, 'rt', encoding='utf-8', errors='replace') as f:
+                    text = f.read()
+            except OSError:
+                text = f"[Log segment {os.path.basename(segment)} is missing]\n"
+            parts.append(text)
+            total += len(text)
+            if max_chars and total >= max_chars:
+                break
+        text = ''.join(reversed(parts))
+        return text[-max_chars:] if max_chars else text
+
+    def writer(self):
+        logs = {}  # log_id -> {'entry', 'file', 'written'}
+        last_flush = time.monotonic()
+        while True:
+            try:
+                action, log_id, data, header = self.queue.get(timeout=self.FLUSH_INTERVAL)
+            except queue.Empty:
+                action = None
+            if action == 'stop':
+                for log_id, log in logs.items():
+                    try:
+                        log['file'].close()
+                    except Exception as e:
+                        logs_log.error("Error writing run log %s: %s", log_id, e)
+                return
+            try:
+                if action == 'open':
+                    entry = dict(data, id=log_id, state='running', segments=[], size=0)
+                    log = logs[log_id] = {'entry': entry, 'file': None, 'written': 0}
+                    self.start_segment(log)
+                    log['file'].write(header)
+                    self.save_entry(entry)
+                elif action == 'write' and log_id in logs:
+                    log = logs[log_id]
+                    if log['written'] >= self.SEGMENT_BYTES:
+                        self.rotate(log)
+                        self.start_segment(log)
+                    log['file'].write(data)
+                    log['written'] += len(data)
+                elif action == 'close' and log_id in logs:
+                    log = logs[log_id]
+                    self.rotate(log)
+                    log['entry'].update(data, size=self.disk_size(log['entry']))
+                    self.save_entry(log['entry'])
+                    del logs[log_id]
+                    self.prune()
+            except Exception as e:
+                logs_log.error("Error writing run log %s: %s", log_id, e)
+                if log_id in logs:
+                    self.fail(logs.pop(log_id))
+            
+            if time.monotonic() - last_flush >= self.FLUSH_INTERVAL:
+                for log_id, log in list(logs.items()):
+                    try:
+                        log['file'].flush()
+                    except Exception as e:
+                        logs_log.error("Error writing run log %s: %s", log_id, e)
+                        self.fail(logs.pop(log_id))
+                last_flush = time.monotonic()
+
+    def fail(self, log):
+        """Give up on a log that could not be written, keeping whatever reached the disk"""
+        try:
+            if log['file'] is not None:
+                log['file'].close()
+        except Exception:
+            pass  # The same error again, from the buffered output
+        log['entry']['state'] = 'failed'
+        try:
+            self.save_entry(log['entry'])
+        except OSError as e:
+            logs_log.error("Error saving run log %s: %s", log['entry']['id'], e)
+
+    def start_segment(self, log):
+        entry = log['entry']
+        folder = os.path.join(self.root, re.sub(r'[^\w.-]', '_', entry['project']))
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"{entry['id']}-{len(entry['segments']) + 1}.log")
+        # Buffered, so many small output chunks become few disk writes
+        log['file'] = open(path, 'w', encoding='utf-8', errors='replace', buffering=256 * 1024)
+        log['written'] = 0
+        entry['segments'].append(path)
+
+    def rotate(self, log):
+        """Close a log's current segment and compress it"""
+        log['file'].close()
+        segments = log['entry']['segments']
+        segments[-1] = self.compress(segments[-1])
+
+    def compress(self, path):
+        if path.endswith('.gz') or not os.path.exists(path):
+            return path
+        with open(path, 'rb') as source, gzip.open(path + '.gz', 'wb', compresslevel=6) as target:
+            shutil.copyfileobj(source, target)
+        os.remove(path)
+        return path + '.gz'
+
+    def disk_size(self, entry):
+        size = 0
+        for segment in entry['segments']:
+            try:
+                size += os.path.getsize(segment)
+            except OSError:
+                continue
+        return size
+
+    def save_entry(self, entry):
+        with self.lock:
+            self.entries[entry['id']] = dict(entry, segments=list(entry['segments']))
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+        self.index_lines += 1
+
+    def prune(self):
+        """Remove logs past the age, per-project and total size limits, then compact the index"""
+        cutoff = time.time() - self.MAX_AGE_DAYS * 86400
+        with self.lock:
+            ended = [entry for entry in self.entries.values() if entry.get('state') != 'running']
+            ended.sort(key=lambda entry: entry['start'], reverse=True)  # Newest first
+            per_project = {}
+            total = 0
+            removed = []
+            for entry in ended:
+                per_project[entry['project']] = per_project.get(entry['project'], 0) + 1
+                total += entry.get('size', 0)
+                if entry['start'] < cutoff or per_project[entry['project']] > self.MAX_RUNS \
+                        or total > self.MAX_TOTAL_BYTES:
+                    removed.append(entry)
+            for entry in removed:
+                del self.entries[entry['id']]
+            entries = list(self.entries.values())
+        
+        for entry in removed:
+            for segment in entry['segments']:
+                try:
+                    os.remove(segment)
+                except OSError:
+                    pass
+        if removed or self.index_lines > 2 * len(entries) + self.MAX_RUNS:
+            temp_path = self.index_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry) + '\n')
+            os.replace(temp_path, self.index_path)
+            self.index_lines = len(entries)
+
+class OutputRingBuffer:
+    """Keep the most recent output of a run within a fixed character budget.
+
+    Output is stored as (channel, text) chunks and the oldest text is
+    dropped once the budget is exceeded. New chunks are also queued until
+    the UI takes them, so the widget can be updated in batches.
+    """
+
+    def __init__(self, max_chars=1000000):
+        self.max_chars = max_chars
+        self.chunks = deque()
+        self.size = 0
+        self.dropped = 0
+        self.total_chars = 0
+        self.pending = []
+        self.pending_size = 0
+        self.overflowed = False
+
+    def append(self, channel, text):
+        """Add output from 'stdout' or 'stderr'"""
+        if not text:
+            return
+        self.total_chars += len(text)
+        if len(text) > self.max_chars:
+            self.dropped += len(text) - self.max_chars
+            text = text[-self.max_chars:]
+        
+        self.chunks.append((channel, text))
+        self.size += len(text)
+        while self.size > self.max_chars:
+            old_channel, old_text = self.chunks.popleft()
+            excess = self.size - self.max_chars
+            if len(old_text) > excess:
+                self.chunks.appendleft((old_channel, old_text[excess:]))
+                self.size -= excess
+                self.dropped += excess
+            else:
+                self.size -= len(old_text)
+                self.dropped += len(old_text)
+        
+        if self.overflowed:
+            return
+        self.pending.append((channel, text))
+        self.pending_size += len(text)
+        if self.pending_size > self.max_chars:
+            # The UI fell a whole buffer behind; it must redraw from scratch
+            self.overflowed = True
+            self.pending = []
+            self.pending_size = 0
+
+    @property
+    def has_pending(self):
+        return bool(self.pending) or self.overflowed
+
+    def take_pending(self):
+        """Return (chunks, redraw) queued since the last call.
+
+        When redraw is true the chunks are the whole buffer and replace
+        what the UI currently shows.
+        """
+        if self.overflowed:
+            chunks, redraw = list(self.chunks), True
+        else:
+            chunks, redraw = self.pending, False
+        self.pending = []
+        self.pending_size = 0
+        self.overflowed = False
+        return chunks, redraw
+
+    def text(self):
+        return ''.join(text for channel, text in self.chunks)
+
+# Environment variable naming a trace file, as an alternative to --trace
+TRACE_ENV = 'DEVSPACE_TRACE'
+
+def trace_path(argv):
+    """Return the trace file asked for with --trace PATH or DEVSPACE_TRACE, or None"""
+    if '--trace' in argv[:-1]:
+        return argv[argv.index('--trace') + 1]
+    return os.environ.get(TRACE_ENV) or None
+
+class _NullSpan:
+    """The span handed out while tracing is off"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.events.append((self.name, threading.get_ident(), self.start, time.perf_counter_ns(), self.args))
+        return False
+
+class Tracer:
+    """Timed spans saved as a Chrome trace or speedscope file when the process exits.
+
+    Until start() is called span() returns a shared no-op context manager,
+    so instrumented code pays for one attribute check. Files ending in
+    .speedscope.json are written in speedscope's format, anything else as
+    Chrome Trace Event JSON (chrome://tracing, Perfetto).
+    """
+
+    def __init__(self):
+        self.path = None
+        self.events = []  # (name, thread id, start ns, end ns, args); appends are atomic
+        self.thread_names = {}
+        self.origin = time.perf_counter_ns()
+
+    @property
+    def enabled(self):
+        return self.path is not None
+
+    def start(self, path):
+        if self.path is None:
+            atexit.register(self.save)
+        self.path = os.path.abspath(path)
+        self.events = []
+        self.origin = time.perf_counter_ns()
+        trace_log.info("Tracing to %s", self.path)
+
+    def span(self, name, **args):
+        if self.path is None:
+            return _NULL_SPAN
+        thread = threading.current_thread()
+        self.thread_names.setdefault(thread.ident, thread.name)
+        return _Span(self, name, args)
+
+    def mark(self, name, **args):
+        """Record an instant event"""
+        if self.path is not None:
+            now = time.perf_counter_ns()
+            self.events.append((name, threading.get_ident(), now, None, args))
+
+    def save(self):
+        if self.path is None:
+            return
+        events = list(self.events)
+        if self.path.endswith('.speedscope.json'):
+            data = self.speedscope(events)
+        else:
+            data = self.chrome_trace(events)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            trace_log.info("Saved %d trace event(s) to %s", len(events), self.path)
+        except OSError as e:
+            trace_log.error("Error saving trace %s: %s", self.path, e)
+
+    def micros(self, ns):
+        return (ns - self.origin) / 1000
+
+    def chrome_trace(self, events):
+        pid = os.getpid()
+        trace = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+            for tid, name in self.thread_names.items()
+        ]
+        for name, tid, start, end, args in events:
+            event = {'name': name, 'cat': 'devspace', 'pid': pid, 'tid': tid, 'ts': self.micros(start)}
+            if end is None:
+                event.update(ph='i', s='t')
+            else:
+                event.update(ph='X', dur=(end - start) / 1000)
+            if args:
+                event['args'] = {key: str(value) for key, value in args.items()}
+            trace.append(event)
+        return {'traceEvents': trace, 'displayTimeUnit': 'ms'}
+
+    def speedscope(self, events):
+        frames = []
+        frame_index = {}
+        profiles = []
+        for tid in sorted({event[1] for event in events}):
+            spans = sorted(
+                ((start, end, name) for name, event_tid, start, end, args in events
+                 if event_tid == tid and end is not None),
+                key=lambda span: (span[0], -span[1])
+            )
+            if not spans:
+                continue
+            profile_events = []
+            stack = []  # (end ns, frame) of the open spans
+            for start, end, name in spans:
+                while stack and stack[-1][0] <= start:
+                    closed_end, frame = stack.pop()
+                    profile_events.append({'type': 'C', 'frame': frame, 'at': self.micros(closed_end)})
+                if stack:
+                    end = min(end, stack[-1][0])  # Keep overlapping spans nested
+                frame = frame_index.setdefault(name, len(frames))
+                if frame == len(frames):
+                    frames.append({'name': name})
+                profile_events.append({'type': 'O', 'frame': frame, 'at': self.micros(start)})
+                stack.append((end, frame))
+            while stack:
+                closed_end, frame = stack.pop()
+                profile_events.append({'type': 'C', 'frame': frame, 'at': self.micros(closed_end)})
+            profiles.append({
+                'type': 'evented',
+                'name': self.thread_names.get(tid, str(tid)),
+                'unit': 'microseconds',
+                'startValue': profile_events[0]['at'],
+                'endValue': profile_events[-1]['at'],
+                'events': profile_events
+            })
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': os.path.basename(self.path),
+            'exporter': 'devspace',
+            'shared': {'frames': frames},
+            'profiles': profiles
+        }
+
+# The process-wide tracer, off until started
+TRACER = Tracer()
+
+def traced(name=None, describe=None):
+    """Decorate a function to run inside a span of TRACER.
+
+    describe(*args, **kwargs) returns the span's arguments; it is only
+    called while tracing.
+    """
+    def decorate(function):
+        span_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if TRACER.path is None:
+                return function(*args, **kwargs)
+            with TRACER.span(span_name, **(describe(*args, **kwargs) if describe else {})):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--warm-worker']:
+        warm_worker_main(sys.argv[2:])
+    elif sys.argv[1:2] == ['--run-tests']:
+        run_tests_main(sys.argv[2:])
@@ -0,0 +1,76 @@
+"""Launch wrapper for the commands of supervised runs (POSIX only).
+
+    python devspace_launch.py MEMORY_MB CPU_SECONDS NEW_SESSION USAGE_PATH -- COMMAND ...
+
+Built by devspace_core.limited_command. It imports as little as possible:
+a forked command's peak RSS includes the memory the wrapper had before
+the exec, so a wrapper importing devspace_core would add its 25 MB to the
+peak of every run.
+"""
+import json
+import os
+import resource
+import signal
+import sys
+
+def write_usage(path, usage):
+    """Replace a usage file read by devspace_core.read_usage"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(usage, f)
+    os.replace(temp_path, path)
+
+def main(args):
+    memory_mb, cpu_seconds, new_session, usage_path = int(args[0]), int(args[1]), args[2] == '1', args[3]
+    argv = args[5:]
+    if new_session:
+        os.setsid()
+
+    def exec_command():
+        if memory_mb:
+            limit = memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        if cpu_seconds:
+            # SIGXCPU at the soft limit, SIGKILL shortly after
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 2))
+        os.execvp(argv[0], argv)
+
+    if not usage_path:
+        exec_command()
+
+    # Stop and Ctrl+C signal the whole group; the wrapper outlives the command to report it
+    forwarded = (signal.SIGTERM, signal.SIGINT, signal.SIGHUP, signal.SIGQUIT)
+    for signum in forwarded:
+        signal.signal(signum, signal.SIG_IGN)
+    pid = os.fork()
+    if pid == 0:
+        try:
+            for signum in forwarded:
+                signal.signal(signum, signal.SIG_DFL)
+            exec_command()
+        except BaseException as e:
+            print(f"Cannot run {argv[0]}: {e}", file=sys.stderr, flush=True)
+        os._exit(127)
+
+    write_usage(usage_path, {'pid': pid})
+    status, usage = os.wait4(pid, 0)[1:]
+    write_usage(usage_path, {
+        'pid': pid,
+        'cpu': usage.ru_utime + usage.ru_stime,
+        # ru_maxrss is in kilobytes except on macOS
+        'peak_rss': usage.ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+    })
+    if os.WIFSIGNALED(status):
+        # Die of the same signal, so the supervisor sees the crash or stop
+        signum = os.WTERMSIG(status)
+        resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+        try:
+            signal.signal(signum, signal.SIG_DFL)
+        except (OSError, ValueError):
+            pass  # SIGKILL cannot be caught, so it is already the default
+        os.kill(os.getpid(), signum)
+        os._exit(128 + signum)
+    os._exit(os.waitstatus_to_exitcode(status))
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
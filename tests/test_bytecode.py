@@ -0,0 +1,27 @@
+import os
+
+from devspace_core import bytecode_stale, compile_python_files
+
+def test_compiled_files_are_fresh_until_the_source_changes(tmp_path):
+    source = tmp_path / 'module.py'
+    source.write_text("x = 1\n")
+    assert bytecode_stale(str(source))
+    assert compile_python_files([str(source)]) == [(str(source), None)]
+    assert not bytecode_stale(str(source))
+    
+    source.write_text("x = 22\n")
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+    assert bytecode_stale(str(source))
+
+def test_errors_are_reported_per_file(tmp_path):
+    good = tmp_path / 'good.py'
+    good.write_text("x = 1\n")
+    bad = tmp_path / 'bad.py'
+    bad.write_text("def broken(:\n")
+    missing = tmp_path / 'missing.py'
+    results = dict(compile_python_files([str(bad), str(good), str(missing)]))
+    assert results[str(good)] is None
+    assert results[str(bad)].startswith("SyntaxError")
+    assert results[str(missing)]
+    assert bytecode_stale(str(bad)) and bytecode_stale(str(missing))
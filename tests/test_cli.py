@@ -0,0 +1,48 @@
+import json
+import os
+
+import pytest
+
+import devspace
+
+@pytest.fixture
+def workspace(tmp_path):
+    project = tmp_path / "Python_Scripts" / "my_script"
+    project.mkdir(parents=True)
+    (project / "main.py").write_text("import json, sys\nprint(json.dumps(sys.argv[1:]))\n")
+    return str(tmp_path)
+
+def run(workspace, capfd, *argv):
+    exit_code = devspace.main(['--workspace', workspace, *argv])
+    return exit_code, json.loads(capfd.readouterr().out.splitlines()[-1])
+
+def test_run_passes_options_after_double_dash(workspace, capfd):
+    # The command line the README documents
+    assert run(workspace, capfd, 'run', 'scripts', 'my_script', '--timeout', '60', '--', '--verbose') == (0, ['--verbose'])
+
+def test_run_passes_positionals_after_timeout(workspace, capfd):
+    assert run(workspace, capfd, 'run', 'scripts', 'my_script', '--timeout', '1', 'x') == (0, ['x'])
+
+def test_run_keeps_arguments_in_order(workspace, capfd):
+    argv = ['run', 'scripts', 'my_script', 'a', '--timeout', '5', 'b', '--', '-c', '--timeout']
+    assert run(workspace, capfd, *argv) == (0, ['a', 'b', '-c', '--timeout'])
+
+def test_run_rejects_unknown_options(workspace, capfd):
+    with pytest.raises(SystemExit) as exit_info:
+        devspace.main(['--workspace', workspace, 'run', 'scripts', 'my_script', '--timout', '5'])
+    assert exit_info.value.code == 2
+    assert "unrecognized arguments: --timout" in capfd.readouterr().err
+
+def test_other_commands_reject_passthrough(workspace, capfd):
+    with pytest.raises(SystemExit):
+        devspace.main(['--workspace', workspace, 'list', '--', 'x'])
+    assert "unrecognized arguments: -- x" in capfd.readouterr().err
+
+def test_run_is_recorded_in_history_and_logs(workspace, capfd):
+    run(workspace, capfd, 'run', 'scripts', 'my_script', 'logged')
+    saved = devspace.Workspace(workspace)
+    [entry] = saved.run_history.project_runs("scripts/my_script")
+    assert entry['state'] == 'finished' and entry['output_chars'] == len('["logged"]\n')
+    [log] = saved.run_logs.project_runs("scripts/my_script")
+    assert log['state'] == 'finished' and log['exit_code'] == 0
+    assert saved.run_logs.read(log).endswith('["logged"]\n')
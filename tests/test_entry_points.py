@@ -0,0 +1,57 @@
+import os
+
+from devspace_core import EntryPointResolver
+
+GUARD = "if __name__ == '__main__':\n    pass\n"
+
+def make_project(tmp_path, files, name='demo'):
+    project = tmp_path / name
+    project.mkdir()
+    for file_name, text in files.items():
+        (project / file_name).write_text(text)
+    return str(project)
+
+def resolver(tmp_path):
+    return EntryPointResolver(str(tmp_path / 'cache' / 'entry_points.json'))
+
+def test_candidates_are_ranked(tmp_path):
+    project = make_project(tmp_path, {
+        'zeta.py': "", 'app.py': "", 'tool.py': GUARD, 'main.py': "", '__main__.py': "",
+        'setup.py': "", '_helper.py': "", 'demo.py': "", 'notes.txt': ""
+    })
+    assert resolver(tmp_path).candidates(project, ('.py',)) == [
+        '__main__.py', 'main.py', 'tool.py', 'app.py', 'demo.py', 'zeta.py', '_helper.py', 'setup.py'
+    ]
+
+def test_earlier_extensions_win(tmp_path):
+    project = make_project(tmp_path, {'main.pyw': "", 'other.py': ""})
+    assert resolver(tmp_path).candidates(project, ('.py', '.pyw')) == ['other.py', 'main.pyw']
+
+def test_override_wins_and_persists(tmp_path):
+    project = make_project(tmp_path, {'main.py': "", 'other.py': ""})
+    entry_points = resolver(tmp_path)
+    assert entry_points.resolve(project, ('.py',)) == os.path.join(project, 'main.py')
+    entry_points.set_override(project, 'other.py')
+    assert entry_points.resolve(project, ('.py',)) == os.path.join(project, 'other.py')
+    assert resolver(tmp_path).resolve(project, ('.py',)) == os.path.join(project, 'other.py')
+    
+    entry_points.set_override(project, None)
+    assert entry_points.resolve(project, ('.py',)) == os.path.join(project, 'main.py')
+
+def test_missing_override_falls_back(tmp_path):
+    project = make_project(tmp_path, {'main.py': ""})
+    entry_points = resolver(tmp_path)
+    entry_points.set_override(project, 'gone.py')
+    assert entry_points.resolve(project, ('.py',)) == os.path.join(project, 'main.py')
+
+def test_cache_follows_the_folder(tmp_path):
+    project = make_project(tmp_path, {'zeta.py': ""})
+    entry_points = resolver(tmp_path)
+    assert entry_points.resolve(project, ('.py',)) == os.path.join(project, 'zeta.py')
+    (tmp_path / 'demo' / 'main.py').write_text("")
+    os.utime(project, ns=(0, os.stat(project).st_mtime_ns + 10 ** 9))
+    assert entry_points.resolve(project, ('.py',)) == os.path.join(project, 'main.py')
+
+def test_nothing_to_run(tmp_path):
+    assert resolver(tmp_path).resolve(make_project(tmp_path, {'notes.txt': ""}), ('.py',)) is None
+    assert resolver(tmp_path).resolve(str(tmp_path / 'missing'), ('.py',)) is None
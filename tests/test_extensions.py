@@ -0,0 +1,101 @@
+import json
+import zipfile
+
+import pytest
+
+from devspace_core import ExtensionPackager, validate_extension_manifest
+
+def make_extension(path, manifest, files=()):
+    path.mkdir(exist_ok=True)
+    (path / 'manifest.json').write_text(json.dumps(manifest))
+    for name in files:
+        (path / name).parent.mkdir(parents=True, exist_ok=True)
+        (path / name).write_bytes(b"content of " + name.encode())
+    return str(path)
+
+MANIFEST = {
+    'manifest_version': 3, 'name': "Demo", 'version': "1.0.2",
+    'icons': {'128': "icons/icon128.png"},
+    'action': {'default_popup': "popup.html"},
+    'background': {'service_worker': "background.js"},
+}
+
+def errors(problems):
+    return [message for level, message in problems if level == 'error']
+
+def test_valid_manifest(tmp_path):
+    extension = make_extension(tmp_path / 'demo', MANIFEST, ['icons/icon128.png', 'popup.html', 'background.js'])
+    manifest, problems = validate_extension_manifest(extension)
+    assert manifest['name'] == "Demo" and problems == []
+
+def test_missing_and_unreadable_manifest(tmp_path):
+    assert validate_extension_manifest(str(tmp_path)) == (None, [('error', "manifest.json is missing")])
+    (tmp_path / 'manifest.json').write_text("{")
+    manifest, problems = validate_extension_manifest(str(tmp_path))
+    assert manifest is None and errors(problems)[0].startswith("manifest.json could not be read")
+
+@pytest.mark.parametrize('changes, expected', [
+    ({'manifest_version': 1}, "manifest_version must be 3 (or the deprecated 2)"),
+    ({'name': ""}, "name is required"),
+    ({'version': "1.02"}, "version must be one to four dot-separated integers between 0 and 65535, e.g. 1.0.2"),
+    ({'version': "1.2.3.4.5"}, "version must be one to four dot-separated integers between 0 and 65535, e.g. 1.0.2"),
+    ({'permissions': ["https://*/*"]}, "Host patterns belong in host_permissions in manifest_version 3"),
+    ({'background': {'scripts': ["background.js"]}}, "background must use service_worker in manifest_version 3"),
+    ({'options_page': "options.html"}, "options page file not found: options.html"),
+    ({'name': "__MSG_name__"}, "default_locale is required when the extension is localized"),
+    # Malformed fields are reported rather than crashing the validator
+    ({'permissions': 5}, "permissions must be a list"),
+    ({'permissions': [5]}, "permissions must be a list of strings"),
+    ({'icons': {'128': 5}}, "icon 128 must be a file path"),
+    ({'action': {'default_icon': {'16': ["x"]}}}, "action icon 16 must be a file path"),
+    ({'action': "popup.html"}, "action must be an object"),
+    ({'chrome_url_overrides': ["a"]}, "chrome_url_overrides must be an object"),
+    ({'content_scripts': [{'matches': ["<all_urls>"], 'js': "a.js"}]}, "content_scripts[0].js must be a list"),
+    ({'content_scripts': [{'js': ["a.js"]}]}, "content_scripts[0] needs matches"),
+    ({'content_scripts': {'js': ["a.js"]}}, "content_scripts must be a list"),
+    ({'background': "background.js"}, "background must be an object"),
+    ({'web_accessible_resources': [{'resources': "a.js"}]}, "web_accessible_resources[0].resources must be a list"),
+    ({'options_page': 1}, "options page must be a file path"),
+    ({'default_locale': ["en"]}, "default_locale must be a string"),
+])
+def test_manifest_errors(tmp_path, changes, expected):
+    extension = make_extension(tmp_path / 'demo', dict(MANIFEST, **changes),
+                               ['icons/icon128.png', 'popup.html', 'background.js'])
+    problems = errors(validate_extension_manifest(extension)[1])
+    assert expected in problems
+    # A string is not walked one character at a time
+    assert not any(problem.endswith("file not found: a") for problem in problems)
+
+def test_manifest_version_2_is_a_warning(tmp_path):
+    manifest = dict(MANIFEST, manifest_version=2, background={'scripts': ["background.js"]})
+    extension = make_extension(tmp_path / 'demo', manifest, ['icons/icon128.png', 'popup.html', 'background.js'])
+    [(level, message)] = validate_extension_manifest(extension)[1]
+    assert level == 'warning' and "deprecated" in message
+
+def test_package_layout(tmp_path):
+    extension = make_extension(tmp_path / 'demo', MANIFEST, [
+        'icons/icon128.png', 'popup.html', 'background.js', 'key.pem', '.hidden', 'node_modules/x.js'
+    ])
+    zip_path = str(tmp_path / 'out' / 'demo.zip')
+    stats = ExtensionPackager(str(tmp_path / 'cache')).build(extension, zip_path)
+    
+    with zipfile.ZipFile(zip_path) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == ['background.js', 'manifest.json', 'popup.html', 'icons/icon128.png']
+        assert archive.read('popup.html') == b"content of popup.html"
+        assert archive.getinfo('icons/icon128.png').compress_type == zipfile.ZIP_STORED
+    assert (stats['files'], stats['compressed'], stats['reused']) == (4, 4, 0)
+
+def test_unchanged_files_are_reused(tmp_path):
+    extension = make_extension(tmp_path / 'demo', MANIFEST, ['icons/icon128.png', 'popup.html', 'background.js'])
+    cache = str(tmp_path / 'cache')
+    zip_path = str(tmp_path / 'demo.zip')
+    ExtensionPackager(cache).build(extension, zip_path)
+    
+    (tmp_path / 'demo' / 'popup.html').write_text("<p>changed</p>" * 100)
+    stats = ExtensionPackager(cache).build(extension, zip_path)
+    assert (stats['compressed'], stats['reused']) == (1, 3)
+    with zipfile.ZipFile(zip_path) as archive:
+        assert archive.testzip() is None
+        assert archive.read('popup.html') == b"<p>changed</p>" * 100
+        assert archive.getinfo('popup.html').compress_type == zipfile.ZIP_DEFLATED
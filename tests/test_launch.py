@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+from devspace_core import build_launch_command
+
+def test_python_runs_unbuffered_with_the_given_interpreter():
+    assert build_launch_command('python', 'main.py', '/env/bin/python') == ['/env/bin/python', '-u', 'main.py']
+
+@pytest.mark.skipif(os.name == 'nt', reason="POSIX shells")
+def test_scripts_on_posix():
+    assert build_launch_command('batch', 'run.sh') == ['sh', 'run.sh']
+    assert build_launch_command('powershell', 'run.ps1') == ['pwsh', '-NoProfile', '-File', 'run.ps1']
+
+@pytest.mark.skipif(os.name != 'nt', reason="Windows shells")
+def test_scripts_on_windows():
+    assert build_launch_command('batch', 'run.bat') == ['cmd', '/c', 'run.bat']
+    assert build_launch_command('powershell', 'run.ps1')[-2:] == ['-File', 'run.ps1']
+
+def test_unknown_kind():
+    with pytest.raises(ValueError):
+        build_launch_command('ruby', 'main.rb')
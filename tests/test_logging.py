@@ -0,0 +1,46 @@
+import logging
+
+import pytest
+
+from devspace_core import LOG_ENV, LOG_ROOT, configure_logging, get_logger, parse_log_levels
+
+@pytest.fixture(autouse=True)
+def restore_logging():
+    yield
+    configure_logging('')
+    for subsystem in ('run', 'tests_subsystem'):
+        get_logger(subsystem).setLevel(logging.NOTSET)
+
+def test_parse_log_levels():
+    assert parse_log_levels('') == {}
+    assert parse_log_levels('info, run=debug,,watch=ERROR') == {
+        '': logging.INFO, 'run': logging.DEBUG, 'watch': logging.ERROR
+    }
+    with pytest.raises(ValueError, match="Unknown log level: loud"):
+        parse_log_levels('run=loud')
+
+def test_levels_apply_per_subsystem():
+    configure_logging('error,run=debug')
+    assert logging.getLogger(LOG_ROOT).level == logging.ERROR
+    assert get_logger('run').isEnabledFor(logging.DEBUG)
+    assert not get_logger('tests_subsystem').isEnabledFor(logging.WARNING)
+
+def test_defaults_to_warnings(monkeypatch):
+    monkeypatch.delenv(LOG_ENV, raising=False)
+    configure_logging()
+    assert get_logger('tests_subsystem').isEnabledFor(logging.WARNING)
+    assert not get_logger('tests_subsystem').isEnabledFor(logging.INFO)
+
+def test_bad_environment_setting_is_ignored(monkeypatch, capsys):
+    monkeypatch.setenv(LOG_ENV, 'verbose')
+    configure_logging()
+    assert logging.getLogger(LOG_ROOT).level == logging.WARNING
+    assert "Ignoring DEVSPACE_LOG: Unknown log level: verbose" in capsys.readouterr().err
+
+def test_log_file(tmp_path):
+    log_file = tmp_path / 'logs' / 'devspace.log'
+    configure_logging('info', str(log_file))
+    get_logger('tests_subsystem').info("written %d", 1)
+    get_logger('tests_subsystem').debug("not written")
+    configure_logging('')  # Closes the file
+    assert log_file.read_text(encoding='utf-8').rstrip().endswith("INFO devspace.tests_subsystem: written 1")
@@ -0,0 +1,33 @@
+from devspace_core import OutputRingBuffer
+
+def test_keeps_the_newest_text_within_budget():
+    buffer = OutputRingBuffer(max_chars=10)
+    buffer.append('stdout', "abcdef")
+    buffer.append('stderr', "ghijkl")
+    assert buffer.text() == "cdefghijkl"
+    assert list(buffer.chunks) == [('stdout', "cdef"), ('stderr', "ghijkl")]
+    assert (buffer.size, buffer.dropped, buffer.total_chars) == (10, 2, 12)
+
+def test_oversized_chunk_keeps_its_tail():
+    buffer = OutputRingBuffer(max_chars=4)
+    buffer.append('stdout', "0123456789")
+    assert buffer.text() == "6789" and buffer.dropped == 6
+
+def test_pending_chunks_are_taken_once():
+    buffer = OutputRingBuffer(max_chars=100)
+    buffer.append('stdout', "one")
+    buffer.append('stderr', "")
+    buffer.append('stderr', "two")
+    assert buffer.has_pending
+    assert buffer.take_pending() == ([('stdout', "one"), ('stderr', "two")], False)
+    assert not buffer.has_pending
+    assert buffer.take_pending() == ([], False)
+
+def test_falling_a_buffer_behind_asks_for_a_redraw():
+    buffer = OutputRingBuffer(max_chars=5)
+    buffer.append('stdout', "abc")
+    buffer.append('stdout', "def")
+    assert buffer.has_pending
+    assert buffer.take_pending() == ([('stdout', "bc"), ('stdout', "def")], True)
+    buffer.append('stdout', "g")
+    assert buffer.take_pending() == ([('stdout', "g")], False)
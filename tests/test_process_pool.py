@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Stands in for the GUI script, which workers must not import
+MAIN_SCRIPT = textwrap.dedent("""
+    import concurrent.futures
+    import sys
+    
+    if __name__ == '__mp_main__':
+        sys.exit("the parent's script was imported by a worker")
+    
+    from devspace_core import CoreSpawnContext, compile_python_files
+    
+    if __name__ == '__main__':
+        with concurrent.futures.ProcessPoolExecutor(2, mp_context=CoreSpawnContext()) as pool:
+            print(pool.submit(compile_python_files, [sys.argv[1]]).result())
+""")
+
+def test_workers_do_not_import_the_parent_script(tmp_path):
+    script = tmp_path / "app.py"
+    script.write_text(MAIN_SCRIPT)
+    source = tmp_path / "module.py"
+    source.write_text("x = 1\n")
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run([sys.executable, str(script), str(source)], capture_output=True, text=True,
+                            env=env, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == repr([(str(source), None)])
@@ -0,0 +1,64 @@
+import importlib.metadata
+import sys
+
+import pytest
+
+import devspace_core
+from devspace_core import BUILTIN_PROJECT_TYPES, ProjectType, project_types
+
+RUNNER_MODULE = """
+class NodeRunner:
+    def command(self, project_dir, script_path):
+        return ('node', script_path)
+"""
+
+@pytest.fixture
+def runner_module(tmp_path, monkeypatch):
+    (tmp_path / 'devspace_test_runner.py').write_text(RUNNER_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield 'devspace_test_runner'
+    sys.modules.pop('devspace_test_runner', None)
+
+NODE = ProjectType('node', "Node Apps", "Node_Apps", runner='devspace_test_runner:NodeRunner',
+                   entry_extensions=('.js',))
+
+class EntryPoint:
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+    
+    def load(self):
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+@pytest.fixture
+def plugins(monkeypatch):
+    """Replace the installed project type plugins, clearing the registry around the test"""
+    def install(*entry_points):
+        monkeypatch.setattr(importlib.metadata, 'entry_points', lambda group: list(entry_points))
+        devspace_core._project_types.clear()
+        return project_types()
+    yield install
+    devspace_core._project_types.clear()
+
+def test_builtin_types_come_first(plugins):
+    types = plugins()
+    assert list(types) == [project_type.key for project_type in BUILTIN_PROJECT_TYPES]
+    assert [key for key, project_type in types.items() if project_type.python] == ['ubif', 'scripts', 'apps']
+    assert not types['html'].runnable and types['batch'].runnable
+
+def test_plugin_runner_is_imported_on_first_run(runner_module):
+    project_type = ProjectType('node', "Node Apps", "Node_Apps", runner=f'{runner_module}:NodeRunner',
+                               entry_extensions=('.js',))
+    assert project_type.plugin and project_type.runnable
+    assert runner_module not in sys.modules
+    assert project_type.command('/app', '/app/index.js') == ['node', '/app/index.js']
+    assert project_type.load_runner() is project_type.load_runner()
+
+def test_plugins_are_registered_after_builtins(plugins, runner_module):
+    broken = EntryPoint('broken', ImportError("no module"))
+    clash = EntryPoint('clash', ProjectType('scripts', "Scripts", "Scripts"))
+    types = plugins(EntryPoint('node', NODE), broken, clash, EntryPoint('junk', object()))
+    assert list(types)[-1] == 'node' and types['node'] is NODE
+    assert types['scripts'] in BUILTIN_PROJECT_TYPES
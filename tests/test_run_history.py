@@ -0,0 +1,55 @@
+from devspace_core import RunHistory
+
+def finished(wall, peak_rss=1000, **fields):
+    return dict({'time': 0, 'wall': wall, 'peak_rss': peak_rss, 'exit_code': 0, 'state': 'finished',
+                 'setup': False}, **fields)
+
+def test_runs_are_kept_per_project(tmp_path):
+    history = RunHistory(str(tmp_path / 'run_history.jsonl'))
+    history.add('scripts/a', finished(1.0))
+    history.add('scripts/b', finished(2.0))
+    history.add('scripts/a', finished(3.0))
+    
+    reloaded = RunHistory(str(tmp_path / 'run_history.jsonl'))
+    assert [entry['wall'] for entry in reloaded.project_runs('scripts/a')] == [1.0, 3.0]
+    assert reloaded.project_runs('scripts/c') == []
+
+def test_baseline_needs_enough_comparable_runs(tmp_path):
+    history = RunHistory(str(tmp_path / 'run_history.jsonl'))
+    for _ in range(history.MIN_BASELINE_RUNS - 1):
+        history.add('scripts/a', finished(1.0))
+    history.add('scripts/a', finished(9.0, state='crashed'))
+    history.add('scripts/a', finished(9.0, setup=True))
+    history.add('scripts/a', finished(9.0, exit_code=1))
+    assert history.baseline('scripts/a', 'wall') is None
+    history.add('scripts/a', finished(2.0))
+    assert history.baseline('scripts/a', 'wall') == (1.0, history.MIN_BASELINE_RUNS)
+
+def test_slow_and_large_runs_are_flagged(tmp_path):
+    history = RunHistory(str(tmp_path / 'run_history.jsonl'))
+    for _ in range(history.MIN_BASELINE_RUNS):
+        history.add('scripts/a', finished(1.0))
+    assert history.add('scripts/a', finished(2.0))['flags'] == []
+    flags = history.add('scripts/a', finished(4.0, peak_rss=5000))['flags']
+    assert len(flags) == 2 and flags[0].startswith("4.0× slower than")
+    # Environment builds are not compared
+    assert history.add('scripts/a', finished(10.0, setup=True))['flags'] == []
+
+def test_store_is_compacted(tmp_path):
+    path = tmp_path / 'run_history.jsonl'
+    history = RunHistory(str(path))
+    history.MAX_RUNS = 3
+    for i in range(10):
+        history.add('scripts/a', finished(float(i)))
+    assert len(path.read_text().splitlines()) < 10
+    
+    reloaded = RunHistory(str(path))
+    reloaded.MAX_RUNS = 3
+    assert [entry['wall'] for entry in reloaded.project_runs('scripts/a')] == [7.0, 8.0, 9.0]
+
+def test_torn_lines_are_skipped(tmp_path):
+    path = tmp_path / 'run_history.jsonl'
+    RunHistory(str(path)).add('scripts/a', finished(1.0))
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"project": "scripts/a", "wa')
+    assert len(RunHistory(str(path)).project_runs('scripts/a')) == 1
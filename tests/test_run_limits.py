@@ -0,0 +1,83 @@
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+from devspace_core import RunLimits, kill_process_group, limited_command, process_group, read_usage
+
+def test_limits_are_stored_per_project(tmp_path):
+    path = str(tmp_path / 'cache' / 'run_limits.json')
+    limits = RunLimits(path)
+    assert limits.get('project') == {'timeout': 0, 'memory_mb': 0, 'cpu_seconds': 0}
+    limits.set('project', {'timeout': '30', 'memory_mb': 0})
+    assert RunLimits(path).get('project') == {'timeout': 30, 'memory_mb': 0, 'cpu_seconds': 0}
+    
+    limits.set('project', {})
+    assert RunLimits(path).load() == {}
+
+def test_unlimited_commands_are_not_wrapped():
+    assert limited_command(['python', 'main.py']) == ['python', 'main.py']
+
+@pytest.mark.skipif(os.name == 'nt', reason="setrlimit is POSIX only")
+def test_wrapper_applies_limits_and_keeps_the_pid():
+    code = "import os, resource; print(resource.getrlimit(resource.RLIMIT_CPU), os.getpid() == os.getsid(0))"
+    argv = limited_command([sys.executable, '-c', code], cpu_seconds=7, new_session=True)
+    process = subprocess.Popen(argv, stdout=subprocess.PIPE, text=True)
+    output = process.communicate(timeout=30)[0]
+    assert output.strip() == "(7, 9) True"
+
+@pytest.mark.skipif(os.name == 'nt', reason="the launch wrapper is POSIX only")
+def test_wrapper_reports_exact_usage(tmp_path):
+    usage_path = str(tmp_path / 'usage.json')
+    code = (
+        "import sys, time\n"
+        "start = time.process_time()\n"
+        "while time.process_time() - start < 0.3: pass\n"
+        "data = bytearray(64 * 1024 * 1024)\n"
+        "data[::4096] = b'x' * len(data[::4096])\n"
+        "sys.exit(3)\n"
+    )
+    process = subprocess.run(limited_command([sys.executable, '-c', code], usage_path=usage_path), timeout=30)
+    assert process.returncode == 3
+    usage = read_usage(usage_path)
+    assert 0.3 <= usage['cpu'] < 5
+    assert 64 * 1024 * 1024 <= usage['peak_rss'] < 200 * 1024 * 1024
+
+@pytest.mark.skipif(os.name == 'nt', reason="the launch wrapper is POSIX only")
+def test_wrapper_dies_of_the_command_signal(tmp_path):
+    usage_path = str(tmp_path / 'usage.json')
+    code = "import os, signal; os.kill(os.getpid(), signal.SIGTERM)"
+    process = subprocess.run(limited_command([sys.executable, '-c', code], usage_path=usage_path), timeout=30)
+    assert process.returncode == -signal.SIGTERM
+    assert 'cpu' in read_usage(usage_path)
+
+@pytest.mark.skipif(sys.platform != 'linux', reason="reads process states from /proc")
+def test_leftover_process_group_is_killed():
+    # The leader exits at once, leaving a child in its group
+    code = (
+        "import subprocess, sys\n"
+        "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'], stdout=subprocess.DEVNULL)\n"
+        "print(child.pid)\n"
+    )
+    leader = subprocess.Popen([sys.executable, '-c', code], stdout=subprocess.PIPE, text=True,
+                              start_new_session=True)
+    pgid = process_group(leader.pid)
+    child_pid = int(leader.communicate(timeout=30)[0])
+    assert pgid == leader.pid and process_group(leader.pid) is None
+    
+    kill_process_group(pgid)
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            with open(f'/proc/{child_pid}/stat') as f:
+                if f.read().rsplit(')', 1)[1].split()[0] == 'Z':
+                    break  # Killed, waiting for init to reap it
+        except FileNotFoundError:
+            break
+        time.sleep(0.05)
+    else:
+        pytest.fail("the group's remaining process was not killed")
+    kill_process_group(pgid)  # Nothing left is fine
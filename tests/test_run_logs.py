@@ -0,0 +1,96 @@
+import gzip
+import os
+import time
+
+from devspace_core import RunLogStore
+
+def run(store, project, chunks, state='finished', exit_code=0, start_time=None):
+    log_id = store.open(project, start_time or time.time(), "python main.py")
+    for chunk in chunks:
+        store.write(log_id, chunk)
+    store.close(log_id, state, exit_code)
+    return log_id
+
+def test_log_is_saved_compressed_and_indexed(tmp_path):
+    store = RunLogStore(str(tmp_path))
+    run(store, 'scripts/demo', ["hello\n", "world\n"])
+    store.stop()
+    
+    reloaded = RunLogStore(str(tmp_path))
+    [entry] = reloaded.project_runs('scripts/demo')
+    assert entry['state'] == 'finished' and entry['exit_code'] == 0
+    assert all(segment.endswith('.gz') for segment in entry['segments'])
+    text = reloaded.read(entry)
+    assert text.startswith("# scripts/demo started ") and text.endswith("hello\nworld\n")
+    assert reloaded.read(entry, max_chars=6) == "world\n"
+
+def test_log_rotates_into_segments(tmp_path):
+    store = RunLogStore(str(tmp_path))
+    store.SEGMENT_BYTES = 10
+    run(store, 'scripts/demo', ["0123456789"] * 3)
+    store.stop()
+    
+    [entry] = store.project_runs('scripts/demo')
+    assert len(entry['segments']) == 3
+    with gzip.open(entry['segments'][-1], 'rt', encoding='utf-8') as f:
+        assert f.read() == "0123456789"
+    assert store.read(entry).endswith("0123456789" * 3)
+
+def test_prune_keeps_newest_runs_per_project(tmp_path):
+    store = RunLogStore(str(tmp_path))
+    store.MAX_RUNS = 2
+    now = time.time()
+    for offset in range(4):
+        run(store, 'scripts/demo', [f"run {offset}\n"], start_time=now + offset)
+    run(store, 'scripts/other', ["other\n"], start_time=now)
+    store.stop()
+    
+    runs = RunLogStore(str(tmp_path)).project_runs('scripts/demo')
+    assert [store.read(entry, max_chars=6) for entry in runs] == ["run 2\n", "run 3\n"]
+    assert len(store.project_runs('scripts/other')) == 1
+    assert len(os.listdir(tmp_path / 'scripts_demo')) == 2
+
+def test_prune_removes_old_runs(tmp_path):
+    store = RunLogStore(str(tmp_path))
+    run(store, 'scripts/demo', ["old\n"], start_time=time.time() - (store.MAX_AGE_DAYS + 1) * 86400)
+    run(store, 'scripts/demo', ["new\n"])
+    store.stop()
+    assert [store.read(entry, max_chars=4) for entry in store.project_runs('scripts/demo')] == ["new\n"]
+
+def test_unfinished_runs_are_interrupted_on_load(tmp_path):
+    store = RunLogStore(str(tmp_path))
+    store.open('scripts/demo', time.time(), "python main.py")
+    store.stop()
+    
+    [entry] = RunLogStore(str(tmp_path)).project_runs('scripts/demo')
+    assert entry['state'] == 'interrupted'
+    assert entry['segments'][0].endswith('.gz')
+
+def test_stop_closes_open_logs(tmp_path):
+    store = RunLogStore(str(tmp_path))
+    store.open('scripts/demo', time.time(), "python main.py")
+    store.stop()
+    
+    [entry] = store.project_runs('scripts/demo')
+    with open(entry['segments'][0], encoding='utf-8') as f:
+        assert f.read().startswith("# scripts/demo started ")
+
+def test_log_that_cannot_be_opened_is_failed(tmp_path):
+    store = RunLogStore(str(tmp_path))
+    start_segment = store.start_segment
+    
+    def failing_start_segment(log):
+        if log['entry']['project'] == 'scripts/broken':
+            raise OSError("disk full")
+        start_segment(log)
+    
+    store.start_segment = failing_start_segment
+    run(store, 'scripts/broken', ["lost\n"])
+    run(store, 'scripts/demo', ["kept\n"])
+    store.stop()
+    
+    reloaded = RunLogStore(str(tmp_path))
+    [failed] = reloaded.project_runs('scripts/broken')
+    [finished] = reloaded.project_runs('scripts/demo')
+    assert failed['state'] == 'failed' and failed['segments'] == []
+    assert finished['state'] == 'finished' and store.read(finished).endswith("kept\n")
@@ -0,0 +1,33 @@
+from devspace_core import check_python_source
+
+def test_clean_source():
+    source = (
+        "import os\n"
+        "from typing import List as List\n"
+        "__all__ = ['exported']\n"
+        "from helpers import exported\n"
+        "def main(args):\n"
+        "    try:\n"
+        "        return os.path.join(*args), __file__, len(args)\n"
+        "    except TypeError as e:\n"
+        "        return e\n"
+    )
+    assert check_python_source(source, 'main.py') == []
+
+def test_unused_imports_and_undefined_names():
+    source = "import os, sys\nfrom json import loads\nprint(sys.argv, missing)\n"
+    assert check_python_source(source, 'main.py') == [
+        (1, 'F401', "'os' imported but unused"),
+        (2, 'F401', "'loads' imported but unused"),
+        (3, 'F821', "undefined name 'missing'"),
+    ]
+
+def test_package_init_may_import_without_using():
+    assert check_python_source("from .core import run\n", 'pkg/__init__.py') == []
+
+def test_star_import_hides_undefined_names():
+    assert check_python_source("from os.path import *\nprint(join)\n", 'main.py') == []
+
+def test_syntax_error():
+    [(lineno, code, message)] = check_python_source("x = 1\ndef broken(:\n", 'main.py')
+    assert (lineno, code) == (2, 'E999') and message.startswith("SyntaxError")
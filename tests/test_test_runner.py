@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import pytest
+
+import devspace_core
+from devspace_core import discover_tests, parse_test_result
+
+UNITTEST_SOURCE = (
+    "import unittest\n"
+    "class CaseTest(unittest.TestCase):\n"
+    "    def test_ok(self):\n"
+    "        self.assertTrue(True)\n"
+)
+PLAIN_SOURCE = "def test_fails():\n    assert 1 == 2\n"
+
+def run_worker(project_dir, framework, test_file):
+    argv = devspace_core.test_worker_command(sys.executable, framework, str(project_dir), test_file)
+    output = subprocess.run(argv, cwd=project_dir, capture_output=True, text=True, timeout=60).stdout
+    # Not splitlines(): it also splits at the marker's record separator
+    return [result for result in map(parse_test_result, output.split('\n')) if result is not None]
+
+@pytest.fixture
+def mixed_project(tmp_path):
+    (tmp_path / 'test_case.py').write_text(UNITTEST_SOURCE)
+    (tmp_path / 'test_plain.py').write_text(PLAIN_SOURCE)
+    (tmp_path / 'test_both.py').write_text(UNITTEST_SOURCE + PLAIN_SOURCE)
+    return tmp_path
+
+def test_framework_is_chosen_per_file(mixed_project):
+    assert discover_tests(mixed_project) == {
+        'test_both.py': 'pytest', 'test_case.py': 'unittest', 'test_plain.py': 'pytest'
+    }
+
+def test_pytest_config_applies_to_every_file(mixed_project):
+    (mixed_project / 'conftest.py').write_text('')
+    assert set(discover_tests(mixed_project).values()) == {'pytest'}
+
+def test_no_test_files(tmp_path):
+    (tmp_path / 'main.py').write_text('')
+    assert discover_tests(tmp_path) == {}
+
+def test_mixed_project_reports_every_test(mixed_project):
+    results = {}
+    for test_file, framework in discover_tests(mixed_project).items():
+        results.update((result['id'], result['outcome']) for result in run_worker(mixed_project, framework, test_file))
+    assert results == {
+        'test_both.py::CaseTest::test_ok': 'passed',
+        'test_both.py::test_fails': 'failed',
+        'test_case.py::test_case.CaseTest.test_ok': 'passed',
+        'test_plain.py::test_fails': 'failed',
+    }
+
+@pytest.mark.parametrize('framework', ['pytest', 'unittest'])
+def test_file_without_tests_is_an_error(tmp_path, framework):
+    (tmp_path / 'test_empty.py').write_text("import unittest\n")
+    [result] = run_worker(tmp_path, framework, 'test_empty.py')
+    assert (result['id'], result['outcome']) == ('test_empty.py', 'error')
+    assert "No tests were collected" in result['message']
@@ -0,0 +1,61 @@
+import atexit
+import json
+import threading
+
+import pytest
+
+from devspace_core import TRACE_ENV, Tracer, trace_path
+
+@pytest.fixture
+def tracer():
+    tracer = Tracer()
+    yield tracer
+    atexit.unregister(tracer.save)
+
+def test_trace_path(monkeypatch):
+    monkeypatch.delenv(TRACE_ENV, raising=False)
+    assert trace_path(['app.py']) is None
+    assert trace_path(['app.py', '--trace']) is None
+    assert trace_path(['app.py', '--trace', 'out.json']) == 'out.json'
+    monkeypatch.setenv(TRACE_ENV, 'env.json')
+    assert trace_path(['app.py']) == 'env.json'
+
+def test_spans_are_free_until_started(tracer):
+    with tracer.span('ignored'):
+        tracer.mark('ignored too')
+    assert not tracer.enabled and tracer.events == []
+
+def test_chrome_trace(tracer, tmp_path):
+    tracer.start(str(tmp_path / 'trace.json'))
+    with tracer.span('outer', project='demo'):
+        with tracer.span('inner'):
+            pass
+        tracer.mark('ready')
+    tracer.save()
+    
+    events = json.loads((tmp_path / 'trace.json').read_text())['traceEvents']
+    thread_names = [event for event in events if event['ph'] == 'M']
+    assert thread_names[0]['args']['name'] == threading.current_thread().name
+    by_name = {event['name']: event for event in events if event['ph'] != 'M'}
+    assert by_name['outer']['ph'] == 'X' and by_name['outer']['args'] == {'project': 'demo'}
+    assert by_name['outer']['ts'] <= by_name['inner']['ts']
+    assert by_name['inner']['ts'] + by_name['inner']['dur'] <= by_name['outer']['ts'] + by_name['outer']['dur']
+    assert by_name['ready']['ph'] == 'i'
+
+def test_speedscope_nests_spans(tracer, tmp_path):
+    tracer.start(str(tmp_path / 'trace.speedscope.json'))
+    with tracer.span('outer'):
+        with tracer.span('inner'):
+            pass
+        with tracer.span('inner'):
+            pass
+    tracer.save()
+    
+    data = json.loads((tmp_path / 'trace.speedscope.json').read_text())
+    assert [frame['name'] for frame in data['shared']['frames']] == ['outer', 'inner']
+    [profile] = data['profiles']
+    assert [(event['type'], event['frame']) for event in profile['events']] == [
+        ('O', 0), ('O', 1), ('C', 1), ('O', 1), ('C', 1), ('C', 0)
+    ]
+    times = [event['at'] for event in profile['events']]
+    assert times == sorted(times)